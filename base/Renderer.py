@@ -4,6 +4,7 @@ from PySide6.QtCore import QSize
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QImage
 from PySide6.QtQuick import QQuickWindow
+from opengl import shaderLibrary
 from pathlib import Path
 import inspect
 
@@ -17,6 +18,8 @@ class Renderer(QObject):
         self.__initd = False
         self.__resized = False
         self.__visible = False
+        self.__pending = []
+        self.__readied = False
 
     def __del__(self):
         if self.__initd:
@@ -62,12 +65,18 @@ class Renderer(QObject):
     def _paint(self):
         pass
 
+    def _ready(self):
+        pass
+
     def _resize(self):
         pass
 
-    def _shader(self,fileName:str):
+    def _shader(self,fileName:str,defines:dict = None):
         with open(Path(inspect.getfile(self.__class__)).resolve().parent/fileName,"r") as file:
-            return file.read()
+            return shaderLibrary().preprocess(file.read(),defines)
+
+    def _waitFor(self,*programs) -> None:
+        self.__pending.extend(programs)
 
     def __init(self):
         if not self.__initd:
@@ -80,6 +89,14 @@ class Renderer(QObject):
         if not self.__visible:
             return
         self.__window.beginExternalCommands()
+        if not self.__readied:
+            self.__pending = [p for p in self.__pending if not p.isReady()]
+            if self.__pending:
+                self.__window.endExternalCommands()
+                self.__window.update()
+                return
+            self._ready()
+            self.__readied = True
         glViewport(0,0,self.__viewPortSize.width(),self.__viewPortSize.height())
         if self.__resized:
             self._resize()
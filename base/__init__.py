@@ -1,2 +1,3 @@
 from base.Renderer import Renderer
+from base.cube import CUBE_VERTICES
 from base.item import Item
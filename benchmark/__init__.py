@@ -0,0 +1 @@
+from benchmark.context import Context
@@ -0,0 +1,30 @@
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtGui import QOffscreenSurface
+from PySide6.QtGui import QOpenGLContext
+from PySide6.QtGui import QSurfaceFormat
+import sys
+
+
+class Context:
+
+    def __init__(self):
+        self.__app = QGuiApplication.instance() or QGuiApplication(sys.argv)
+        format = QSurfaceFormat()
+        format.setVersion(4,5)
+        format.setProfile(QSurfaceFormat.CoreProfile)
+        self.__context = QOpenGLContext()
+        self.__context.setFormat(format)
+        if not self.__context.create():
+            raise RuntimeError
+        self.__surface = QOffscreenSurface()
+        self.__surface.setFormat(format)
+        self.__surface.create()
+
+    def __enter__(self):
+        if not self.__context.makeCurrent(self.__surface):
+            raise RuntimeError
+        return self
+
+    def __exit__(self,type,value,tb):
+        self.__context.doneCurrent()
+        return False
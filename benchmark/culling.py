@@ -0,0 +1,53 @@
+from PySide6.QtGui import QMatrix4x4
+from opengl.culling import Bvh
+from opengl.culling import cullBoxes
+from opengl.culling import frustumPlanes
+from opengl.culling import spheresToBoxes
+from time import perf_counter
+import numpy
+
+FRAME_COUNT = 20
+OBJECT_COUNTS = (10000,100000,1000000)
+MOVING_FRACTION = 0.01
+
+
+def viewProjection() -> QMatrix4x4:
+    ret = QMatrix4x4()
+    ret.perspective(45,16/9,0.1,100)
+    ret.translate(0,0,-3)
+    ret.rotate(30,-1,0,0)
+    return ret
+
+
+def timed(function) -> float:
+    start = perf_counter()
+    for i in range(FRAME_COUNT):
+        function()
+    return 1000*(perf_counter()-start)/FRAME_COUNT
+
+
+def main():
+    random = numpy.random.default_rng(0)
+    matrix = viewProjection()
+    planes = frustumPlanes(matrix)
+    for count in OBJECT_COUNTS:
+        spheres = numpy.empty((count,4),numpy.float32)
+        spheres[:,:3] = random.uniform(-200,200,(count,3))
+        spheres[:,3] = random.uniform(0.1,2,count)
+        (minimum,maximum) = spheresToBoxes(spheres)
+        start = perf_counter()
+        bvh = Bvh(minimum,maximum)
+        build = 1000*(perf_counter()-start)
+        moving = random.choice(count,int(count*MOVING_FRACTION),replace=False)
+        print(
+            f"{count:>10} objects"
+            f"{len(bvh.cull(matrix)):>10} visible"
+            f"{build:>10.1f} ms build"
+            f"{timed(lambda: bvh.refit(minimum[moving],maximum[moving],moving)):>10.2f} ms refit"
+            f"{timed(lambda: bvh.cull(planes)):>10.2f} ms bvh"
+            f"{timed(lambda: cullBoxes(planes,minimum,maximum)):>10.2f} ms brute"
+            )
+
+
+if __name__ == "__main__":
+    main()
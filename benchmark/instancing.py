@@ -0,0 +1,74 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import glFinish
+from benchmark import Context
+from opengl import Buffer
+from opengl import InstanceStream
+from time import perf_counter
+import numpy
+
+FRAME_COUNT = 100
+INSTANCE_COUNTS = (1024,64*1024,1024*1024)
+INSTANCE = numpy.dtype([
+    ("offset",numpy.float32,(2,))
+    ,("scale",numpy.float32)
+])
+
+
+class Scene:
+
+    def __init__(self,count:int):
+        random = numpy.random.default_rng(0)
+        self.centers = random.uniform(-1,1,(count,2)).astype(numpy.float32)
+        self.radii = random.uniform(0,0.25,count).astype(numpy.float32)
+        self.speeds = random.uniform(-2,2,count).astype(numpy.float32)
+        self.scales = random.uniform(0.002,0.01,count).astype(numpy.float32)
+
+    def update(self,stream:InstanceStream,time:float) -> None:
+        angles = self.speeds*numpy.float32(time)
+        offsets = numpy.empty_like(self.centers)
+        offsets[:,0] = self.centers[:,0]+self.radii*numpy.cos(angles)
+        offsets[:,1] = self.centers[:,1]+self.radii*numpy.sin(angles)
+        visible = (numpy.abs(offsets) <= 1+self.scales[:,None]).all(axis=1)
+        instances = stream.resize(int(numpy.count_nonzero(visible)))
+        instances["offset"] = offsets[visible]
+        instances["scale"] = self.scales[visible]
+
+
+def bufferFrame(scene:Scene,stream:InstanceStream,buffer:Buffer,time:float) -> None:
+    scene.update(stream,time)
+    buffer.write(0,stream.array())
+
+
+def streamingFrame(scene:Scene,stream:InstanceStream,time:float) -> None:
+    scene.update(stream,time)
+    with stream:
+        pass
+
+
+def run(name:str,count:int,frame) -> None:
+    glFinish()
+    start = perf_counter()
+    for i in range(FRAME_COUNT):
+        frame(i/60)
+    glFinish()
+    elapsed = perf_counter()-start
+    print(
+        f"{name:<12}{count:>10} instances"
+        f"{1000*elapsed/FRAME_COUNT:>10.3f} ms/frame"
+        )
+
+
+def main():
+    with Context():
+        for count in INSTANCE_COUNTS:
+            scene = Scene(count)
+            stream = InstanceStream(INSTANCE,count)
+            buffer = Buffer(count*INSTANCE.itemsize,GL_DYNAMIC_DRAW)
+            run("write()",count,lambda time: bufferFrame(scene,stream,buffer,time))
+            run("streaming",count,lambda time: streamingFrame(scene,stream,time))
+            del buffer
+            del stream
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+from opengl.optimize import cacheStatistics
+from opengl.optimize import optimizeMesh
+from time import perf_counter
+import numpy
+
+GRID_SIZES = (64,256,512)
+
+
+def grid(size:int) -> tuple:
+    (y,x) = numpy.mgrid[0:size+1,0:size+1]
+    vertices = numpy.stack((x.ravel(),y.ravel(),numpy.sin(0.1*x.ravel())),1).astype(numpy.float32)
+    quads = (y[:-1,:-1]*(size+1)+x[:-1,:-1]).ravel()
+    triangles = numpy.stack((quads,quads+1,quads+size+1,quads+1,quads+size+2,quads+size+1),1).reshape(-1,3)
+    triangles = triangles[numpy.random.default_rng(0).permutation(len(triangles))]
+    return (vertices,triangles.ravel())
+
+
+def report(name:str,indices,vertexCount:int) -> None:
+    (acmr,atvr) = cacheStatistics(indices,vertexCount)
+    print(f"{name:<12}{acmr:>10.3f} ACMR{atvr:>10.3f} ATVR")
+
+
+def main():
+    for size in GRID_SIZES:
+        (vertices,indices) = grid(size)
+        print(f"{len(indices)//3} triangles")
+        report("shuffled",indices,len(vertices))
+        start = perf_counter()
+        (vertices,indices) = optimizeMesh(vertices,3,indices)
+        elapsed = perf_counter()-start
+        report("optimized",indices,len(vertices))
+        print(f"{'':<12}{1000*elapsed:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from OpenGL.GL import GL_COMPUTE_SHADER
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import GL_SHADER_STORAGE_BARRIER_BIT
+from OpenGL.GL import glDispatchCompute
+from OpenGL.GL import glFinish
+from OpenGL.GL import glMemoryBarrier
+from benchmark import Context
+from ctypes import c_float
+from opengl import Buffer
+from opengl import Program
+from opengl import Shader
+from opengl import StreamingBuffer
+from time import perf_counter
+
+FRAME_COUNT = 200
+SIZES = (64*1024,1024*1024,16*1024*1024)
+
+
+def bufferFrame(buffer:Buffer,data,program:Program):
+    buffer.write(0,data)
+    buffer.bindToShaderStorage(0)
+    with program:
+        glDispatchCompute(1,1,1)
+    glMemoryBarrier(GL_SHADER_STORAGE_BARRIER_BIT)
+
+
+def streamingFrame(buffer:StreamingBuffer,data,program:Program):
+    with buffer as stream:
+        stream.write(0,data)
+        stream.bindToShaderStorage(0)
+        with program:
+            glDispatchCompute(1,1,1)
+        glMemoryBarrier(GL_SHADER_STORAGE_BARRIER_BIT)
+
+
+def run(name:str,size:int,frame) -> None:
+    glFinish()
+    start = perf_counter()
+    for i in range(FRAME_COUNT):
+        frame()
+    glFinish()
+    elapsed = perf_counter()-start
+    print(
+        f"{name:<12}{size//1024:>10} KiB"
+        f"{size*FRAME_COUNT/elapsed/1e6:>12.1f} MB/s"
+        f"{1000*elapsed/FRAME_COUNT:>10.3f} ms/frame"
+        )
+
+
+def main():
+    with Context():
+        program = Program(Shader(_computeShaderSrc,GL_COMPUTE_SHADER))
+        output = Buffer(4,GL_DYNAMIC_DRAW)
+        output.bindToShaderStorage(1)
+        with program as p:
+            p.ssbo.InBuffer.setBlockBinding(0)
+            p.ssbo.OutBuffer.setBlockBinding(1)
+        for size in SIZES:
+            data = (c_float*(size//4))()
+            buffer = Buffer(size,GL_DYNAMIC_DRAW)
+            stream = StreamingBuffer(size)
+            run("write()",size,lambda: bufferFrame(buffer,data,program))
+            run("streaming",size,lambda: streamingFrame(stream,data,program))
+            del stream
+            del buffer
+        del output
+        del program
+
+
+_computeShaderSrc = """#version 450 core
+
+layout (local_size_x=1,local_size_y=1,local_size_z=1) in;
+
+layout(std430) buffer InBuffer {
+    float values[];
+};
+
+layout(std430) buffer OutBuffer {
+    float total;
+};
+
+void main()
+{
+    total += values[0]+values[values.length()-1];
+}
+"""
+
+
+if __name__ == "__main__":
+    main()
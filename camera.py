@@ -15,10 +15,9 @@ from PySide6.QtCore import QTimerEvent
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QMatrix4x4
 from PySide6.QtGui import QMouseEvent
-from opengl import Program
-from opengl import Shader
+from opengl import meshRegistry
+from opengl import programRegistry
 from opengl import Texture2D
-from opengl import VertexArray
 import base
 
 
@@ -134,9 +133,9 @@ class Renderer(base.Renderer):
         glClear(GL_DEPTH_BUFFER_BIT)
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = programRegistry().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
 
     def __initTexture(self):
@@ -155,51 +154,13 @@ class Renderer(base.Renderer):
             self.__projectionUniform = program.uniform.projection
 
     def __initVertices(self):
-        vertices = (
-            -0.5,-0.5,-0.5,0,0
-            ,0.5,-0.5,-0.5,1,0
-            ,0.5,0.5,-0.5,1,1
-            ,0.5,0.5,-0.5,1,1
-            ,-0.5,0.5,-0.5,0,1
-            ,-0.5,-0.5,-0.5,0,0
-            ,-0.5,-0.5,0.5,0,0
-            ,0.5,-0.5,0.5,1,0
-            ,0.5,0.5,0.5,1,1
-            ,0.5,0.5,0.5,1,1
-            ,-0.5,0.5,0.5,0,1
-            ,-0.5,-0.5,0.5,0,0
-            ,-0.5,0.5,0.5,1,0
-            ,-0.5,0.5,-0.5,1,1
-            ,-0.5,-0.5,-0.5,0,1
-            ,-0.5,-0.5,-0.5,0,1
-            ,-0.5,-0.5,0.5,0,0
-            ,-0.5,0.5,0.5,1,0
-            ,0.5,0.5,0.5,1,0
-            ,0.5,0.5,-0.5,1,1
-            ,0.5,-0.5,-0.5,0,1
-            ,0.5,-0.5,-0.5,0,1
-            ,0.5,-0.5,0.5,0,0
-            ,0.5,0.5,0.5,1,0
-            ,-0.5,-0.5,-0.5,0,1
-            ,0.5,-0.5,-0.5,1,1
-            ,0.5,-0.5,0.5,1,0
-            ,0.5,-0.5,0.5,1,0
-            ,-0.5,-0.5,0.5,0,0
-            ,-0.5,-0.5,-0.5,0,1
-            ,-0.5,0.5,-0.5,0,1
-            ,0.5,0.5,-0.5,1,1
-            ,0.5,0.5,0.5,1,0
-            ,0.5,0.5,0.5,1,0
-            ,-0.5,0.5,0.5,0,0
-            ,-0.5,0.5,-0.5,0,1
-        )
         with self.__program as program:
-            self.__vao = VertexArray.fromFloats(
-                vertices
+            self.__vao = meshRegistry().acquire(
+                base.CUBE_VERTICES
                 ,GL_TRIANGLES
                 ,(
-                    (program.position,3,GL_FLOAT,20,0)
-                    ,(program.texturePoint,2,GL_FLOAT,20,12)
+                    (program.position,3,GL_FLOAT,32,0)
+                    ,(program.texturePoint,2,GL_FLOAT,32,12)
                     )
                 )
 
@@ -13,18 +13,16 @@ from OpenGL.GL import glViewport
 from PySide6.QtCore import QObject
 from PySide6.QtCore import QTimerEvent
 from PySide6.QtGui import QMatrix4x4
-from ctypes import Structure as cStructure
-from ctypes import c_char
-from ctypes import c_float
-from ctypes import c_uint
 from opengl import Buffer
-from opengl import Program
-from opengl import Shader
+from opengl import programRegistry
+from opengl import shaderLibrary
 from opengl import VertexArray
-from random import uniform as randUniform
 import base
+import numpy
 
 PARTICLE_SIZE = 5000
+RADIUS_BOUNDARY = 900.0
+TIME_STEP = 5e-5
 VIEWSIZE = 1000
 
 
@@ -41,25 +39,6 @@ class Item(base.Item):
         return Renderer()
 
 
-class Particle(cStructure):
-    _fields_ = [
-        ("position",c_float*2)
-        ,("velocity",c_float*2)
-        ,("mass",c_float)
-        ,("charge",c_float)
-    ]
-    _pack_ = 1
-
-
-class Particles(cStructure):
-    _fields_ = [
-        ("size",c_uint)
-        ,("p0",c_char*4)
-        ,("p",Particle*PARTICLE_SIZE)
-    ]
-    _pack_ = 1
-
-
 class Renderer(base.Renderer):
 
     def __init__(self):
@@ -84,7 +63,7 @@ class Renderer(base.Renderer):
         self.__particlesSSBOs[self.__bufferIndex].bindToShaderStorage(0)
         self.__particlesSSBOs[outBufferIndex].bindToShaderStorage(1)
         with self.__compute:
-            glDispatchCompute(self.__particles.size,1,1)
+            glDispatchCompute(PARTICLE_SIZE,1,1)
         with self.__program:
             with self.__vao as vao:
                 if self.__projection is None:
@@ -101,21 +80,26 @@ class Renderer(base.Renderer):
         self.__projection = None
 
     def __initCompute(self):
-        self.__compute = Program(Shader(_computeShaderSrc,GL_COMPUTE_SHADER))
+        self.__compute = shaderLibrary().acquire(
+            (_computeShaderSrc,GL_COMPUTE_SHADER)
+            ,defines={"TIME_STEP":TIME_STEP,"RADIUS_BOUNDARY":RADIUS_BOUNDARY}
+            )
 
     def __initParticles(self):
-        self.__particles = Particles()
-        self.__particles.size = PARTICLE_SIZE
+        with self.__compute as program:
+            layout = program.ssbo.InParticleBuffer.layout()
         a = self.aspectRatio()
-        for i in range(self.__particles.size):
-            self.__particles.p[i].position = (randUniform(-100*a,100*a),randUniform(-100,100))
-            self.__particles.p[i].velocity = (0,0)
-            self.__particles.p[i].mass = randUniform(0.1,1)
-            self.__particles.p[i].charge = randUniform(-1,1)
+        particles = numpy.zeros(PARTICLE_SIZE,layout.elementDtype())
+        particles["position"][:,0] = numpy.random.uniform(-100*a,100*a,PARTICLE_SIZE)
+        particles["position"][:,1] = numpy.random.uniform(-100,100,PARTICLE_SIZE)
+        particles["mass"] = numpy.random.uniform(0.1,1,PARTICLE_SIZE)
+        particles["charge"] = numpy.random.uniform(-1,1,PARTICLE_SIZE)
+        data = layout.pack(particles,inSize=PARTICLE_SIZE)
         self.__particlesSSBOs = [
-            Buffer.fromData(self.__particles,GL_DYNAMIC_COPY)
-            ,Buffer.fromData(self.__particles,GL_DYNAMIC_COPY)
+            Buffer.fromData(data,GL_DYNAMIC_COPY)
+            ,Buffer(data.nbytes,GL_DYNAMIC_COPY)
         ]
+        self.__particlesSSBOs[0].copyTo(self.__particlesSSBOs[1])
         with self.__program as program:
             program.ssbo.ParticleBuffer.setBlockBinding(0)
         with self.__compute as program:
@@ -123,16 +107,16 @@ class Renderer(base.Renderer):
             program.ssbo.OutParticleBuffer.setBlockBinding(1)
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = programRegistry().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
         with self.__program as program:
             self.__projectionUniform = program.uniform.projection
 
     def __initVAO(self):
         with self.__program:
-            self.__vao = VertexArray(GL_POINTS,self.__particles.size)
+            self.__vao = VertexArray(GL_POINTS,PARTICLE_SIZE)
             with self.__vao:
                 pass
 
@@ -188,8 +172,6 @@ void main()
 _computeShaderSrc = """#version 450 core
 
 const float PI = 3.14159265358979323846;
-const float dt = 5e-5;
-const float RADIUS_BOUNDARY = 900.0;
 const float BOUNCE_VELOCITY = 100000.0;
 
 layout (local_size_x=1,local_size_y=1,local_size_z=1) in;
@@ -271,8 +253,8 @@ vec2 lorentz(Particle p, vec3 B)
 
 void move(uint self, vec2 force)
 {
-    outParticles[self].velocity = inParticles[self].velocity+(dt*force/inParticles[self].mass);
-    outParticles[self].position = inParticles[self].position+(outParticles[self].velocity*dt);
+    outParticles[self].velocity = inParticles[self].velocity+(TIME_STEP*force/inParticles[self].mass);
+    outParticles[self].position = inParticles[self].position+(outParticles[self].velocity*TIME_STEP);
     outParticles[self].mass = inParticles[self].mass;
     outParticles[self].charge = inParticles[self].charge;
     if (distance(outParticles[self].position,vec2(0.0)) > RADIUS_BOUNDARY)
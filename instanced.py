@@ -1,21 +1,36 @@
-from OpenGL.GL import GL_ARRAY_BUFFER
 from OpenGL.GL import GL_DEPTH_BUFFER_BIT
 from OpenGL.GL import GL_FLOAT
 from OpenGL.GL import GL_FRAGMENT_SHADER
-from OpenGL.GL import GL_STATIC_DRAW
 from OpenGL.GL import GL_TRIANGLES
 from OpenGL.GL import GL_VERTEX_SHADER
 from OpenGL.GL import glClear
 from OpenGL.GL import glViewport
-from opengl import Buffer
-from opengl import Program
-from opengl import Shader
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QTimerEvent
+from opengl import InstanceStream
+from opengl import programRegistry
 from opengl import VertexArray
+from time import perf_counter
 import base
+import numpy
+
+INSTANCE = numpy.dtype([
+    ("offset",numpy.float32,(2,))
+    ,("scale",numpy.float32)
+])
+CENTERS = numpy.array(((-0.5,-0.5),(0.5,-0.5),(0,0.5),(0,-0.15)),numpy.float32)
+RADIUS = 0.1
 
 
 class Item(base.Item):
 
+    def __init__(self,parent:QObject = None):
+        super().__init__(parent)
+        self.startTimer(16)
+
+    def timerEvent(self,event:QTimerEvent) -> None:
+        self.window().update()
+
     def _createRenderer(self) -> base.Renderer:
         return Renderer()
 
@@ -23,25 +38,28 @@ class Item(base.Item):
 class Renderer(base.Renderer):
 
     def _destroy(self):
-        del self.__instanceBuffer
+        del self.__instances
         del self.__vao
         del self.__program
 
     def _init(self):
+        self.__start = perf_counter()
         self.__initProgram()
         self.__initVertices()
 
     def _paint(self):
+        self.__updateInstances()
         glViewport(0,0,self.viewportSize().width(),self.viewportSize().height())
         with self.__program:
-            with self.__vao as vao:
-                vao.drawInstanced()
+            with self.__instances as instances:
+                with self.__vao as vao:
+                    instances.draw(vao)
         glClear(GL_DEPTH_BUFFER_BIT)
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = programRegistry().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
 
     def __initVertices(self):
@@ -50,12 +68,6 @@ class Renderer(base.Renderer):
             ,0.5,-0.5,0.0,0.0,1.0,0.0
             ,0.0,0.5,0.0,0.0,0.0,1.0
         )
-        instance = (
-            -0.5,-0.5,0.5
-            ,0.5,-0.5,0.5
-            ,0,0.5,0.5
-            ,0,-0.15,0.5
-        )
         with self.__program as program:
             self.__vao = VertexArray.fromFloats(
                 vertices
@@ -64,13 +76,20 @@ class Renderer(base.Renderer):
                     (program.position,3,GL_FLOAT,24,0)
                     ,(program.color,3,GL_FLOAT,24,12)
                     )
-                ,len(instance)//3
                 )
-            with self.__vao as vao:
-                self.__instanceBuffer = Buffer.fromFloats(instance,GL_STATIC_DRAW)
-                self.__instanceBuffer.bind(GL_ARRAY_BUFFER)
-                vao.add(program.offset,2,GL_FLOAT,12,0,1)
-                vao.add(program.scale,1,GL_FLOAT,12,8,1)
+            self.__instances = InstanceStream(INSTANCE,len(CENTERS))
+            self.__instances.attach(
+                self.__vao
+                ,1
+                ,{"offset": program.offset,"scale": program.scale}
+                )
+
+    def __updateInstances(self):
+        angles = numpy.float32(perf_counter()-self.__start)+numpy.arange(len(CENTERS),dtype=numpy.float32)
+        instances = self.__instances.resize(len(CENTERS))
+        instances["offset"][:,0] = CENTERS[:,0]+RADIUS*numpy.cos(angles)
+        instances["offset"][:,1] = CENTERS[:,1]+RADIUS*numpy.sin(angles)
+        instances["scale"] = 0.5
 
 
 _vertexShaderSrc = """#version 450 core
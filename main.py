@@ -1,9 +1,14 @@
+from PySide6.QtCore import QStandardPaths
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtGui import QSurfaceFormat
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtQml import qmlRegisterType
 from PySide6.QtQuick import QQuickView
 from PySide6.QtQuick import QSGRendererInterface
+from opengl import ProgramCache
+from opengl import setProgramCache
+from opengl import setShaderLibrary
+from opengl import ShaderLibrary
 from pathlib import Path
 import alphaBlend
 import camera
@@ -29,6 +34,9 @@ if __name__ == "__main__":
     format.setProfile(QSurfaceFormat.CoreProfile)
     format.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
     QSurfaceFormat.setDefaultFormat(format)
+    cacheDirectory = Path(QStandardPaths.writableLocation(QStandardPaths.CacheLocation))
+    setProgramCache(ProgramCache(cacheDirectory/"programs"))
+    setShaderLibrary(ShaderLibrary(Path(__file__).resolve().parent/"shaders"))
     qmlRegisterType(triangle.Item,"internal",1,0,"OpenGLTriangle")
     qmlRegisterType(texture2D.Item,"internal",1,0,"OpenGLTexture2D")
     qmlRegisterType(alphaBlend.Item,"internal",1,0,"OpenGLAlphaBlend")
@@ -1,32 +1,69 @@
+from OpenGL.GL import GL_ALREADY_SIGNALED
+from OpenGL.GL import GL_CONDITION_SATISFIED
+from OpenGL.GL import GL_R16UI
+from OpenGL.GL import GL_R32UI
+from OpenGL.GL import GL_R8UI
+from OpenGL.GL import GL_RED_INTEGER
+from OpenGL.GL import GL_RG32UI
+from OpenGL.GL import GL_RGB32UI
+from OpenGL.GL import GL_RGBA32UI
+from OpenGL.GL import GL_RGBA_INTEGER
+from OpenGL.GL import GL_RG_INTEGER
+from OpenGL.GL import GL_RGB_INTEGER
 from OpenGL.GL import GL_SHADER_STORAGE_BUFFER
+from OpenGL.GL import GL_STREAM_READ
+from OpenGL.GL import GL_SYNC_FLUSH_COMMANDS_BIT
+from OpenGL.GL import GL_SYNC_GPU_COMMANDS_COMPLETE
 from OpenGL.GL import GL_UNIFORM_BUFFER
+from OpenGL.GL import GL_UNSIGNED_BYTE
+from OpenGL.GL import GL_UNSIGNED_INT
+from OpenGL.GL import GL_UNSIGNED_SHORT
+from OpenGL.GL import GL_WAIT_FAILED
 from OpenGL.GL import glBindBuffer
 from OpenGL.GL import glBindBufferBase
+from OpenGL.GL import glClearNamedBufferSubData
+from OpenGL.GL import glClientWaitSync
+from OpenGL.GL import glCopyNamedBufferSubData
 from OpenGL.GL import glCreateBuffers
 from OpenGL.GL import glDeleteBuffers
+from OpenGL.GL import glDeleteSync
+from OpenGL.GL import glFenceSync
 from OpenGL.GL import glGetNamedBufferSubData
+from OpenGL.GL import glInvalidateBufferData
+from OpenGL.GL import glInvalidateBufferSubData
 from OpenGL.GL import glNamedBufferData
 from OpenGL.GL import glNamedBufferSubData
 from OpenGL.constant import IntConstant as glIntConstant
-from ctypes import addressof
-from ctypes import byref
-from ctypes import c_float
 from ctypes import c_uint
 from ctypes import c_void_p
-from ctypes import sizeof
+from opengl.memory import byteView
+from opengl.memory import floatArray
+import numpy
+
+WAIT_TIMEOUT = 1000000000
+STAGING_COUNT = 4
+
+CLEAR_FORMATS = {
+    1: (GL_R8UI,GL_RED_INTEGER,GL_UNSIGNED_BYTE)
+    ,2: (GL_R16UI,GL_RED_INTEGER,GL_UNSIGNED_SHORT)
+    ,4: (GL_R32UI,GL_RED_INTEGER,GL_UNSIGNED_INT)
+    ,8: (GL_RG32UI,GL_RG_INTEGER,GL_UNSIGNED_INT)
+    ,12: (GL_RGB32UI,GL_RGB_INTEGER,GL_UNSIGNED_INT)
+    ,16: (GL_RGBA32UI,GL_RGBA_INTEGER,GL_UNSIGNED_INT)
+}
 
 
 class Buffer:
 
     @staticmethod
     def fromData(data,usage:glIntConstant):
-        ret = Buffer(sizeof(data),usage)
+        ret = Buffer(byteView(data).nbytes,usage)
         ret.write(0,data)
         return ret
 
     @classmethod
     def fromFloats(cls,floats,usage:glIntConstant):
-        data = (c_float*len(floats))(*floats)
+        data = floatArray(floats)
         return cls.fromData(data,usage)
 
     def __init__(self,size:int,usage:glIntConstant):
@@ -35,28 +72,123 @@ class Buffer:
         id = c_uint()
         glCreateBuffers(1,id)
         self.__id = id.value
+        self.__size = size
+        self.__staging = {}
         glNamedBufferData(self.__id,size,None,usage)
 
     def __del__(self):
         glDeleteBuffers(1,(self.__id,))
 
+    def id(self):
+        return self.__id
+
+    def size(self) -> int:
+        return self.__size
+
     def write(self,offset:int,data) -> None:
-        size = sizeof(data)
+        view = byteView(data)
         if (
             offset < 0
-            or size <= 0
+            or view.nbytes <= 0
             ):
             raise RuntimeError
-        glNamedBufferSubData(self.__id,offset,size,byref(data))
+        glNamedBufferSubData(self.__id,offset,view.nbytes,c_void_p(view.ctypes.data))
 
     def read(self,offset:int,data) -> None:
-        size = sizeof(data)
+        view = byteView(data,True)
         if (
             offset < 0
+            or view.nbytes <= 0
+            ):
+            raise RuntimeError
+        glGetNamedBufferSubData(self.__id,offset,view.nbytes,c_void_p(view.ctypes.data))
+
+    def copyTo(
+        self
+        ,destination
+        ,sourceOffset:int = 0
+        ,destinationOffset:int = 0
+        ,size:int = 0
+        ) -> None:
+        if size == 0:
+            size = self.__size-sourceOffset
+        if (
+            sourceOffset < 0
+            or destinationOffset < 0
+            or size <= 0
+            or sourceOffset+size > self.__size
+            or destinationOffset+size > destination.size()
+            or (
+                destination is self
+                and sourceOffset < destinationOffset+size
+                and destinationOffset < sourceOffset+size
+                )
+            ):
+            raise RuntimeError
+        glCopyNamedBufferSubData(self.__id,destination.id(),sourceOffset,destinationOffset,size)
+
+    def clear(self,value = None,offset:int = 0,size:int = 0) -> None:
+        if size == 0:
+            size = self.__size-offset
+        if value is None:
+            value = numpy.zeros(1,numpy.uint8)
+        elif isinstance(value,float):
+            value = numpy.array(value,numpy.float32)
+        elif isinstance(value,int):
+            value = numpy.array(value,numpy.int32 if value < 0 else numpy.uint32)
+        view = byteView(value)
+        if (
+            view.nbytes not in CLEAR_FORMATS
+            or offset < 0
             or size <= 0
+            or offset+size > self.__size
+            or (offset%view.nbytes) != 0
+            or (size%view.nbytes) != 0
             ):
             raise RuntimeError
-        glGetNamedBufferSubData(self.__id,offset,size,c_void_p(addressof(data)))
+        (internalFormat,format,type) = CLEAR_FORMATS[view.nbytes]
+        glClearNamedBufferSubData(
+            self.__id
+            ,internalFormat
+            ,offset
+            ,size
+            ,format
+            ,type
+            ,c_void_p(view.ctypes.data)
+            )
+
+    def invalidate(self,offset:int = 0,size:int = 0) -> None:
+        if (
+            offset == 0
+            and size in (0,self.__size)
+            ):
+            glInvalidateBufferData(self.__id)
+            return
+        if size == 0:
+            size = self.__size-offset
+        if (
+            offset < 0
+            or size <= 0
+            or offset+size > self.__size
+            ):
+            raise RuntimeError
+        glInvalidateBufferSubData(self.__id,offset,size)
+
+    def readAsync(self,offset:int = 0,size:int = 0,dtype = numpy.uint8):
+        dtype = numpy.dtype(dtype)
+        if size == 0:
+            size = self.__size-offset
+        if (
+            offset < 0
+            or size <= 0
+            or offset+size > self.__size
+            or (size%dtype.itemsize) != 0
+            ):
+            raise RuntimeError
+        pool = self.__staging.setdefault(size,[])
+        staging = pool.pop() if pool else Buffer(size,GL_STREAM_READ)
+        self.copyTo(staging,offset,0,size)
+        return PendingRead(staging,dtype,(size//dtype.itemsize,),pool)
 
     def bind(self,target:glIntConstant) -> None:
         glBindBuffer(target,self.__id)
@@ -70,3 +202,54 @@ class Buffer:
         if index < 0:
             raise RuntimeError
         glBindBufferBase(GL_UNIFORM_BUFFER,index,self.__id)
+
+
+class PendingRead:
+
+    def __init__(self,staging:Buffer,dtype,shape:tuple,pool:list = None):
+        self.__staging = staging
+        self.__dtype = dtype
+        self.__shape = shape
+        self.__pool = pool
+        self.__fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE,0)
+        self.__result = None
+
+    def __del__(self):
+        if self.__fence is not None:
+            glDeleteSync(self.__fence)
+        self.__recycle()
+
+    def ready(self) -> bool:
+        if self.__fence is None:
+            return True
+        result = glClientWaitSync(self.__fence,GL_SYNC_FLUSH_COMMANDS_BIT,0)
+        if result == GL_WAIT_FAILED:
+            raise RuntimeError
+        if result in (GL_ALREADY_SIGNALED,GL_CONDITION_SATISFIED):
+            glDeleteSync(self.__fence)
+            self.__fence = None
+            return True
+        return False
+
+    def result(self) -> numpy.ndarray:
+        if self.__result is None:
+            while self.__fence is not None:
+                result = glClientWaitSync(self.__fence,GL_SYNC_FLUSH_COMMANDS_BIT,WAIT_TIMEOUT)
+                if result == GL_WAIT_FAILED:
+                    raise RuntimeError
+                if result in (GL_ALREADY_SIGNALED,GL_CONDITION_SATISFIED):
+                    glDeleteSync(self.__fence)
+                    self.__fence = None
+            self.__result = numpy.empty(self.__shape,self.__dtype)
+            self.__staging.read(0,self.__result)
+            self.__recycle()
+        return self.__result
+
+    def __recycle(self) -> None:
+        if (
+            self.__staging is not None
+            and self.__pool is not None
+            and len(self.__pool) < STAGING_COUNT
+            ):
+            self.__pool.append(self.__staging)
+        self.__staging = None
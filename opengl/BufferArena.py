@@ -0,0 +1,152 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import GL_SHADER_STORAGE_BUFFER
+from OpenGL.GL import GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT
+from OpenGL.GL import GL_UNIFORM_BUFFER
+from OpenGL.GL import GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT
+from OpenGL.GL import glBindBufferRange
+from OpenGL.GL import glGetIntegerv
+from OpenGL.constant import IntConstant as glIntConstant
+from bisect import bisect_left
+from opengl import Buffer
+from opengl.memory import byteView
+
+PAGE_SIZE = 1024*1024
+
+
+class BufferRange:
+
+    def __init__(self,arena,page,offset:int,size:int):
+        self.__arena = arena
+        self.__page = page
+        self.__offset = offset
+        self.__size = size
+
+    def __del__(self):
+        self.free()
+
+    def buffer(self) -> Buffer:
+        if self.__page is None:
+            raise RuntimeError
+        return self.__page.buffer
+
+    def offset(self) -> int:
+        return self.__offset
+
+    def size(self) -> int:
+        return self.__size
+
+    def free(self) -> None:
+        if self.__page is not None:
+            self.__arena._release(self.__page,self.__offset,self.__size)
+            self.__page = None
+
+    def write(self,offset:int,data) -> None:
+        if (
+            offset < 0
+            or offset+byteView(data).nbytes > self.__size
+            ):
+            raise RuntimeError
+        self.buffer().write(self.__offset+offset,data)
+
+    def read(self,offset:int,data) -> None:
+        if (
+            offset < 0
+            or offset+byteView(data).nbytes > self.__size
+            ):
+            raise RuntimeError
+        self.buffer().read(self.__offset+offset,data)
+
+    def bindToShaderStorage(self,index:int) -> None:
+        if index < 0:
+            raise RuntimeError
+        glBindBufferRange(GL_SHADER_STORAGE_BUFFER,index,self.buffer().id(),self.__offset,self.__size)
+
+    def bindToUniform(self,index:int) -> None:
+        if index < 0:
+            raise RuntimeError
+        glBindBufferRange(GL_UNIFORM_BUFFER,index,self.buffer().id(),self.__offset,self.__size)
+
+
+class BufferArena:
+
+    def __init__(self,pageSize:int = PAGE_SIZE,usage:glIntConstant = GL_DYNAMIC_DRAW):
+        if pageSize <= 0:
+            raise RuntimeError
+        self.__alignment = max(
+            int(glGetIntegerv(GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+            ,int(glGetIntegerv(GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT))
+            )
+        self.__pageSize = self.__align(pageSize)
+        self.__usage = usage
+        self.__pages = []
+        self.__allocated = 0
+
+    def alignment(self) -> int:
+        return self.__alignment
+
+    def allocatedSize(self) -> int:
+        return self.__allocated
+
+    def pageCount(self) -> int:
+        return len(self.__pages)
+
+    def allocate(self,size:int) -> BufferRange:
+        if size <= 0:
+            raise RuntimeError
+        size = self.__align(size)
+        for page in self.__pages:
+            offset = page.take(size)
+            if offset is not None:
+                self.__allocated += size
+                return BufferRange(self,page,offset,size)
+        page = _Page(Buffer(max(size,self.__pageSize),self.__usage))
+        self.__pages.append(page)
+        self.__allocated += size
+        return BufferRange(self,page,page.take(size),size)
+
+    def _release(self,page,offset:int,size:int) -> None:
+        page.give(offset,size)
+        self.__allocated -= size
+
+    def __align(self,size:int) -> int:
+        return ((size+self.__alignment-1)//self.__alignment)*self.__alignment
+
+
+class _Page:
+
+    def __init__(self,buffer:Buffer):
+        self.buffer = buffer
+        self.offsets = [0]
+        self.sizes = [buffer.size()]
+
+    def take(self,size:int):
+        for (i,s) in enumerate(self.sizes):
+            if s >= size:
+                offset = self.offsets[i]
+                if s == size:
+                    del self.offsets[i]
+                    del self.sizes[i]
+                else:
+                    self.offsets[i] += size
+                    self.sizes[i] -= size
+                return offset
+        return None
+
+    def give(self,offset:int,size:int) -> None:
+        i = bisect_left(self.offsets,offset)
+        if (
+            i > 0
+            and self.offsets[i-1]+self.sizes[i-1] == offset
+            ):
+            i -= 1
+            self.sizes[i] += size
+        else:
+            self.offsets.insert(i,offset)
+            self.sizes.insert(i,size)
+        if (
+            i+1 < len(self.offsets)
+            and self.offsets[i]+self.sizes[i] == self.offsets[i+1]
+            ):
+            self.sizes[i] += self.sizes[i+1]
+            del self.offsets[i+1]
+            del self.sizes[i+1]
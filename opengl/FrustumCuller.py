@@ -0,0 +1,174 @@
+from OpenGL.GL import GL_COMMAND_BARRIER_BIT
+from OpenGL.GL import GL_COMPUTE_SHADER
+from OpenGL.GL import GL_DYNAMIC_COPY
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import GL_SHADER_STORAGE_BARRIER_BIT
+from OpenGL.GL import glDispatchCompute
+from OpenGL.GL import glMemoryBarrier
+from OpenGL.GL import glMultiDrawElementsIndirectCount
+from PySide6.QtGui import QMatrix4x4
+from opengl import Buffer
+from opengl.MeshBatch import DRAW_ELEMENTS_COMMAND
+from opengl.MeshBatch import MeshBatch
+from opengl.ProgramRegistry import programRegistry
+import numpy
+
+LOCAL_SIZE = 64
+
+BOUNDS = numpy.dtype([
+    ("center","<f4",(3,))
+    ,("radius","<f4")
+    ,("extent","<f4",(3,))
+    ,("p0","<f4")
+])
+
+
+class FrustumCuller:
+
+    def __init__(self,batch:MeshBatch,binding:int = 0):
+        if (
+            batch.vertexArray() is None
+            or binding < 0
+            ):
+            raise RuntimeError
+        self.__batch = batch
+        self.__binding = binding
+        self.__objectCount = len(batch.commands())
+        self.__indirectCount = bool(glMultiDrawElementsIndirectCount)
+        self.__bounds = Buffer(self.__objectCount*BOUNDS.itemsize,GL_DYNAMIC_DRAW)
+        self.__commands = Buffer(self.__objectCount*DRAW_ELEMENTS_COMMAND.itemsize,GL_DYNAMIC_COPY)
+        self.__counts = Buffer(4,GL_DYNAMIC_COPY)
+        self.__program = programRegistry().acquire((_computeShaderSrc,GL_COMPUTE_SHADER))
+        with self.__program as program:
+            self.__blocks = (
+                program.ssbo.BoundsBuffer
+                ,program.ssbo.SourceBuffer
+                ,program.ssbo.CommandBuffer
+                ,program.ssbo.CountBuffer
+                )
+            self.__objectCountUniform = program.uniform.objectCount
+            self.__viewProjectionUniform = program.uniform.viewProjection
+
+    def commandBuffer(self) -> Buffer:
+        return self.__commands
+
+    def countBuffer(self) -> Buffer:
+        return self.__counts
+
+    def objectCount(self) -> int:
+        return self.__objectCount
+
+    def visibleCount(self):
+        return self.__counts.readAsync(0,4,numpy.uint32)
+
+    def setBounds(self,bounds) -> None:
+        bounds = numpy.ascontiguousarray(bounds,BOUNDS)
+        if bounds.shape != (self.__objectCount,):
+            raise RuntimeError
+        self.__bounds.write(0,bounds)
+
+    def setSpheres(self,spheres) -> None:
+        spheres = numpy.asarray(spheres,numpy.float32)
+        if spheres.shape != (self.__objectCount,4):
+            raise RuntimeError
+        bounds = numpy.zeros(self.__objectCount,BOUNDS)
+        bounds["center"] = spheres[:,:3]
+        bounds["radius"] = spheres[:,3]
+        self.setBounds(bounds)
+
+    def setBoxes(self,minimum,maximum) -> None:
+        minimum = numpy.asarray(minimum,numpy.float32)
+        maximum = numpy.asarray(maximum,numpy.float32)
+        if (
+            minimum.shape != (self.__objectCount,3)
+            or maximum.shape != (self.__objectCount,3)
+            ):
+            raise RuntimeError
+        bounds = numpy.zeros(self.__objectCount,BOUNDS)
+        bounds["center"] = 0.5*(minimum+maximum)
+        bounds["extent"] = 0.5*(maximum-minimum)
+        self.setBounds(bounds)
+
+    def cull(self,viewProjection:QMatrix4x4) -> None:
+        self.__counts.clear()
+        if not self.__indirectCount:
+            self.__commands.clear()
+        self.__bounds.bindToShaderStorage(self.__binding)
+        self.__batch.commandBuffer().bindToShaderStorage(self.__binding+1)
+        self.__commands.bindToShaderStorage(self.__binding+2)
+        self.__counts.bindToShaderStorage(self.__binding+3)
+        with self.__program:
+            for (i,block) in enumerate(self.__blocks):
+                block.setBlockBinding(self.__binding+i)
+            self.__objectCountUniform.set1i(self.__objectCount)
+            self.__viewProjectionUniform.setMatrix4f(viewProjection)
+            glDispatchCompute((self.__objectCount+LOCAL_SIZE-1)//LOCAL_SIZE,1,1)
+        glMemoryBarrier(GL_COMMAND_BARRIER_BIT|GL_SHADER_STORAGE_BARRIER_BIT)
+
+    def draw(self,mode = None) -> None:
+        vao = self.__batch.vertexArray()
+        if self.__indirectCount:
+            vao.multiDrawIndirectCount(self.__commands,self.__counts,self.__objectCount,0,0,mode)
+        else:
+            vao.multiDrawIndirect(self.__commands,self.__objectCount,0,mode)
+
+
+_computeShaderSrc = """#version 450 core
+
+layout (local_size_x=64,local_size_y=1,local_size_z=1) in;
+
+struct Bounds {
+    vec3 center;
+    float radius;
+    vec3 extent;
+    float p0;
+};
+
+struct Command {
+    uint count;
+    uint instanceCount;
+    uint firstIndex;
+    int baseVertex;
+    uint baseInstance;
+};
+
+uniform mat4 viewProjection;
+uniform int objectCount;
+
+layout(std430) readonly buffer BoundsBuffer {
+    Bounds bounds[];
+};
+
+layout(std430) readonly buffer SourceBuffer {
+    Command sources[];
+};
+
+layout(std430) writeonly buffer CommandBuffer {
+    Command commands[];
+};
+
+layout(std430) buffer CountBuffer {
+    uint drawCount;
+};
+
+void main()
+{
+    int i = int(gl_GlobalInvocationID.x);
+    if (i >= objectCount || sources[i].instanceCount == 0)
+    {
+        return;
+    }
+    mat4 m = transpose(viewProjection);
+    vec4 planes[6] = vec4[6](m[3]+m[0],m[3]-m[0],m[3]+m[1],m[3]-m[1],m[3]+m[2],m[3]-m[2]);
+    Bounds b = bounds[i];
+    for (int p = 0;p < 6;p++)
+    {
+        float reach = dot(abs(planes[p].xyz),b.extent)+b.radius*length(planes[p].xyz);
+        if (dot(planes[p].xyz,b.center)+planes[p].w < -reach)
+        {
+            return;
+        }
+    }
+    commands[atomicAdd(drawCount,1)] = sources[i];
+}
+"""
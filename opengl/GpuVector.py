@@ -0,0 +1,153 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import GL_STREAM_COPY
+from OpenGL.constant import IntConstant as glIntConstant
+from opengl import Buffer
+from opengl.layout import BlockLayout
+import numpy
+
+GROWTH_FACTOR = 2
+
+
+class GpuVector:
+
+    def __init__(
+        self
+        ,layout:BlockLayout
+        ,capacity:int = 16
+        ,usage:glIntConstant = GL_DYNAMIC_DRAW
+        ,countField:str = None
+        ):
+        if (
+            layout.elementDtype() is None
+            or layout.elementCount() != 0
+            or capacity <= 0
+            ):
+            raise RuntimeError
+        fields = layout.headerDtype().fields
+        if countField is None and fields:
+            countField = layout.headerDtype().names[0]
+        if (
+            countField is not None
+            and countField not in fields
+            ):
+            raise RuntimeError
+        self.__layout = layout
+        self.__dtype = layout.elementDtype()
+        self.__offset = layout.elementOffset()
+        self.__stride = layout.elementStride()
+        self.__countField = countField
+        self.__usage = usage
+        self.__size = 0
+        self.__capacity = capacity
+        self.__buffer = Buffer(layout.sizeFor(capacity),usage)
+        self.__writeCount()
+
+    def __len__(self):
+        return self.__size
+
+    def buffer(self) -> Buffer:
+        return self.__buffer
+
+    def capacity(self) -> int:
+        return self.__capacity
+
+    def layout(self) -> BlockLayout:
+        return self.__layout
+
+    def size(self) -> int:
+        return self.__size
+
+    def reserve(self,capacity:int) -> None:
+        if capacity <= self.__capacity:
+            return
+        self.__grow(capacity,True)
+
+    def resize(self,size:int) -> None:
+        if size < 0:
+            raise RuntimeError
+        self.reserve(size)
+        self.__size = size
+        self.__writeCount()
+
+    def clear(self) -> None:
+        self.resize(0)
+
+    def assign(self,elements) -> None:
+        elements = self.__pack(elements)
+        if len(elements) > self.__capacity:
+            self.__grow(len(elements),False)
+        self.__size = len(elements)
+        if self.__size:
+            self.__buffer.write(self.__offset,elements)
+        self.__writeCount()
+
+    def append(self,elements) -> None:
+        elements = self.__pack(elements)
+        if not len(elements):
+            return
+        self.reserve(self.__size+len(elements))
+        self.__buffer.write(self.__offset+self.__size*self.__stride,elements)
+        self.__size += len(elements)
+        self.__writeCount()
+
+    def set(self,index:int,elements) -> None:
+        elements = self.__pack(elements)
+        if (
+            index < 0
+            or index+len(elements) > self.__size
+            ):
+            raise RuntimeError
+        if len(elements):
+            self.__buffer.write(self.__offset+index*self.__stride,elements)
+
+    def erase(self,index:int,count:int = 1) -> None:
+        if (
+            index < 0
+            or count <= 0
+            or index+count > self.__size
+            ):
+            raise RuntimeError
+        tail = (self.__size-index-count)*self.__stride
+        if tail:
+            source = self.__offset+(index+count)*self.__stride
+            destination = self.__offset+index*self.__stride
+            scratch = Buffer(tail,GL_STREAM_COPY)
+            self.__buffer.copyTo(scratch,source,0,tail)
+            scratch.copyTo(self.__buffer,0,destination,tail)
+        self.__size -= count
+        self.__writeCount()
+
+    def read(self) -> numpy.ndarray:
+        ret = numpy.empty(self.__size,self.__dtype)
+        if self.__size:
+            self.__buffer.read(self.__offset,ret)
+        return ret
+
+    def bindToShaderStorage(self,index:int) -> None:
+        self.__buffer.bindToShaderStorage(index)
+
+    def __grow(self,capacity:int,keep:bool) -> None:
+        capacity = max(capacity,self.__capacity*GROWTH_FACTOR)
+        buffer = Buffer(self.__layout.sizeFor(capacity),self.__usage)
+        size = self.__offset+self.__size*self.__stride if keep else self.__offset
+        if size:
+            self.__buffer.copyTo(buffer,0,0,size)
+        self.__buffer = buffer
+        self.__capacity = capacity
+
+    def __pack(self,elements) -> numpy.ndarray:
+        elements = numpy.atleast_1d(numpy.asarray(elements))
+        if elements.dtype == self.__dtype:
+            return numpy.ascontiguousarray(elements)
+        if elements.dtype.names is None:
+            raise RuntimeError
+        ret = numpy.zeros(len(elements),self.__dtype)
+        for name in elements.dtype.names:
+            ret[name] = elements[name]
+        return ret
+
+    def __writeCount(self) -> None:
+        if self.__countField is None:
+            return
+        (dtype,offset) = self.__layout.headerDtype().fields[self.__countField][:2]
+        self.__buffer.write(offset,numpy.array(self.__size,dtype))
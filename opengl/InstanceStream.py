@@ -0,0 +1,98 @@
+from opengl.StreamingBuffer import StreamingBuffer
+from opengl.VertexFormat import VertexFormat
+import numpy
+
+GROWTH_FACTOR = 2
+
+
+class InstanceStream:
+
+    def __init__(self,dtype,capacity:int = 1024,sliceCount:int = 3):
+        dtype = numpy.dtype(dtype)
+        if (
+            dtype.fields is None
+            or capacity <= 0
+            or sliceCount <= 0
+            ):
+            raise RuntimeError
+        self.__sliceCount = sliceCount
+        self.__data = numpy.zeros(capacity,dtype)
+        self.__count = 0
+        self.__buffer = None
+        self.__targets = []
+        self.__active = False
+
+    def __len__(self):
+        return self.__count
+
+    def __enter__(self):
+        if (
+            self.__buffer is None
+            or self.__buffer.size() < self.__data.nbytes
+            ):
+            self.__buffer = StreamingBuffer(self.__data.nbytes,self.__sliceCount)
+        self.__buffer.__enter__()
+        self.__active = True
+        if self.__count:
+            self.__buffer.write(0,self.__data[:self.__count])
+        for (vao,binding) in self.__targets:
+            vao.setBuffer(binding,self.__buffer,self.__buffer.offset())
+            vao.setInstanceSize(self.capacity())
+        return self
+
+    def __exit__(self,type,value,tb):
+        self.__active = False
+        return self.__buffer.__exit__(type,value,tb)
+
+    def array(self) -> numpy.ndarray:
+        return self.__data[:self.__count]
+
+    def capacity(self) -> int:
+        return len(self.__data)
+
+    def count(self) -> int:
+        return self.__count
+
+    def dtype(self) -> numpy.dtype:
+        return self.__data.dtype
+
+    def format(self,locations:dict,normalized:tuple = ()) -> VertexFormat:
+        return VertexFormat.fromDtype(self.__data.dtype,locations,1,normalized)
+
+    def attach(self,vao,binding:int,locations:dict,normalized:tuple = ()) -> None:
+        vao.setFormat(binding,self.format(locations,normalized))
+        self.__targets.append((vao,binding))
+
+    def reserve(self,capacity:int) -> None:
+        if capacity <= len(self.__data):
+            return
+        data = numpy.zeros(max(capacity,len(self.__data)*GROWTH_FACTOR),self.__data.dtype)
+        data[:self.__count] = self.__data[:self.__count]
+        self.__data = data
+
+    def resize(self,count:int) -> numpy.ndarray:
+        if (
+            self.__active
+            or count < 0
+            ):
+            raise RuntimeError
+        self.reserve(count)
+        self.__count = count
+        return self.array()
+
+    def assign(self,instances) -> None:
+        instances = numpy.atleast_1d(numpy.asarray(instances))
+        array = self.resize(len(instances))
+        if instances.dtype == array.dtype:
+            array[:] = instances
+        elif instances.dtype.names is None:
+            raise RuntimeError
+        else:
+            for name in instances.dtype.names:
+                array[name] = instances[name]
+
+    def draw(self,vao,count:int = 0,mode = None) -> None:
+        if not self.__active:
+            raise RuntimeError
+        if self.__count:
+            vao.drawInstanced(self.__count,count,mode)
@@ -0,0 +1,159 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import GL_STATIC_DRAW
+from OpenGL.constant import IntConstant as glIntConstant
+from PySide6.QtGui import QMatrix4x4
+from opengl import Buffer
+from opengl.MeshBatch import DRAW_ELEMENTS_COMMAND
+from opengl.memory import floatArray
+from opengl.mesh import compactIndices
+from opengl.mesh import indexType
+from opengl.optimize import simplify
+from opengl.VertexArray import VertexArray
+from opengl.VertexFormat import VertexFormat
+import numpy
+
+
+class LodChain:
+
+    @staticmethod
+    def build(
+        floats
+        ,indices
+        ,mode:glIntConstant
+        ,attributes:list
+        ,levelCount:int = 4
+        ,ratio:float = 0.5
+        ,maxError:float = numpy.inf
+        ):
+        floats = floatArray(floats)
+        format = VertexFormat.fromAttributes(attributes)
+        if (
+            levelCount <= 0
+            or ratio <= 0
+            or ratio >= 1
+            or (format.stride()%4) != 0
+            ):
+            raise RuntimeError
+        levels = [compactIndices(indices)]
+        errors = [0.0]
+        while len(levels) < levelCount:
+            (level,error) = simplify(
+                floats
+                ,format.stride()//4
+                ,levels[-1]
+                ,int(levels[-1].size//3*ratio)
+                ,maxError
+                )
+            if level.size >= levels[-1].size:
+                break
+            levels.append(level)
+            errors.append(errors[-1]+error)
+        return LodChain(floats,mode,format,levels,errors)
+
+    def __init__(self,vertices,mode:glIntConstant,format:VertexFormat,levels:list,errors:list):
+        vertices = numpy.ascontiguousarray(vertices)
+        if (
+            not levels
+            or len(levels) != len(errors)
+            or (vertices.nbytes%format.stride()) != 0
+            ):
+            raise RuntimeError
+        indices = compactIndices(numpy.concatenate(levels))
+        vertexSize = ((vertices.nbytes+indices.itemsize-1)//indices.itemsize)*indices.itemsize
+        counts = numpy.array([level.size for level in levels],numpy.uint32)
+        self.__errors = numpy.array(errors,numpy.float64)
+        self.__counts = counts
+        self.__firstIndices = vertexSize//indices.itemsize+numpy.cumsum(counts)-counts
+        self.__buffer = Buffer(vertexSize+indices.nbytes,GL_STATIC_DRAW)
+        self.__buffer.write(0,vertices)
+        self.__buffer.write(vertexSize,indices)
+        self.__vao = VertexArray(mode,indices.size)
+        self.__vao.setFormat(0,format)
+        self.__vao.setBuffer(0,self.__buffer)
+        self.__vao.setIndexBuffer(self.__buffer,indexType(indices))
+        self.__commandBuffer = None
+
+    def __len__(self):
+        return len(self.__counts)
+
+    def __enter__(self):
+        self.__vao.__enter__()
+        return self
+
+    def __exit__(self,type,value,tb):
+        return self.__vao.__exit__(type,value,tb)
+
+    def buffer(self) -> Buffer:
+        return self.__buffer
+
+    def errors(self) -> numpy.ndarray:
+        return self.__errors
+
+    def triangleCounts(self) -> numpy.ndarray:
+        return self.__counts//3
+
+    def vertexArray(self) -> VertexArray:
+        return self.__vao
+
+    def select(
+        self
+        ,centers
+        ,view:QMatrix4x4
+        ,projection:QMatrix4x4
+        ,viewportHeight:int
+        ,threshold:float = 1.0
+        ,scales = 1.0
+        ) -> numpy.ndarray:
+        centers = numpy.asarray(centers,numpy.float64).reshape(-1,3)
+        v = numpy.array(view.data(),numpy.float64).reshape(4,4).T
+        p = numpy.array(projection.data(),numpy.float64).reshape(4,4).T
+        if viewportHeight <= 0:
+            raise RuntimeError
+        depths = numpy.maximum(-(centers@v[2,:3]+v[2,3]),1e-6)
+        pixels = numpy.asarray(scales,numpy.float64).reshape(-1,1)*self.__errors[1:]
+        pixels = pixels*(0.5*p[1,1]*viewportHeight)/depths[:,None]
+        return (pixels <= threshold).sum(axis=1)
+
+    def commands(self,levels) -> numpy.ndarray:
+        levels = numpy.asarray(levels,numpy.int64).ravel()
+        if (
+            levels.size
+            and (
+                levels.min() < 0
+                or levels.max() >= len(self.__counts)
+                )
+            ):
+            raise RuntimeError
+        ret = numpy.zeros(len(levels),DRAW_ELEMENTS_COMMAND)
+        ret["count"] = self.__counts[levels]
+        ret["instanceCount"] = 1
+        ret["firstIndex"] = self.__firstIndices[levels]
+        ret["baseInstance"] = numpy.arange(len(levels))
+        return ret
+
+    def draw(self,levels,mode = None) -> None:
+        commands = self.commands(levels)
+        if not len(commands):
+            return
+        if (
+            self.__commandBuffer is None
+            or self.__commandBuffer.size() < commands.nbytes
+            ):
+            self.__commandBuffer = Buffer(commands.nbytes,GL_DYNAMIC_DRAW)
+        self.__commandBuffer.write(0,commands)
+        self.__vao.multiDrawIndirect(self.__commandBuffer,len(commands),0,mode)
+
+    def report(self,levels = None) -> str:
+        triangles = self.triangleCounts()
+        lines = [f"{'level':>5}{'triangles':>12}{'reduction':>12}{'error':>12}"]
+        for (i,(count,error)) in enumerate(zip(triangles,self.__errors)):
+            lines.append(f"{i:>5}{count:>12}{100*(1-count/triangles[0]):>11.1f}%{error:>12.5f}")
+        if levels is not None:
+            levels = numpy.asarray(levels,numpy.int64).ravel()
+            drawn = int(triangles[levels].sum())
+            full = int(triangles[0])*len(levels)
+            lines.append(
+                f"{len(levels)} objects drawn with {drawn} of {full} triangles"
+                f" ({100*(1-drawn/max(full,1)):.1f}% reduction)"
+                )
+        return "\n".join(lines)
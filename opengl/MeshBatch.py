@@ -0,0 +1,110 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.GL import GL_STATIC_DRAW
+from OpenGL.constant import IntConstant as glIntConstant
+from opengl import Buffer
+from opengl.memory import byteView
+from opengl.mesh import compactIndices
+from opengl.mesh import indexType
+from opengl.VertexArray import VertexArray
+from opengl.VertexFormat import VertexFormat
+import numpy
+
+DRAW_ARRAYS_COMMAND = numpy.dtype([
+    ("count","<u4")
+    ,("instanceCount","<u4")
+    ,("first","<u4")
+    ,("baseInstance","<u4")
+])
+
+DRAW_ELEMENTS_COMMAND = numpy.dtype([
+    ("count","<u4")
+    ,("instanceCount","<u4")
+    ,("firstIndex","<u4")
+    ,("baseVertex","<i4")
+    ,("baseInstance","<u4")
+])
+
+
+class MeshBatch:
+
+    def __init__(self,mode:glIntConstant,format:VertexFormat):
+        self.__mode = mode
+        self.__format = format
+        self.__vertices = []
+        self.__indices = []
+        self.__instanceCounts = []
+        self.__commands = None
+        self.__commandBuffer = None
+        self.__vao = None
+
+    def __len__(self):
+        return len(self.__indices)
+
+    def __enter__(self):
+        if self.__vao is None:
+            raise RuntimeError
+        self.__vao.__enter__()
+        return self
+
+    def __exit__(self,type,value,tb):
+        return self.__vao.__exit__(type,value,tb)
+
+    def add(self,vertices,indices,instanceCount:int = 1) -> int:
+        vertices = byteView(vertices)
+        indices = numpy.ascontiguousarray(indices).ravel()
+        if (
+            self.__vao is not None
+            or not vertices.nbytes
+            or (vertices.nbytes%self.__format.stride()) != 0
+            or not indices.size
+            or indices.min() < 0
+            or indices.max() >= vertices.nbytes//self.__format.stride()
+            or instanceCount < 0
+            ):
+            raise RuntimeError
+        self.__vertices.append(vertices)
+        self.__indices.append(indices)
+        self.__instanceCounts.append(instanceCount)
+        return len(self.__indices)-1
+
+    def build(self) -> None:
+        if (
+            self.__vao is not None
+            or not self.__indices
+            ):
+            raise RuntimeError
+        indexCounts = numpy.array([i.size for i in self.__indices],numpy.uint32)
+        vertexCounts = numpy.array([v.nbytes//self.__format.stride() for v in self.__vertices],numpy.int64)
+        instanceCounts = numpy.array(self.__instanceCounts,numpy.uint32)
+        self.__commands = numpy.zeros(len(indexCounts),DRAW_ELEMENTS_COMMAND)
+        self.__commands["count"] = indexCounts
+        self.__commands["instanceCount"] = instanceCounts
+        self.__commands["firstIndex"] = numpy.cumsum(indexCounts)-indexCounts
+        self.__commands["baseVertex"] = numpy.cumsum(vertexCounts)-vertexCounts
+        self.__commands["baseInstance"] = numpy.cumsum(instanceCounts)-instanceCounts
+        indices = compactIndices(numpy.concatenate(self.__indices))
+        self.__vao = VertexArray(self.__mode,indices.size)
+        self.__vao.setFormat(0,self.__format)
+        self.__vao.setBuffer(0,Buffer.fromData(numpy.concatenate(self.__vertices),GL_STATIC_DRAW))
+        self.__vao.setIndexBuffer(Buffer.fromData(indices,GL_STATIC_DRAW),indexType(indices))
+        self.__commandBuffer = Buffer.fromData(self.__commands,GL_DYNAMIC_DRAW)
+        self.__vertices = []
+        self.__instanceCounts = []
+        self.__indices = [None]*len(indexCounts)
+
+    def commands(self) -> numpy.ndarray:
+        if self.__commands is None:
+            raise RuntimeError
+        return self.__commands
+
+    def commandBuffer(self) -> Buffer:
+        return self.__commandBuffer
+
+    def vertexArray(self) -> VertexArray:
+        return self.__vao
+
+    def updateCommands(self) -> None:
+        self.__commandBuffer.write(0,self.commands())
+
+    def draw(self,mode = None) -> None:
+        self.__vao.multiDrawIndirect(self.__commandBuffer,len(self.__commands),0,mode)
@@ -0,0 +1,186 @@
+from OpenGL.GL import GL_STATIC_DRAW
+from OpenGL.constant import IntConstant as glIntConstant
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QOpenGLContext
+from collections import OrderedDict
+from opengl import Buffer
+from opengl.memory import floatArray
+from opengl.mesh import indexType
+from opengl.mesh import weld
+from opengl.VertexArray import VertexArray
+from opengl.VertexFormat import VertexFormat
+import hashlib
+import weakref
+
+BUDGET = 64*1024*1024
+
+
+class MeshHandle:
+
+    def __init__(self,registry,mesh,mode:glIntConstant,format:VertexFormat,instanceSize:int = 1):
+        self.__registry = registry
+        self.__mesh = mesh
+        self.__vao = VertexArray(mode,mesh.indexCount,instanceSize)
+        self.__vao.setFormat(0,format)
+        self.__vao.setBuffer(0,mesh.vertexBuffer)
+        self.__vao.setIndexBuffer(mesh.indexBuffer,mesh.indexType)
+
+    def __del__(self):
+        self.release()
+
+    def __enter__(self):
+        if self.__mesh is None:
+            raise RuntimeError
+        return self.__vao.__enter__()
+
+    def __exit__(self,type,value,tb):
+        return self.__vao.__exit__(type,value,tb)
+
+    def key(self) -> str:
+        if self.__mesh is None:
+            raise RuntimeError
+        return self.__mesh.key
+
+    def vertexArray(self) -> VertexArray:
+        if self.__mesh is None:
+            raise RuntimeError
+        return self.__vao
+
+    def release(self) -> None:
+        if self.__mesh is not None:
+            self.__vao = None
+            self.__registry._release(self.__mesh)
+            self.__mesh = None
+
+
+class MeshRegistry:
+
+    def __init__(self,budget:int = BUDGET):
+        if budget < 0:
+            raise RuntimeError
+        self.__budget = budget
+        self.__meshes = {}
+        self.__unused = OrderedDict()
+        self.__handles = weakref.WeakSet()
+        self.__residentBytes = 0
+        self.__hitCount = 0
+        self.__missCount = 0
+
+    def __len__(self):
+        return len(self.__meshes)
+
+    def budget(self) -> int:
+        return self.__budget
+
+    def hitCount(self) -> int:
+        return self.__hitCount
+
+    def missCount(self) -> int:
+        return self.__missCount
+
+    def residentBytes(self) -> int:
+        return self.__residentBytes
+
+    def unusedCount(self) -> int:
+        return len(self.__unused)
+
+    def setBudget(self,budget:int) -> None:
+        if budget < 0:
+            raise RuntimeError
+        self.__budget = budget
+        self.__evict()
+
+    def acquire(self,floats,mode:glIntConstant,attributes:list,instanceSize:int = 1) -> MeshHandle:
+        floats = floatArray(floats)
+        format = VertexFormat.fromAttributes(attributes)
+        if (
+            not floats.size
+            or (format.stride()%4) != 0
+            or (floats.nbytes%format.stride()) != 0
+            ):
+            raise RuntimeError
+        key = hashlib.sha256(floats.tobytes())
+        key.update(format.stride().to_bytes(4,"little"))
+        key = key.hexdigest()
+        mesh = self.__meshes.get(key)
+        if mesh is None:
+            (vertices,indices) = weld(floats,format.stride()//4)
+            mesh = _Mesh(key,Buffer.fromFloats(vertices,GL_STATIC_DRAW),Buffer.fromData(indices,GL_STATIC_DRAW))
+            mesh.indexCount = indices.size
+            mesh.indexType = indexType(indices)
+            mesh.size = vertices.nbytes+indices.nbytes
+            self.__meshes[key] = mesh
+            self.__residentBytes += mesh.size
+            self.__missCount += 1
+        else:
+            self.__unused.pop(key,None)
+            self.__hitCount += 1
+        mesh.references += 1
+        ret = MeshHandle(self,mesh,mode,format,instanceSize)
+        self.__handles.add(ret)
+        return ret
+
+    def clear(self) -> None:
+        for key in list(self.__unused):
+            self.__drop(key)
+        self.__unused.clear()
+
+    def release(self) -> None:
+        for handle in list(self.__handles):
+            handle.release()
+        self.__handles.clear()
+        for key in list(self.__meshes):
+            self.__drop(key)
+        self.__unused.clear()
+
+    def _release(self,mesh) -> None:
+        mesh.references -= 1
+        if mesh.references == 0:
+            self.__unused[mesh.key] = mesh
+            self.__evict()
+
+    def __drop(self,key:str) -> None:
+        mesh = self.__meshes.pop(key)
+        self.__residentBytes -= mesh.size
+        mesh.vertexBuffer = None
+        mesh.indexBuffer = None
+
+    def __evict(self) -> None:
+        while (
+            self.__residentBytes > self.__budget
+            and self.__unused
+            ):
+            (key,mesh) = self.__unused.popitem(last=False)
+            self.__drop(key)
+
+
+class _Mesh:
+
+    def __init__(self,key:str,vertexBuffer:Buffer,indexBuffer:Buffer):
+        self.key = key
+        self.vertexBuffer = vertexBuffer
+        self.indexBuffer = indexBuffer
+        self.indexCount = 0
+        self.indexType = None
+        self.size = 0
+        self.references = 0
+
+
+_registries = {}
+
+
+def meshRegistry() -> MeshRegistry:
+    context = QOpenGLContext.currentContext()
+    ret = _registries.get(context)
+    if ret is None:
+        ret = MeshRegistry()
+        _registries[context] = ret
+        if context is not None:
+            context.aboutToBeDestroyed.connect(lambda: _releaseRegistry(context),Qt.DirectConnection)
+    return ret
+
+
+def _releaseRegistry(context:QOpenGLContext) -> None:
+    registry = _registries.pop(context,None)
+    if registry is not None:
+        registry.release()
@@ -0,0 +1,142 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from OpenGL.constant import IntConstant as glIntConstant
+from ctypes import Array as cArray
+from ctypes import Structure as cStructure
+from ctypes import sizeof
+from opengl import Buffer
+from opengl.memory import byteView
+
+
+class MirroredStruct:
+
+    def __init__(self,data,usage:glIntConstant = GL_DYNAMIC_DRAW,mergeGap:int = 0):
+        if mergeGap < 0:
+            raise RuntimeError
+        self.__data = data
+        self.__size = sizeof(data)
+        self.__buffer = Buffer.fromData(data,usage)
+        self.__mergeGap = mergeGap
+        self.__dirty = []
+        self.__flushCount = 0
+        self.__uploadCount = 0
+        self.__uploadedBytes = 0
+
+    def buffer(self) -> Buffer:
+        return self.__buffer
+
+    def value(self):
+        return _View(self,self.__data,0)
+
+    def flushCount(self) -> int:
+        return self.__flushCount
+
+    def uploadCount(self) -> int:
+        return self.__uploadCount
+
+    def uploadedBytes(self) -> int:
+        return self.__uploadedBytes
+
+    def savedBytes(self) -> int:
+        return self.__flushCount*self.__size-self.__uploadedBytes
+
+    def resetCounters(self) -> None:
+        self.__flushCount = 0
+        self.__uploadCount = 0
+        self.__uploadedBytes = 0
+
+    def markDirty(self,offset:int,size:int) -> None:
+        if (
+            offset < 0
+            or size <= 0
+            or offset+size > self.__size
+            ):
+            raise RuntimeError
+        self.__dirty.append((offset,offset+size))
+
+    def markAll(self) -> None:
+        self.markDirty(0,self.__size)
+
+    def flush(self) -> None:
+        if not self.__dirty:
+            return
+        ranges = sorted(self.__dirty)
+        self.__dirty = []
+        view = byteView(self.__data)
+        (start,end) = ranges[0]
+        for (s,e) in ranges[1:]:
+            if s <= end+self.__mergeGap:
+                end = max(end,e)
+            else:
+                self.__upload(view,start,end)
+                (start,end) = (s,e)
+        self.__upload(view,start,end)
+        self.__flushCount += 1
+
+    def __upload(self,view,start:int,end:int) -> None:
+        self.__buffer.write(start,view[start:end])
+        self.__uploadCount += 1
+        self.__uploadedBytes += end-start
+
+
+class _View:
+
+    def __init__(self,mirror:MirroredStruct,target,offset:int):
+        object.__setattr__(self,"_mirror",mirror)
+        object.__setattr__(self,"_target",target)
+        object.__setattr__(self,"_offset",offset)
+
+    def __getattr__(self,name:str):
+        value = getattr(self._target,name)
+        if isinstance(value,(cArray,cStructure)):
+            return _View(self._mirror,value,self._offset+self.__field(name).offset)
+        return value
+
+    def __setattr__(self,name:str,value) -> None:
+        field = self.__field(name)
+        setattr(self._target,name,value)
+        self._mirror.markDirty(self._offset+field.offset,field.size)
+
+    def __len__(self):
+        return len(self._target)
+
+    def __iter__(self):
+        for i in range(len(self._target)):
+            yield self[i]
+
+    def __getitem__(self,index:int):
+        value = self._target[index]
+        if isinstance(value,(cArray,cStructure)):
+            return _View(self._mirror,value,self._offset+self.__index(index)*sizeof(self._target._type_))
+        return value
+
+    def __setitem__(self,index,value) -> None:
+        self._target[index] = value
+        size = sizeof(self._target._type_)
+        if isinstance(index,slice):
+            indices = range(len(self._target))[index]
+            if not indices:
+                return
+            first = min(indices[0],indices[-1])
+            last = max(indices[0],indices[-1])
+            self._mirror.markDirty(self._offset+first*size,(last-first+1)*size)
+        else:
+            self._mirror.markDirty(self._offset+self.__index(index)*size,size)
+
+    def __field(self,name:str):
+        ret = getattr(type(self._target),name,None)
+        if (
+            not isinstance(self._target,cStructure)
+            or not hasattr(ret,"offset")
+            ):
+            raise RuntimeError
+        return ret
+
+    def __index(self,index:int) -> int:
+        if index < 0:
+            index += len(self._target)
+        if (
+            index < 0
+            or index >= len(self._target)
+            ):
+            raise RuntimeError
+        return index
@@ -0,0 +1,115 @@
+from OpenGL.GL import GL_LINK_STATUS
+from OpenGL.GL import GL_NUM_PROGRAM_BINARY_FORMATS
+from OpenGL.GL import GL_PROGRAM_BINARY_FORMATS
+from OpenGL.GL import GL_PROGRAM_BINARY_LENGTH
+from OpenGL.GL import GL_RENDERER
+from OpenGL.GL import GL_VENDOR
+from OpenGL.GL import GL_VERSION
+from OpenGL.GL import glGetIntegerv
+from OpenGL.GL import glGetProgramBinary
+from OpenGL.GL import glGetProgramiv
+from OpenGL.GL import glGetString
+from OpenGL.GL import glProgramBinary
+from pathlib import Path
+import hashlib
+import numpy
+import os
+import struct
+
+HEADER = struct.Struct("<4sI")
+MAGIC = b"OGPB"
+
+
+class ProgramCache:
+
+    def __init__(self,directory):
+        self.__directory = Path(directory)
+        self.__driver = None
+        self.__hitCount = 0
+        self.__missCount = 0
+        self.__rejectCount = 0
+
+    def directory(self) -> Path:
+        return self.__directory
+
+    def hitCount(self) -> int:
+        return self.__hitCount
+
+    def missCount(self) -> int:
+        return self.__missCount
+
+    def rejectCount(self) -> int:
+        return self.__rejectCount
+
+    def resetCounters(self) -> None:
+        self.__hitCount = 0
+        self.__missCount = 0
+        self.__rejectCount = 0
+
+    def key(self,stages:list):
+        if self.__driver is None:
+            self.__driver = b""
+            count = int(glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS))
+            if count:
+                formats = numpy.zeros(count,numpy.int32)
+                glGetIntegerv(GL_PROGRAM_BINARY_FORMATS,formats)
+                strings = [glGetString(n) or b"" for n in (GL_VENDOR,GL_RENDERER,GL_VERSION)]
+                self.__driver = b"\0".join(strings)+formats.tobytes()
+        if not self.__driver:
+            return None
+        ret = hashlib.sha256(self.__driver)
+        for (type,source) in stages:
+            ret.update(struct.pack("<IQ",int(type),len(source)))
+            ret.update(source.encode())
+        return ret.hexdigest()
+
+    def load(self,program:int,key:str) -> bool:
+        path = self.__path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.__missCount += 1
+            return False
+        if len(data) > HEADER.size:
+            (magic,format) = HEADER.unpack_from(data)
+            if magic == MAGIC:
+                binary = numpy.frombuffer(data,numpy.uint8,offset=HEADER.size)
+                glProgramBinary(program,format,binary,binary.size)
+                if glGetProgramiv(program,GL_LINK_STATUS):
+                    self.__hitCount += 1
+                    return True
+        self.__rejectCount += 1
+        self.__missCount += 1
+        path.unlink(missing_ok=True)
+        return False
+
+    def store(self,program:int,key:str) -> None:
+        size = int(glGetProgramiv(program,GL_PROGRAM_BINARY_LENGTH))
+        if size <= 0:
+            return
+        binary = numpy.zeros(size,numpy.uint8)
+        length = numpy.zeros(1,numpy.int32)
+        format = numpy.zeros(1,numpy.uint32)
+        glGetProgramBinary(program,size,length,format,binary)
+        path = self.__path(key)
+        path.parent.mkdir(parents=True,exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        with open(temporary,"wb") as file:
+            file.write(HEADER.pack(MAGIC,int(format[0])))
+            file.write(binary[:int(length[0])].tobytes())
+        os.replace(temporary,path)
+
+    def __path(self,key:str) -> Path:
+        return self.__directory/(key+".bin")
+
+
+_cache = None
+
+
+def programCache() -> ProgramCache:
+    return _cache
+
+
+def setProgramCache(cache:ProgramCache) -> None:
+    global _cache
+    _cache = cache
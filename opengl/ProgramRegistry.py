@@ -0,0 +1,215 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QOpenGLContext
+from collections import OrderedDict
+from concurrent.futures import Future
+from opengl.program import Program
+from opengl.program import Shader
+import weakref
+
+RETAIN_COUNT = 16
+
+
+class ProgramHandle:
+
+    def __init__(self,registry,entry):
+        self.__registry = registry
+        self.__entry = entry
+
+    def __del__(self):
+        self.release()
+
+    def __enter__(self):
+        if self.__entry is None:
+            raise RuntimeError
+        return self.__entry.program.__enter__()
+
+    def __exit__(self,type,value,tb):
+        return self.__entry.program.__exit__(type,value,tb)
+
+    def key(self) -> tuple:
+        if self.__entry is None:
+            raise RuntimeError
+        return self.__entry.key
+
+    def future(self) -> Future:
+        return self.program().future()
+
+    def isReady(self) -> bool:
+        return self.program().isReady()
+
+    def program(self) -> Program:
+        if self.__entry is None:
+            raise RuntimeError
+        return self.__entry.program
+
+    def release(self) -> None:
+        if self.__entry is not None:
+            self.__registry._release(self.__entry)
+            self.__entry = None
+
+    def wait(self) -> None:
+        self.program().wait()
+
+
+class ProgramRegistry:
+
+    def __init__(self,retainCount:int = RETAIN_COUNT):
+        if retainCount < 0:
+            raise RuntimeError
+        self.__retainCount = retainCount
+        self.__shaders = {}
+        self.__programs = {}
+        self.__unused = OrderedDict()
+        self.__handles = weakref.WeakSet()
+        self.__hitCount = 0
+        self.__missCount = 0
+
+    def __len__(self):
+        return len(self.__programs)
+
+    def hitCount(self) -> int:
+        return self.__hitCount
+
+    def missCount(self) -> int:
+        return self.__missCount
+
+    def retainCount(self) -> int:
+        return self.__retainCount
+
+    def shaderCount(self) -> int:
+        return len(self.__shaders)
+
+    def unusedCount(self) -> int:
+        return len(self.__unused)
+
+    def setRetainCount(self,retainCount:int) -> None:
+        if retainCount < 0:
+            raise RuntimeError
+        self.__retainCount = retainCount
+        self.__evict()
+
+    def acquire(self,*stages,wait:bool = True) -> ProgramHandle:
+        if not stages:
+            raise RuntimeError
+        stages = [s if isinstance(s,Shader) else Shader(*s) for s in stages]
+        keys = tuple(sorted({_shaderKey(s) for s in stages}))
+        entry = self.__programs.get(keys)
+        if entry is None:
+            shaders = []
+            for s in stages:
+                key = _shaderKey(s)
+                if key not in self.__shaders:
+                    self.__shaders[key] = _Shader(key,s)
+                shaders.append(self.__shaders[key])
+            try:
+                entry = _Program(keys,Program(*[s.shader for s in shaders],wait=wait))
+            except RuntimeError:
+                self.__dropShaders(keys)
+                raise
+            for key in keys:
+                self.__shaders[key].references += 1
+            self.__programs[keys] = entry
+            entry.program.future().add_done_callback(lambda future: self.__discard(entry,future))
+            self.__missCount += 1
+        else:
+            self.__unused.pop(keys,None)
+            self.__hitCount += 1
+        entry.references += 1
+        ret = ProgramHandle(self,entry)
+        self.__handles.add(ret)
+        return ret
+
+    def clear(self) -> None:
+        for keys in list(self.__unused):
+            self.__drop(keys)
+        self.__unused.clear()
+
+    def release(self) -> None:
+        for handle in list(self.__handles):
+            handle.release()
+        self.__handles.clear()
+        for keys in list(self.__programs):
+            self.__drop(keys)
+        self.__unused.clear()
+        self.__shaders.clear()
+
+    def _release(self,entry) -> None:
+        entry.references -= 1
+        if (
+            entry.references == 0
+            and self.__programs.get(entry.key) is entry
+            ):
+            self.__unused[entry.key] = entry
+            self.__evict()
+
+    def __discard(self,entry,future:Future) -> None:
+        if (
+            future.exception() is not None
+            and self.__programs.get(entry.key) is entry
+            ):
+            del self.__programs[entry.key]
+            self.__unused.pop(entry.key,None)
+            for key in entry.key:
+                self.__shaders[key].references -= 1
+            self.__dropShaders(entry.key)
+
+    def __drop(self,keys:tuple) -> None:
+        entry = self.__programs.pop(keys)
+        entry.program = None
+        for key in keys:
+            self.__shaders[key].references -= 1
+        self.__dropShaders(keys)
+
+    def __dropShaders(self,keys:tuple) -> None:
+        for key in keys:
+            entry = self.__shaders.get(key)
+            if (
+                entry is not None
+                and entry.references == 0
+                ):
+                del self.__shaders[key]
+
+    def __evict(self) -> None:
+        while len(self.__unused) > self.__retainCount:
+            (keys,entry) = self.__unused.popitem(last=False)
+            self.__drop(keys)
+
+
+class _Program:
+
+    def __init__(self,key:tuple,program:Program):
+        self.key = key
+        self.program = program
+        self.references = 0
+
+
+class _Shader:
+
+    def __init__(self,key:tuple,shader:Shader):
+        self.key = key
+        self.shader = shader
+        self.references = 0
+
+
+def _shaderKey(shader:Shader) -> tuple:
+    return (int(shader.type()),shader.digest())
+
+
+_registries = {}
+
+
+def programRegistry() -> ProgramRegistry:
+    context = QOpenGLContext.currentContext()
+    ret = _registries.get(context)
+    if ret is None:
+        ret = ProgramRegistry()
+        _registries[context] = ret
+        if context is not None:
+            context.aboutToBeDestroyed.connect(lambda: _releaseRegistry(context),Qt.DirectConnection)
+    return ret
+
+
+def _releaseRegistry(context:QOpenGLContext) -> None:
+    registry = _registries.pop(context,None)
+    if registry is not None:
+        registry.release()
@@ -0,0 +1,101 @@
+from opengl.program import Shader
+from opengl.ProgramRegistry import ProgramHandle
+from opengl.ProgramRegistry import programRegistry
+from pathlib import Path
+import hashlib
+import re
+
+DEFAULT_DIRECTORY = Path(__file__).resolve().parent.parent/"shaders"
+INCLUDE = re.compile(r'^\s*#\s*include\s+[<"]([^>"]+)[>"]\s*$')
+VERSION = re.compile(r'^\s*#\s*version\b')
+
+
+class ShaderLibrary:
+
+    def __init__(self,*directories):
+        self.__directories = [Path(d) for d in directories]
+        self.__files = {}
+        self.__variants = {}
+
+    def directories(self) -> list:
+        return list(self.__directories)
+
+    def variantCount(self) -> int:
+        return len(self.__variants)
+
+    def addDirectory(self,directory) -> None:
+        self.__directories.append(Path(directory))
+        self.__files.clear()
+        self.__variants.clear()
+
+    def acquire(self,*stages,defines:dict = None,wait:bool = True) -> ProgramHandle:
+        return programRegistry().acquire(
+            *[s if isinstance(s,Shader) else (self.preprocess(s[0],defines),s[1]) for s in stages]
+            ,wait=wait
+            )
+
+    def file(self,name:str) -> tuple:
+        ret = self.__files.get(name)
+        if ret is None:
+            for directory in self.__directories:
+                path = directory/name
+                if path.is_file():
+                    ret = (path.resolve(),path.read_text())
+                    break
+            else:
+                raise RuntimeError
+            self.__files[name] = ret
+        return ret
+
+    def preprocess(self,source:str,defines:dict = None) -> str:
+        defines = tuple(sorted((str(n),_value(v)) for (n,v) in (defines or {}).items()))
+        key = (hashlib.sha256(source.encode()).hexdigest(),defines)
+        ret = self.__variants.get(key)
+        if ret is None:
+            lines = self.__expand(source,set())
+            header = [f"#define {n} {v}" for (n,v) in defines]
+            if lines and VERSION.match(lines[0]):
+                lines[1:1] = header+["#line 2"]
+            else:
+                lines[0:0] = header+["#line 1"]
+            ret = "\n".join(lines)+"\n"
+            self.__variants[key] = ret
+        return ret
+
+    def __expand(self,source:str,included:set) -> list:
+        ret = []
+        for (i,line) in enumerate(source.splitlines()):
+            match = INCLUDE.match(line)
+            if match is None:
+                ret.append(line)
+                continue
+            (path,text) = self.file(match.group(1))
+            if path not in included:
+                included.add(path)
+                ret.append("#line 1")
+                ret.extend(self.__expand(text,included))
+            ret.append(f"#line {i+2}")
+        return ret
+
+
+def _value(value) -> str:
+    if isinstance(value,bool):
+        return "1" if value else "0"
+    if isinstance(value,float):
+        return repr(value)
+    return str(value)
+
+
+_library = None
+
+
+def shaderLibrary() -> ShaderLibrary:
+    global _library
+    if _library is None:
+        _library = ShaderLibrary(DEFAULT_DIRECTORY)
+    return _library
+
+
+def setShaderLibrary(library:ShaderLibrary) -> None:
+    global _library
+    _library = library
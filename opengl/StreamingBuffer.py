@@ -0,0 +1,144 @@
+from OpenGL.GL import GL_ALREADY_SIGNALED
+from OpenGL.GL import GL_CONDITION_SATISFIED
+from OpenGL.GL import GL_MAP_COHERENT_BIT
+from OpenGL.GL import GL_MAP_PERSISTENT_BIT
+from OpenGL.GL import GL_MAP_WRITE_BIT
+from OpenGL.GL import GL_SHADER_STORAGE_BUFFER
+from OpenGL.GL import GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT
+from OpenGL.GL import GL_SYNC_FLUSH_COMMANDS_BIT
+from OpenGL.GL import GL_SYNC_GPU_COMMANDS_COMPLETE
+from OpenGL.GL import GL_UNIFORM_BUFFER
+from OpenGL.GL import GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT
+from OpenGL.GL import GL_WAIT_FAILED
+from OpenGL.GL import glBindBufferRange
+from OpenGL.GL import glClientWaitSync
+from OpenGL.GL import glCopyNamedBufferSubData
+from OpenGL.GL import glCreateBuffers
+from OpenGL.GL import glDeleteBuffers
+from OpenGL.GL import glDeleteSync
+from OpenGL.GL import glFenceSync
+from OpenGL.GL import glGetIntegerv
+from OpenGL.GL import glMapNamedBufferRange
+from OpenGL.GL import glNamedBufferStorage
+from OpenGL.GL import glUnmapNamedBuffer
+from ctypes import c_uint
+from ctypes import memmove
+from opengl.memory import byteView
+
+WAIT_TIMEOUT = 1000000000
+
+
+class StreamingBuffer:
+
+    def __init__(self,size:int,sliceCount:int = 3):
+        if (
+            size <= 0
+            or sliceCount <= 0
+            ):
+            raise RuntimeError
+        alignment = max(
+            int(glGetIntegerv(GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+            ,int(glGetIntegerv(GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT))
+            )
+        self.__size = size
+        self.__sliceSize = ((size+alignment-1)//alignment)*alignment
+        self.__sliceCount = sliceCount
+        self.__slice = 0
+        self.__fences = [None]*sliceCount
+        self.__active = False
+        id = c_uint()
+        glCreateBuffers(1,id)
+        self.__id = id.value
+        flags = GL_MAP_WRITE_BIT|GL_MAP_PERSISTENT_BIT|GL_MAP_COHERENT_BIT
+        glNamedBufferStorage(self.__id,self.__sliceSize*sliceCount,None,flags)
+        self.__address = glMapNamedBufferRange(self.__id,0,self.__sliceSize*sliceCount,flags)
+        if not self.__address:
+            glDeleteBuffers(1,(self.__id,))
+            raise RuntimeError
+
+    def __del__(self):
+        for fence in self.__fences:
+            if fence is not None:
+                glDeleteSync(fence)
+        glUnmapNamedBuffer(self.__id)
+        glDeleteBuffers(1,(self.__id,))
+
+    def __enter__(self):
+        self.__wait(self.__slice)
+        self.__active = True
+        return self
+
+    def __exit__(self,type,value,tb):
+        self.__active = False
+        self.__fences[self.__slice] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE,0)
+        self.__slice = (self.__slice+1)%self.__sliceCount
+        return False
+
+    def id(self):
+        return self.__id
+
+    def offset(self) -> int:
+        return self.__slice*self.__sliceSize
+
+    def size(self) -> int:
+        return self.__size
+
+    def write(self,offset:int,data) -> None:
+        view = byteView(data)
+        if (
+            not self.__active
+            or offset < 0
+            or view.nbytes <= 0
+            or offset+view.nbytes > self.__size
+            ):
+            raise RuntimeError
+        memmove(self.__address+self.offset()+offset,view.ctypes.data,view.nbytes)
+
+    def copyTo(
+        self
+        ,destination
+        ,sourceOffset:int = 0
+        ,destinationOffset:int = 0
+        ,size:int = 0
+        ) -> None:
+        if size == 0:
+            size = self.__size-sourceOffset
+        if (
+            not self.__active
+            or sourceOffset < 0
+            or destinationOffset < 0
+            or size <= 0
+            or sourceOffset+size > self.__size
+            or destinationOffset+size > destination.size()
+            ):
+            raise RuntimeError
+        glCopyNamedBufferSubData(
+            self.__id
+            ,destination.id()
+            ,self.offset()+sourceOffset
+            ,destinationOffset
+            ,size
+            )
+
+    def bindToShaderStorage(self,index:int) -> None:
+        if index < 0:
+            raise RuntimeError
+        glBindBufferRange(GL_SHADER_STORAGE_BUFFER,index,self.__id,self.offset(),self.__size)
+
+    def bindToUniform(self,index:int) -> None:
+        if index < 0:
+            raise RuntimeError
+        glBindBufferRange(GL_UNIFORM_BUFFER,index,self.__id,self.offset(),self.__size)
+
+    def __wait(self,slice:int) -> None:
+        fence = self.__fences[slice]
+        if fence is None:
+            return
+        while True:
+            result = glClientWaitSync(fence,GL_SYNC_FLUSH_COMMANDS_BIT,WAIT_TIMEOUT)
+            if result in (GL_ALREADY_SIGNALED,GL_CONDITION_SATISFIED):
+                break
+            if result == GL_WAIT_FAILED:
+                raise RuntimeError
+        glDeleteSync(fence)
+        self.__fences[slice] = None
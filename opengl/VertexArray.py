@@ -1,66 +1,96 @@
-from OpenGL.GL import GL_ARRAY_BUFFER
-from OpenGL.GL import GL_FALSE
+from OpenGL.GL import GL_DRAW_INDIRECT_BUFFER
+from OpenGL.GL import GL_PARAMETER_BUFFER
 from OpenGL.GL import GL_STATIC_DRAW
+from OpenGL.GL import glBindBuffer
 from OpenGL.GL import glBindVertexArray
+from OpenGL.GL import glCreateVertexArrays
 from OpenGL.GL import glDeleteVertexArrays
 from OpenGL.GL import glDrawArrays
 from OpenGL.GL import glDrawArraysInstanced
-from OpenGL.GL import glEnableVertexAttribArray
-from OpenGL.GL import glGenVertexArrays
-from OpenGL.GL import glVertexAttribDivisor
-from OpenGL.GL import glVertexAttribPointer
+from OpenGL.GL import glDrawElements
+from OpenGL.GL import glDrawElementsInstanced
+from OpenGL.GL import glMultiDrawArraysIndirect
+from OpenGL.GL import glMultiDrawArraysIndirectCount
+from OpenGL.GL import glMultiDrawElementsIndirect
+from OpenGL.GL import glMultiDrawElementsIndirectCount
+from OpenGL.GL import glVertexArrayElementBuffer
+from OpenGL.GL import glVertexArrayVertexBuffer
 from OpenGL.constant import IntConstant as glIntConstant
+from ctypes import c_uint
 from ctypes import c_void_p
 from opengl import Buffer
+from opengl.memory import byteView
+from opengl.memory import floatArray
+from opengl.mesh import compactIndices
+from opengl.mesh import indexType
+from opengl.mesh import weld
+from opengl.VertexFormat import VertexFormat
 
 
 class VertexArray:
 
     @staticmethod
-    def fromFloats(floats:list,mode:glIntConstant,attributes:list,instanceSize:int = 1):
+    def fromData(data,mode:glIntConstant,format:VertexFormat,instanceSize:int = 1):
+        size = byteView(data).nbytes
         if (
-            not floats
-            or not attributes
+            not size
+            or (size%format.stride()) != 0
             ):
             raise RuntimeError
-        stride = None
-        for a in attributes:
-            if (
-                len(a) < 5
-                or len(a) > 6
-                ):
-                raise RuntimeError
-            if stride is None:
-                stride = a[3]
-            elif stride != a[3]:
-                raise RuntimeError
-        if ((4*len(floats))%stride) != 0:
+        ret = VertexArray(mode,size//format.stride(),instanceSize)
+        ret.setFormat(0,format)
+        ret.setBuffer(0,Buffer.fromData(data,GL_STATIC_DRAW))
+        return ret
+
+    @staticmethod
+    def fromFloats(floats,mode:glIntConstant,attributes:list,instanceSize:int = 1):
+        return VertexArray.fromData(floatArray(floats),mode,VertexFormat.fromAttributes(attributes),instanceSize)
+
+    @staticmethod
+    def fromIndexedFloats(floats,indices,mode:glIntConstant,attributes:list,instanceSize:int = 1):
+        floats = floatArray(floats)
+        indices = compactIndices(indices)
+        if (
+            not floats.size
+            or not indices.size
+            ):
             raise RuntimeError
-        size = (4*len(floats))//stride
-        buffer = Buffer.fromFloats(floats,GL_STATIC_DRAW)
-        buffer.bind(GL_ARRAY_BUFFER)
-        ret = VertexArray(mode,size,instanceSize,attributes)
-        ret.__buffer = buffer
+        format = VertexFormat.fromAttributes(attributes)
+        if (floats.nbytes%format.stride()) != 0:
+            raise RuntimeError
+        ret = VertexArray(mode,indices.size,instanceSize)
+        ret.setFormat(0,format)
+        ret.setBuffer(0,Buffer.fromFloats(floats,GL_STATIC_DRAW))
+        ret.setIndexBuffer(Buffer.fromData(indices,GL_STATIC_DRAW),indexType(indices))
         return ret
 
+    @staticmethod
+    def fromWeldedFloats(floats,mode:glIntConstant,attributes:list,instanceSize:int = 1):
+        format = VertexFormat.fromAttributes(attributes)
+        if (format.stride()%4) != 0:
+            raise RuntimeError
+        (vertices,indices) = weld(floatArray(floats),format.stride()//4)
+        return VertexArray.fromIndexedFloats(vertices,indices,mode,attributes,instanceSize)
+
     def __init__(self,mode:glIntConstant,size:int,instanceSize:int = 1,attributes:list = []):
         if (
             size <= 0
             or instanceSize <= 0
             ):
             raise RuntimeError
-        self.__id = glGenVertexArrays(1)
+        id = c_uint()
+        glCreateVertexArrays(1,id)
+        self.__id = id.value
         self.__mode = mode
         self.__size = size
         self.__instanceSize = instanceSize
         self.__active = False
+        self.__formats = {}
+        self.__buffers = {}
+        self.__indexBuffer = None
+        self.__indexType = None
         if attributes:
-            self.__active = True
-            glBindVertexArray(self.__id)
-            for a in attributes:
-                self.add(*a)
-            glBindVertexArray(0)
-            self.__active = False
+            self.setFormat(0,VertexFormat.fromAttributes(attributes))
 
     def __del__(self):
         glDeleteVertexArrays(1,(self.__id,))
@@ -75,25 +105,47 @@ class VertexArray:
         glBindVertexArray(0)
         return False
 
-    def add(
-        self
-        ,location:int
-        ,size:int
-        ,type:glIntConstant
-        ,stride:int
-        ,offset:int
-        ,divisor:int = 0
-        ) -> None:
+    def id(self):
+        return self.__id
+
+    def format(self,binding:int) -> VertexFormat:
+        return self.__formats.get(binding)
+
+    def buffer(self,binding:int) -> Buffer:
+        return self.__buffers.get(binding,(None,0))[0]
+
+    def indexBuffer(self) -> Buffer:
+        return self.__indexBuffer
+
+    def instanceSize(self) -> int:
+        return self.__instanceSize
+
+    def setInstanceSize(self,size:int) -> None:
+        if size <= 0:
+            raise RuntimeError
+        self.__instanceSize = size
+
+    def setIndexBuffer(self,buffer:Buffer,type:glIntConstant) -> None:
+        glVertexArrayElementBuffer(self.__id,buffer.id())
+        self.__indexBuffer = buffer
+        self.__indexType = type
+
+    def setFormat(self,binding:int,format:VertexFormat) -> None:
+        if binding < 0:
+            raise RuntimeError
+        format.apply(self.__id,binding)
+        self.__formats[binding] = format
+        if binding in self.__buffers:
+            self.setBuffer(binding,*self.__buffers[binding])
+
+    def setBuffer(self,binding:int,buffer:Buffer,offset:int = 0) -> None:
         if (
-            not self.__active
-            or location == -1
-            or divisor < 0
+            binding not in self.__formats
+            or offset < 0
             ):
             raise RuntimeError
-        glEnableVertexAttribArray(location)
-        glVertexAttribPointer(location,size,type,GL_FALSE,stride,c_void_p(offset))
-        if divisor > 0:
-            glVertexAttribDivisor(location,divisor)
+        glVertexArrayVertexBuffer(self.__id,binding,buffer.id(),offset,self.__formats[binding].stride())
+        self.__buffers[binding] = (buffer,offset)
 
     def draw(self,count:int = 0,mode = None) -> None:
         if (
@@ -102,7 +154,15 @@ class VertexArray:
             or count > self.__size
             ):
             raise RuntimeError
-        glDrawArrays(self.__mode if mode is None else mode,0,count if count else self.__size)
+        if self.__indexType is None:
+            glDrawArrays(self.__mode if mode is None else mode,0,count if count else self.__size)
+        else:
+            glDrawElements(
+                self.__mode if mode is None else mode
+                ,count if count else self.__size
+                ,self.__indexType
+                ,c_void_p(0)
+                )
 
     def drawInstanced(self,instanceCount:int = 0,count:int = 0,mode = None) -> None:
         if (
@@ -113,9 +173,81 @@ class VertexArray:
             or instanceCount > self.__instanceSize
             ):
             raise RuntimeError
-        glDrawArraysInstanced(
-            self.__mode if mode is None else mode
-            ,0
-            ,count if count else self.__size
-            ,instanceCount if instanceCount else self.__instanceSize
-            )
+        if self.__indexType is None:
+            glDrawArraysInstanced(
+                self.__mode if mode is None else mode
+                ,0
+                ,count if count else self.__size
+                ,instanceCount if instanceCount else self.__instanceSize
+                )
+        else:
+            glDrawElementsInstanced(
+                self.__mode if mode is None else mode
+                ,count if count else self.__size
+                ,self.__indexType
+                ,c_void_p(0)
+                ,instanceCount if instanceCount else self.__instanceSize
+                )
+
+    def multiDrawIndirect(self,commands:Buffer,drawCount:int,offset:int = 0,mode = None) -> None:
+        if (
+            not self.__active
+            or drawCount < 0
+            or offset < 0
+            ):
+            raise RuntimeError
+        if not drawCount:
+            return
+        commands.bind(GL_DRAW_INDIRECT_BUFFER)
+        if self.__indexType is None:
+            glMultiDrawArraysIndirect(self.__mode if mode is None else mode,c_void_p(offset),drawCount,0)
+        else:
+            glMultiDrawElementsIndirect(
+                self.__mode if mode is None else mode
+                ,self.__indexType
+                ,c_void_p(offset)
+                ,drawCount
+                ,0
+                )
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER,0)
+
+    def multiDrawIndirectCount(
+        self
+        ,commands:Buffer
+        ,counts:Buffer
+        ,maxDrawCount:int
+        ,offset:int = 0
+        ,countOffset:int = 0
+        ,mode = None
+        ) -> None:
+        if (
+            not self.__active
+            or maxDrawCount < 0
+            or offset < 0
+            or countOffset < 0
+            or (countOffset%4) != 0
+            ):
+            raise RuntimeError
+        if not maxDrawCount:
+            return
+        commands.bind(GL_DRAW_INDIRECT_BUFFER)
+        counts.bind(GL_PARAMETER_BUFFER)
+        if self.__indexType is None:
+            glMultiDrawArraysIndirectCount(
+                self.__mode if mode is None else mode
+                ,c_void_p(offset)
+                ,countOffset
+                ,maxDrawCount
+                ,0
+                )
+        else:
+            glMultiDrawElementsIndirectCount(
+                self.__mode if mode is None else mode
+                ,self.__indexType
+                ,c_void_p(offset)
+                ,countOffset
+                ,maxDrawCount
+                ,0
+                )
+        glBindBuffer(GL_PARAMETER_BUFFER,0)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER,0)
@@ -0,0 +1,125 @@
+from OpenGL.GL import GL_BGRA
+from OpenGL.GL import GL_BYTE
+from OpenGL.GL import GL_DOUBLE
+from OpenGL.GL import GL_FALSE
+from OpenGL.GL import GL_FLOAT
+from OpenGL.GL import GL_HALF_FLOAT
+from OpenGL.GL import GL_INT
+from OpenGL.GL import GL_INT_2_10_10_10_REV
+from OpenGL.GL import GL_SHORT
+from OpenGL.GL import GL_TRUE
+from OpenGL.GL import GL_UNSIGNED_BYTE
+from OpenGL.GL import GL_UNSIGNED_INT
+from OpenGL.GL import GL_UNSIGNED_INT_2_10_10_10_REV
+from OpenGL.GL import GL_UNSIGNED_SHORT
+from OpenGL.GL import glEnableVertexArrayAttrib
+from OpenGL.GL import glVertexArrayAttribBinding
+from OpenGL.GL import glVertexArrayAttribFormat
+from OpenGL.GL import glVertexArrayBindingDivisor
+import numpy
+
+ATTRIBUTE_TYPES = {
+    numpy.dtype("i1"): GL_BYTE
+    ,numpy.dtype("u1"): GL_UNSIGNED_BYTE
+    ,numpy.dtype("<i2"): GL_SHORT
+    ,numpy.dtype("<u2"): GL_UNSIGNED_SHORT
+    ,numpy.dtype("<i4"): GL_INT
+    ,numpy.dtype("<u4"): GL_UNSIGNED_INT
+    ,numpy.dtype("<f2"): GL_HALF_FLOAT
+    ,numpy.dtype("<f4"): GL_FLOAT
+    ,numpy.dtype("<f8"): GL_DOUBLE
+}
+
+
+class VertexFormat:
+
+    @staticmethod
+    def fromAttributes(attributes:list):
+        if not attributes:
+            raise RuntimeError
+        stride = None
+        divisor = None
+        for a in attributes:
+            if (
+                len(a) < 5
+                or len(a) > 6
+                ):
+                raise RuntimeError
+            if stride is None:
+                stride = a[3]
+                divisor = a[5] if len(a) == 6 else 0
+            elif (
+                stride != a[3]
+                or divisor != (a[5] if len(a) == 6 else 0)
+                ):
+                raise RuntimeError
+        return VertexFormat(stride,[(a[0],a[1],a[2],a[4]) for a in attributes],divisor)
+
+    @staticmethod
+    def fromDtype(dtype,locations:dict,divisor:int = 0,normalized:tuple = ()):
+        dtype = numpy.dtype(dtype)
+        attributes = []
+        for (name,location) in locations.items():
+            if (
+                dtype.fields is None
+                or name not in dtype.fields
+                ):
+                raise RuntimeError
+            if location == -1:
+                continue
+            (field,offset) = dtype.fields[name][:2]
+            size = int(numpy.prod(field.shape))
+            if (
+                field.base not in ATTRIBUTE_TYPES
+                or size < 1
+                or size > 4
+                ):
+                raise RuntimeError
+            attributes.append((location,size,ATTRIBUTE_TYPES[field.base],offset,name in normalized))
+        return VertexFormat(dtype.itemsize,attributes,divisor)
+
+    def __init__(self,stride:int,attributes:list,divisor:int = 0):
+        if (
+            stride <= 0
+            or divisor < 0
+            or not attributes
+            ):
+            raise RuntimeError
+        for a in attributes:
+            if (
+                len(a) < 4
+                or len(a) > 5
+                or a[0] == -1
+                or a[3] < 0
+                or (
+                    a[2] in (GL_INT_2_10_10_10_REV,GL_UNSIGNED_INT_2_10_10_10_REV)
+                    and a[1] not in (4,GL_BGRA)
+                    )
+                ):
+                raise RuntimeError
+        self.__stride = stride
+        self.__attributes = tuple((*a[:4],bool(a[4]) if len(a) == 5 else False) for a in attributes)
+        self.__divisor = divisor
+
+    def attributes(self) -> tuple:
+        return self.__attributes
+
+    def divisor(self) -> int:
+        return self.__divisor
+
+    def stride(self) -> int:
+        return self.__stride
+
+    def apply(self,vertexArray:int,binding:int) -> None:
+        for (location,size,type,offset,normalized) in self.__attributes:
+            glEnableVertexArrayAttrib(vertexArray,location)
+            glVertexArrayAttribFormat(
+                vertexArray
+                ,location
+                ,size
+                ,type
+                ,GL_TRUE if normalized else GL_FALSE
+                ,offset
+                )
+            glVertexArrayAttribBinding(vertexArray,location,binding)
+        glVertexArrayBindingDivisor(vertexArray,binding,self.__divisor)
@@ -1,7 +1,36 @@
 from opengl.Buffer import Buffer
+from opengl.Buffer import PendingRead
+from opengl.BufferArena import BufferArena
+from opengl.BufferArena import BufferRange
+from opengl.culling import Bvh
+from opengl.FrustumCuller import FrustumCuller
+from opengl.GpuVector import GpuVector
+from opengl.InstanceStream import InstanceStream
+from opengl.layout import BlockLayout
+from opengl.LodChain import LodChain
+from opengl.MeshBatch import MeshBatch
+from opengl.MeshRegistry import MeshHandle
+from opengl.MeshRegistry import MeshRegistry
+from opengl.MeshRegistry import meshRegistry
+from opengl.mesh import weld
+from opengl.meshfile import loadMesh
+from opengl.MirroredStruct import MirroredStruct
+from opengl.optimize import optimizeMesh
 from opengl.program import Program
 from opengl.program import Shader
+from opengl.ProgramCache import ProgramCache
+from opengl.ProgramCache import programCache
+from opengl.ProgramCache import setProgramCache
+from opengl.ProgramRegistry import ProgramHandle
+from opengl.ProgramRegistry import ProgramRegistry
+from opengl.ProgramRegistry import programRegistry
+from opengl.readback import readPixelsAsync
+from opengl.ShaderLibrary import ShaderLibrary
+from opengl.ShaderLibrary import setShaderLibrary
+from opengl.ShaderLibrary import shaderLibrary
+from opengl.StreamingBuffer import StreamingBuffer
 from opengl.texture import Texture1D
 from opengl.texture import Texture2D
 from opengl.texture import Texture2DArray
 from opengl.VertexArray import VertexArray
+from opengl.VertexFormat import VertexFormat
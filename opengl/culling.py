@@ -0,0 +1,166 @@
+from PySide6.QtGui import QMatrix4x4
+import numpy
+
+LEAF_SIZE = 16
+MORTON_BITS = 10
+
+
+def frustumPlanes(matrix:QMatrix4x4) -> numpy.ndarray:
+    m = numpy.array(matrix.data(),numpy.float64).reshape(4,4).T
+    ret = numpy.stack((m[3]+m[0],m[3]-m[0],m[3]+m[1],m[3]-m[1],m[3]+m[2],m[3]-m[2]))
+    return ret/numpy.linalg.norm(ret[:,:3],axis=1)[:,None]
+
+
+def classifyBoxes(planes,minimum,maximum) -> tuple:
+    planes = numpy.asarray(planes,numpy.float64)
+    centers = 0.5*(numpy.asarray(minimum)+numpy.asarray(maximum))
+    extents = 0.5*(numpy.asarray(maximum)-numpy.asarray(minimum))
+    distances = centers@planes[:,:3].T+planes[:,3]
+    reaches = extents@numpy.abs(planes[:,:3]).T
+    outside = ~(distances >= -reaches).all(axis=1)
+    inside = (distances >= reaches).all(axis=1)
+    return (outside,inside)
+
+
+def cullBoxes(planes,minimum,maximum) -> numpy.ndarray:
+    return numpy.flatnonzero(~classifyBoxes(planes,minimum,maximum)[0])
+
+
+def spheresToBoxes(spheres) -> tuple:
+    spheres = numpy.asarray(spheres,numpy.float32)
+    if spheres.ndim != 2 or spheres.shape[1] != 4:
+        raise RuntimeError
+    radii = spheres[:,3:]
+    return (spheres[:,:3]-radii,spheres[:,:3]+radii)
+
+
+class Bvh:
+
+    @staticmethod
+    def fromSpheres(spheres,leafSize:int = LEAF_SIZE):
+        return Bvh(*spheresToBoxes(spheres),leafSize)
+
+    def __init__(self,minimum,maximum,leafSize:int = LEAF_SIZE):
+        if leafSize <= 0:
+            raise RuntimeError
+        self.__leafSize = leafSize
+        self.rebuild(minimum,maximum)
+
+    def __len__(self):
+        return len(self.__order)
+
+    def depth(self) -> int:
+        return self.__depth
+
+    def nodeCount(self) -> int:
+        return len(self.__nodeMinimum)
+
+    def rebuild(self,minimum,maximum) -> None:
+        (minimum,maximum) = self.__bounds(minimum,maximum)
+        if not len(minimum):
+            raise RuntimeError
+        centers = 0.5*(minimum+maximum)
+        low = centers.min(axis=0)
+        scale = (1 << MORTON_BITS)-1
+        cells = ((centers-low)/numpy.maximum(centers.max(axis=0)-low,1e-30)*scale).astype(numpy.uint64)
+        self.__order = numpy.argsort(_morton(cells),kind="stable")
+        self.__slots = numpy.empty(len(self.__order),numpy.int64)
+        self.__slots[self.__order] = numpy.arange(len(self.__order))
+        leafCount = (len(self.__order)+self.__leafSize-1)//self.__leafSize
+        self.__depth = max(int(leafCount-1).bit_length(),0)
+        self.__nodeMinimum = numpy.full(((2 << self.__depth)-1,3),numpy.nan,numpy.float32)
+        self.__nodeMaximum = numpy.full(((2 << self.__depth)-1,3),numpy.nan,numpy.float32)
+        self.__minimum = minimum[self.__order]
+        self.__maximum = maximum[self.__order]
+        self.__refitLeaves(numpy.arange(leafCount))
+
+    def refit(self,minimum,maximum,indices = None) -> None:
+        if indices is None:
+            (minimum,maximum) = self.__bounds(minimum,maximum)
+            if len(minimum) != len(self.__order):
+                raise RuntimeError
+            self.__minimum = minimum[self.__order]
+            self.__maximum = maximum[self.__order]
+            self.__refitLeaves(numpy.arange((len(self.__order)+self.__leafSize-1)//self.__leafSize))
+            return
+        indices = numpy.asarray(indices,numpy.int64).ravel()
+        (minimum,maximum) = self.__bounds(minimum,maximum)
+        if (
+            len(minimum) != len(indices)
+            or (
+                indices.size
+                and (
+                    indices.min() < 0
+                    or indices.max() >= len(self.__order)
+                    )
+                )
+            ):
+            raise RuntimeError
+        if not indices.size:
+            return
+        slots = self.__slots[indices]
+        self.__minimum[slots] = minimum
+        self.__maximum[slots] = maximum
+        self.__refitLeaves(numpy.unique(slots//self.__leafSize))
+
+    def cull(self,planes) -> numpy.ndarray:
+        if isinstance(planes,QMatrix4x4):
+            planes = frustumPlanes(planes)
+        starts = []
+        ends = []
+        nodes = numpy.zeros(1,numpy.int64)
+        for level in range(self.__depth+1):
+            (outside,inside) = classifyBoxes(planes,self.__nodeMinimum[nodes],self.__nodeMaximum[nodes])
+            span = 1 << (self.__depth-level)
+            accepted = nodes[inside]-((1 << level)-1)
+            starts.append(accepted*span*self.__leafSize)
+            ends.append((accepted+1)*span*self.__leafSize)
+            nodes = nodes[~outside&~inside]
+            if level < self.__depth:
+                nodes = numpy.stack((2*nodes+1,2*nodes+2),1).ravel()
+        leaves = nodes-((1 << self.__depth)-1)
+        slots = _ranges(leaves*self.__leafSize,(leaves+1)*self.__leafSize,len(self.__order))
+        (outside,inside) = classifyBoxes(planes,self.__minimum[slots],self.__maximum[slots])
+        slots = numpy.concatenate((
+            _ranges(numpy.concatenate(starts),numpy.concatenate(ends),len(self.__order))
+            ,slots[~outside]
+            ))
+        return self.__order[slots]
+
+    def __bounds(self,minimum,maximum) -> tuple:
+        minimum = numpy.asarray(minimum,numpy.float32).reshape(-1,3)
+        maximum = numpy.asarray(maximum,numpy.float32).reshape(-1,3)
+        if minimum.shape != maximum.shape:
+            raise RuntimeError
+        return (minimum,maximum)
+
+    def __refitLeaves(self,leaves:numpy.ndarray) -> None:
+        starts = leaves*self.__leafSize
+        ends = numpy.minimum(starts+self.__leafSize,len(self.__order))
+        slots = _ranges(starts,ends,len(self.__order))
+        offsets = numpy.cumsum(ends-starts)-(ends-starts)
+        nodes = leaves+((1 << self.__depth)-1)
+        self.__nodeMinimum[nodes] = numpy.minimum.reduceat(self.__minimum[slots],offsets)
+        self.__nodeMaximum[nodes] = numpy.maximum.reduceat(self.__maximum[slots],offsets)
+        for level in range(self.__depth,0,-1):
+            nodes = numpy.unique((nodes-1)//2)
+            self.__nodeMinimum[nodes] = numpy.fmin(self.__nodeMinimum[2*nodes+1],self.__nodeMinimum[2*nodes+2])
+            self.__nodeMaximum[nodes] = numpy.fmax(self.__nodeMaximum[2*nodes+1],self.__nodeMaximum[2*nodes+2])
+
+
+def _morton(cells:numpy.ndarray) -> numpy.ndarray:
+    ret = numpy.zeros(len(cells),numpy.uint64)
+    for bit in range(MORTON_BITS):
+        for axis in range(3):
+            ret |= ((cells[:,axis] >> numpy.uint64(bit))&numpy.uint64(1)) << numpy.uint64(3*bit+axis)
+    return ret
+
+
+def _ranges(starts:numpy.ndarray,ends:numpy.ndarray,limit:int) -> numpy.ndarray:
+    ends = numpy.minimum(ends,limit)
+    lengths = numpy.maximum(ends-starts,0)
+    total = int(lengths.sum())
+    if not total:
+        return numpy.zeros(0,numpy.int64)
+    offsets = numpy.cumsum(lengths)-lengths
+    return numpy.repeat(starts-offsets,lengths)+numpy.arange(total)
@@ -0,0 +1,362 @@
+from OpenGL.GL import GL_ACTIVE_VARIABLES
+from OpenGL.GL import GL_ARRAY_SIZE
+from OpenGL.GL import GL_ARRAY_STRIDE
+from OpenGL.GL import GL_BOOL
+from OpenGL.GL import GL_BOOL_VEC2
+from OpenGL.GL import GL_BOOL_VEC3
+from OpenGL.GL import GL_BOOL_VEC4
+from OpenGL.GL import GL_BUFFER_DATA_SIZE
+from OpenGL.GL import GL_BUFFER_VARIABLE
+from OpenGL.GL import GL_DOUBLE
+from OpenGL.GL import GL_DOUBLE_MAT2
+from OpenGL.GL import GL_DOUBLE_MAT2x3
+from OpenGL.GL import GL_DOUBLE_MAT2x4
+from OpenGL.GL import GL_DOUBLE_MAT3
+from OpenGL.GL import GL_DOUBLE_MAT3x2
+from OpenGL.GL import GL_DOUBLE_MAT3x4
+from OpenGL.GL import GL_DOUBLE_MAT4
+from OpenGL.GL import GL_DOUBLE_MAT4x2
+from OpenGL.GL import GL_DOUBLE_MAT4x3
+from OpenGL.GL import GL_DOUBLE_VEC2
+from OpenGL.GL import GL_DOUBLE_VEC3
+from OpenGL.GL import GL_DOUBLE_VEC4
+from OpenGL.GL import GL_FLOAT
+from OpenGL.GL import GL_FLOAT_MAT2
+from OpenGL.GL import GL_FLOAT_MAT2x3
+from OpenGL.GL import GL_FLOAT_MAT2x4
+from OpenGL.GL import GL_FLOAT_MAT3
+from OpenGL.GL import GL_FLOAT_MAT3x2
+from OpenGL.GL import GL_FLOAT_MAT3x4
+from OpenGL.GL import GL_FLOAT_MAT4
+from OpenGL.GL import GL_FLOAT_MAT4x2
+from OpenGL.GL import GL_FLOAT_MAT4x3
+from OpenGL.GL import GL_FLOAT_VEC2
+from OpenGL.GL import GL_FLOAT_VEC3
+from OpenGL.GL import GL_FLOAT_VEC4
+from OpenGL.GL import GL_INT
+from OpenGL.GL import GL_INT_VEC2
+from OpenGL.GL import GL_INT_VEC3
+from OpenGL.GL import GL_INT_VEC4
+from OpenGL.GL import GL_IS_ROW_MAJOR
+from OpenGL.GL import GL_MATRIX_STRIDE
+from OpenGL.GL import GL_NAME_LENGTH
+from OpenGL.GL import GL_NUM_ACTIVE_VARIABLES
+from OpenGL.GL import GL_OFFSET
+from OpenGL.GL import GL_SHADER_STORAGE_BLOCK
+from OpenGL.GL import GL_TOP_LEVEL_ARRAY_SIZE
+from OpenGL.GL import GL_TOP_LEVEL_ARRAY_STRIDE
+from OpenGL.GL import GL_TYPE
+from OpenGL.GL import GL_UNIFORM
+from OpenGL.GL import GL_UNIFORM_BLOCK
+from OpenGL.GL import GL_UNSIGNED_INT
+from OpenGL.GL import GL_UNSIGNED_INT_VEC2
+from OpenGL.GL import GL_UNSIGNED_INT_VEC3
+from OpenGL.GL import GL_UNSIGNED_INT_VEC4
+from OpenGL.GL import glGetProgramResourceName
+from OpenGL.GL import glGetProgramResourceiv
+from OpenGL.constant import IntConstant as glIntConstant
+from ctypes import create_string_buffer
+import numpy
+import re
+
+TYPES = {
+    GL_FLOAT: ("<f4",1,1)
+    ,GL_FLOAT_VEC2: ("<f4",1,2)
+    ,GL_FLOAT_VEC3: ("<f4",1,3)
+    ,GL_FLOAT_VEC4: ("<f4",1,4)
+    ,GL_DOUBLE: ("<f8",1,1)
+    ,GL_DOUBLE_VEC2: ("<f8",1,2)
+    ,GL_DOUBLE_VEC3: ("<f8",1,3)
+    ,GL_DOUBLE_VEC4: ("<f8",1,4)
+    ,GL_INT: ("<i4",1,1)
+    ,GL_INT_VEC2: ("<i4",1,2)
+    ,GL_INT_VEC3: ("<i4",1,3)
+    ,GL_INT_VEC4: ("<i4",1,4)
+    ,GL_UNSIGNED_INT: ("<u4",1,1)
+    ,GL_UNSIGNED_INT_VEC2: ("<u4",1,2)
+    ,GL_UNSIGNED_INT_VEC3: ("<u4",1,3)
+    ,GL_UNSIGNED_INT_VEC4: ("<u4",1,4)
+    ,GL_BOOL: ("<u4",1,1)
+    ,GL_BOOL_VEC2: ("<u4",1,2)
+    ,GL_BOOL_VEC3: ("<u4",1,3)
+    ,GL_BOOL_VEC4: ("<u4",1,4)
+    ,GL_FLOAT_MAT2: ("<f4",2,2)
+    ,GL_FLOAT_MAT2x3: ("<f4",2,3)
+    ,GL_FLOAT_MAT2x4: ("<f4",2,4)
+    ,GL_FLOAT_MAT3: ("<f4",3,3)
+    ,GL_FLOAT_MAT3x2: ("<f4",3,2)
+    ,GL_FLOAT_MAT3x4: ("<f4",3,4)
+    ,GL_FLOAT_MAT4: ("<f4",4,4)
+    ,GL_FLOAT_MAT4x2: ("<f4",4,2)
+    ,GL_FLOAT_MAT4x3: ("<f4",4,3)
+    ,GL_DOUBLE_MAT2: ("<f8",2,2)
+    ,GL_DOUBLE_MAT2x3: ("<f8",2,3)
+    ,GL_DOUBLE_MAT2x4: ("<f8",2,4)
+    ,GL_DOUBLE_MAT3: ("<f8",3,3)
+    ,GL_DOUBLE_MAT3x2: ("<f8",3,2)
+    ,GL_DOUBLE_MAT3x4: ("<f8",3,4)
+    ,GL_DOUBLE_MAT4: ("<f8",4,4)
+    ,GL_DOUBLE_MAT4x2: ("<f8",4,2)
+    ,GL_DOUBLE_MAT4x3: ("<f8",4,3)
+}
+
+_TOP_LEVEL_ARRAY = re.compile(r"^(\w+)\[(\d+)\]\.?(.*)$")
+
+
+class BlockVariable:
+
+    def __init__(
+        self
+        ,name:str
+        ,type:int
+        ,offset:int
+        ,arraySize:int = 1
+        ,arrayStride:int = 0
+        ,matrixStride:int = 0
+        ,rowMajor:bool = False
+        ,topLevelArraySize:int = 1
+        ,topLevelArrayStride:int = 0
+        ):
+        if type not in TYPES:
+            raise RuntimeError
+        self.name = name
+        self.type = type
+        self.offset = offset
+        self.arraySize = arraySize
+        self.arrayStride = arrayStride
+        self.matrixStride = matrixStride
+        self.rowMajor = rowMajor
+        self.topLevelArraySize = topLevelArraySize
+        self.topLevelArrayStride = topLevelArrayStride
+
+    def format(self,element:bool = False) -> tuple:
+        (base,columns,rows) = TYPES[self.type]
+        itemSize = numpy.dtype(base).itemsize
+        if columns > 1:
+            if self.rowMajor:
+                (columns,rows) = (rows,columns)
+            lanes = self.matrixStride//itemSize if self.matrixStride else rows
+            shape = (columns,lanes)
+        elif rows > 1:
+            shape = (rows,)
+        else:
+            shape = ()
+        if (
+            not element
+            and (
+                self.name.endswith("]")
+                or self.arraySize != 1
+                )
+            ):
+            count = max(self.arraySize,1)
+            size = numpy.dtype((base,shape)).itemsize
+            if (
+                self.arrayStride
+                and self.arrayStride != size
+                ):
+                if columns > 1:
+                    raise RuntimeError
+                shape = (self.arrayStride//itemSize,)
+            shape = (count,)+shape
+        return (base,shape)
+
+
+class BlockLayout:
+
+    @staticmethod
+    def fromProgram(program:int,interface:glIntConstant,index:int):
+        if interface == GL_SHADER_STORAGE_BLOCK:
+            variableInterface = GL_BUFFER_VARIABLE
+            properties = (
+                GL_NAME_LENGTH
+                ,GL_TYPE
+                ,GL_OFFSET
+                ,GL_ARRAY_SIZE
+                ,GL_ARRAY_STRIDE
+                ,GL_MATRIX_STRIDE
+                ,GL_IS_ROW_MAJOR
+                ,GL_TOP_LEVEL_ARRAY_SIZE
+                ,GL_TOP_LEVEL_ARRAY_STRIDE
+                )
+        elif interface == GL_UNIFORM_BLOCK:
+            variableInterface = GL_UNIFORM
+            properties = (
+                GL_NAME_LENGTH
+                ,GL_TYPE
+                ,GL_OFFSET
+                ,GL_ARRAY_SIZE
+                ,GL_ARRAY_STRIDE
+                ,GL_MATRIX_STRIDE
+                ,GL_IS_ROW_MAJOR
+                )
+        else:
+            raise RuntimeError
+        (size,count,length) = _resource(
+            program
+            ,interface
+            ,index
+            ,(GL_BUFFER_DATA_SIZE,GL_NUM_ACTIVE_VARIABLES,GL_NAME_LENGTH)
+            )
+        blockName = create_string_buffer(length)
+        glGetProgramResourceName(program,interface,index,length,None,blockName)
+        indices = _resource(program,interface,index,(GL_ACTIVE_VARIABLES,),count)
+        variables = []
+        for i in indices:
+            values = _resource(program,variableInterface,i,properties)
+            name = create_string_buffer(values[0])
+            glGetProgramResourceName(program,variableInterface,i,values[0],None,name)
+            variables.append(BlockVariable(name.value.decode(),*values[1:6],bool(values[6]),*values[7:]))
+        return BlockLayout(size,variables,re.sub(r"\[\d+\]$","",blockName.value.decode()))
+
+    def __init__(self,size:int,variables:list,blockName:str = ""):
+        if (
+            size <= 0
+            or not variables
+            ):
+            raise RuntimeError
+        prefix = blockName+"."
+        if (
+            blockName
+            and all(v.name.startswith(prefix) for v in variables)
+            ):
+            for v in variables:
+                v.name = v.name[len(prefix):]
+        arrays = {}
+        for v in variables:
+            match = _TOP_LEVEL_ARRAY.match(v.name)
+            if match:
+                arrays.setdefault(match.group(1),[]).append((int(match.group(2)),match.group(3),v))
+        self.__size = size
+        self.__arrayName = None
+        self.__elementOffset = size
+        self.__elementStride = 0
+        self.__elementCount = 0
+        self.__elementDtype = None
+        for (name,members) in arrays.items():
+            start = min(v.offset for (_,_,v) in members)
+            if all(v.offset < start for v in variables if self.__arrayOf(v) != name):
+                self.__arrayName = name
+        if self.__arrayName is not None:
+            members = arrays[self.__arrayName]
+            first = [(m,v) for (i,m,v) in members if i == 0]
+            self.__elementOffset = min(v.offset for (_,v) in first)
+            stride = max(v.topLevelArrayStride for (_,v) in first)
+            count = max(v.topLevelArraySize for (_,v) in first)
+            if (
+                not stride
+                and first[0][0] == ""
+                ):
+                stride = first[0][1].arrayStride
+                count = first[0][1].arraySize
+            elif not stride:
+                indices = sorted(set(i for (i,_,_) in members))
+                count = len(indices)
+                if count > 1:
+                    second = [v for (i,_,v) in members if i == indices[1]]
+                    stride = min(v.offset for v in second)-self.__elementOffset
+                else:
+                    stride = size-self.__elementOffset
+            self.__elementStride = stride
+            self.__elementCount = count
+            self.__elementDtype = _dtype(
+                [(m or self.__arrayName,v,v.offset-self.__elementOffset,m == "") for (m,v) in first]
+                ,stride
+                )
+            variables = [v for v in variables if self.__arrayOf(v) != self.__arrayName]
+        self.__headerDtype = _dtype(
+            [(re.sub(r"\[0\]$","",v.name),v,v.offset,False) for v in variables]
+            ,self.__elementOffset
+            )
+
+    def size(self) -> int:
+        return self.__size
+
+    def headerDtype(self) -> numpy.dtype:
+        return self.__headerDtype
+
+    def elementDtype(self) -> numpy.dtype:
+        return self.__elementDtype
+
+    def elementOffset(self) -> int:
+        return self.__elementOffset
+
+    def elementStride(self) -> int:
+        return self.__elementStride
+
+    def elementCount(self) -> int:
+        return self.__elementCount
+
+    def sizeFor(self,count:int) -> int:
+        if self.__elementDtype is None:
+            return self.__size
+        if count < 0:
+            raise RuntimeError
+        return max(self.__elementOffset+count*self.__elementStride,self.__size)
+
+    def allocate(self,count:int = None) -> numpy.ndarray:
+        return numpy.zeros(self.sizeFor(self.__count(count)),numpy.uint8)
+
+    def header(self,raw:numpy.ndarray) -> numpy.ndarray:
+        return numpy.ndarray((),self.__headerDtype,raw,0)
+
+    def elements(self,raw:numpy.ndarray) -> numpy.ndarray:
+        if self.__elementDtype is None:
+            raise RuntimeError
+        count = (raw.nbytes-self.__elementOffset)//self.__elementStride
+        return numpy.ndarray((count,),self.__elementDtype,raw,self.__elementOffset)
+
+    def pack(self,elements:numpy.ndarray = None,**header) -> numpy.ndarray:
+        count = 0 if elements is None else len(elements)
+        ret = self.allocate(count if self.__elementDtype is not None else None)
+        h = self.header(ret)
+        for (name,value) in header.items():
+            h[name] = value
+        if count:
+            e = self.elements(ret)[:count]
+            for name in elements.dtype.names:
+                e[name] = elements[name]
+        return ret
+
+    def unpack(self,raw) -> tuple:
+        raw = numpy.frombuffer(raw,numpy.uint8)
+        return (self.header(raw),self.elements(raw) if self.__elementDtype is not None else None)
+
+    @staticmethod
+    def __arrayOf(variable:BlockVariable) -> str:
+        match = _TOP_LEVEL_ARRAY.match(variable.name)
+        return match.group(1) if match else None
+
+    def __count(self,count:int) -> int:
+        if count is None:
+            return self.__elementCount
+        if (
+            self.__elementCount
+            and count > self.__elementCount
+            ):
+            raise RuntimeError
+        return count
+
+
+def _dtype(fields:list,itemSize:int) -> numpy.dtype:
+    (names,formats,offsets) = ([],[],[])
+    for (name,variable,offset,element) in fields:
+        names.append(name)
+        formats.append(variable.format(element))
+        offsets.append(offset)
+    return numpy.dtype({"names":names,"formats":formats,"offsets":offsets,"itemsize":itemSize})
+
+
+def _resource(program:int,interface:glIntConstant,index:int,properties:tuple,count:int = 0) -> list:
+    count = count or len(properties)
+    params = numpy.zeros(count,numpy.int32)
+    glGetProgramResourceiv(
+        program
+        ,interface
+        ,index
+        ,len(properties)
+        ,numpy.array(properties,numpy.uint32)
+        ,count
+        ,None
+        ,params
+        )
+    return [int(v) for v in params]
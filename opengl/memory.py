@@ -0,0 +1,27 @@
+import numpy
+
+
+def byteView(data,writable:bool = False) -> numpy.ndarray:
+    view = memoryview(data)
+    if (
+        not view.c_contiguous
+        or (writable and view.readonly)
+        ):
+        raise RuntimeError
+    return numpy.frombuffer(data,numpy.uint8)
+
+
+def floatArray(floats) -> numpy.ndarray:
+    if not isinstance(floats,numpy.ndarray):
+        try:
+            view = memoryview(floats)
+        except TypeError:
+            view = None
+        if (
+            view is not None
+            and view.format.lstrip("@=<") == "f"
+            and view.itemsize == 4
+            and view.c_contiguous
+            ):
+            return numpy.frombuffer(floats,numpy.float32)
+    return numpy.ascontiguousarray(floats,dtype=numpy.float32)
@@ -0,0 +1,51 @@
+from OpenGL.GL import GL_UNSIGNED_BYTE
+from OpenGL.GL import GL_UNSIGNED_INT
+from OpenGL.GL import GL_UNSIGNED_SHORT
+from OpenGL.constant import IntConstant as glIntConstant
+import numpy
+
+INDEX_TYPES = {
+    numpy.dtype(numpy.uint8): GL_UNSIGNED_BYTE
+    ,numpy.dtype(numpy.uint16): GL_UNSIGNED_SHORT
+    ,numpy.dtype(numpy.uint32): GL_UNSIGNED_INT
+}
+
+
+def compactIndices(indices) -> numpy.ndarray:
+    indices = numpy.ascontiguousarray(indices).ravel()
+    if (
+        indices.size
+        and (
+            indices.min() < 0
+            or indices.max() > 0xFFFFFFFF
+            )
+        ):
+        raise RuntimeError
+    if (
+        not indices.size
+        or indices.max() < 0xFFFF
+        ):
+        return indices.astype(numpy.uint16)
+    return indices.astype(numpy.uint32)
+
+
+def indexType(indices:numpy.ndarray) -> glIntConstant:
+    if indices.dtype not in INDEX_TYPES:
+        raise RuntimeError
+    return INDEX_TYPES[indices.dtype]
+
+
+def weld(vertices,vertexSize:int) -> tuple:
+    vertices = numpy.ascontiguousarray(vertices)
+    if (
+        vertexSize <= 0
+        or (vertices.size%vertexSize) != 0
+        ):
+        raise RuntimeError
+    rows = vertices.reshape(-1,vertexSize)
+    keys = rows.view(numpy.dtype((numpy.void,rows.dtype.itemsize*vertexSize))).ravel()
+    (_,first,inverse) = numpy.unique(keys,return_index=True,return_inverse=True)
+    order = numpy.argsort(first)
+    remap = numpy.empty(len(order),numpy.int64)
+    remap[order] = numpy.arange(len(order))
+    return (rows[first[order]],compactIndices(remap[inverse.ravel()]))
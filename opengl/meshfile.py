@@ -0,0 +1,512 @@
+from OpenGL.GL import GL_FLOAT
+from OpenGL.GL import GL_STATIC_DRAW
+from OpenGL.constant import IntConstant as glIntConstant
+from opengl import Buffer
+from opengl.memory import byteView
+from opengl.mesh import compactIndices
+from opengl.mesh import indexType
+from opengl.quantize import interleave
+from opengl.StreamingBuffer import StreamingBuffer
+from opengl.VertexArray import VertexArray
+from opengl.VertexFormat import ATTRIBUTE_TYPES
+from opengl.VertexFormat import VertexFormat
+from pathlib import Path
+import mmap
+import numpy
+import struct
+
+CHUNK_SIZE = 16*1024*1024
+OBJ_CHUNK_SIZE = 4*1024*1024
+OBJ_KEYS = (b"v",b"vt",b"vn",b"f")
+PLY_BLOCK_SIZE = 8
+MAGIC = b"OGPM"
+VERSION = 1
+ALIGNMENT = 16
+
+HEADER = struct.Struct("<4sIIQQII")
+ATTRIBUTE = struct.Struct("<32sIIII")
+
+PLY_TYPES = {
+    "char": "i1"
+    ,"int8": "i1"
+    ,"uchar": "u1"
+    ,"uint8": "u1"
+    ,"short": "i2"
+    ,"int16": "i2"
+    ,"ushort": "u2"
+    ,"uint16": "u2"
+    ,"int": "i4"
+    ,"int32": "i4"
+    ,"uint": "u4"
+    ,"uint32": "u4"
+    ,"float": "f4"
+    ,"float32": "f4"
+    ,"double": "f8"
+    ,"float64": "f8"
+}
+
+PLY_ATTRIBUTES = (
+    ("position",("x","y","z"))
+    ,("normal",("nx","ny","nz"))
+    ,("texturePoint",("s","t"))
+    ,("texturePoint",("u","v"))
+    ,("texturePoint",("texture_u","texture_v"))
+    ,("color",("red","green","blue","alpha"))
+    ,("color",("red","green","blue"))
+)
+
+
+class Mesh:
+
+    def __init__(
+        self
+        ,vertexBuffer:Buffer
+        ,stride:int
+        ,vertexCount:int
+        ,attributes:dict
+        ,indexBuffer:Buffer = None
+        ,indexCount:int = 0
+        ,indexType:glIntConstant = None
+        ):
+        if (
+            stride <= 0
+            or vertexCount <= 0
+            or (
+                indexBuffer is not None
+                and (
+                    indexCount <= 0
+                    or indexType is None
+                    )
+                )
+            ):
+            raise RuntimeError
+        self.__vertexBuffer = vertexBuffer
+        self.__stride = stride
+        self.__vertexCount = vertexCount
+        self.__attributes = dict(attributes)
+        self.__indexBuffer = indexBuffer
+        self.__indexCount = indexCount
+        self.__indexType = indexType
+
+    def attributes(self) -> dict:
+        return self.__attributes
+
+    def indexBuffer(self) -> Buffer:
+        return self.__indexBuffer
+
+    def indexCount(self) -> int:
+        return self.__indexCount
+
+    def stride(self) -> int:
+        return self.__stride
+
+    def vertexBuffer(self) -> Buffer:
+        return self.__vertexBuffer
+
+    def vertexCount(self) -> int:
+        return self.__vertexCount
+
+    def vertexFormat(self,locations:dict) -> VertexFormat:
+        attributes = []
+        for (name,location) in locations.items():
+            if name not in self.__attributes:
+                raise RuntimeError
+            if location != -1:
+                attributes.append((location,*self.__attributes[name]))
+        return VertexFormat(self.__stride,attributes)
+
+    def vertexArray(self,mode:glIntConstant,locations:dict,instanceSize:int = 1) -> VertexArray:
+        ret = VertexArray(
+            mode
+            ,self.__indexCount if self.__indexBuffer is not None else self.__vertexCount
+            ,instanceSize
+            )
+        ret.setFormat(0,self.vertexFormat(locations))
+        ret.setBuffer(0,self.__vertexBuffer)
+        if self.__indexBuffer is not None:
+            ret.setIndexBuffer(self.__indexBuffer,self.__indexType)
+        return ret
+
+
+def upload(
+    data
+    ,usage:glIntConstant = GL_STATIC_DRAW
+    ,chunkSize:int = CHUNK_SIZE
+    ,staging:StreamingBuffer = None
+    ) -> Buffer:
+    view = byteView(data)
+    if staging is not None:
+        chunkSize = staging.size()
+    if (
+        not view.nbytes
+        or chunkSize <= 0
+        ):
+        raise RuntimeError
+    if view.nbytes <= chunkSize:
+        return Buffer.fromData(view,usage)
+    ret = Buffer(view.nbytes,usage)
+    if staging is None:
+        staging = StreamingBuffer(chunkSize)
+    for offset in range(0,view.nbytes,chunkSize):
+        chunk = view[offset:offset+chunkSize]
+        with staging as s:
+            s.write(0,chunk)
+            s.copyTo(ret,0,offset,chunk.nbytes)
+    return ret
+
+
+def loadMesh(
+    path
+    ,usage:glIntConstant = GL_STATIC_DRAW
+    ,chunkSize:int = CHUNK_SIZE
+    ,staging:StreamingBuffer = None
+    ) -> Mesh:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".ply":
+        reader = _readPly
+    elif suffix == ".obj":
+        reader = _readObj
+    else:
+        reader = _readNative
+    with open(path,"rb") as file:
+        with mmap.mmap(file.fileno(),0,access=mmap.ACCESS_READ) as data:
+            return _load(reader,data,usage,chunkSize,staging)
+
+
+def saveMesh(path,vertices,stride:int,attributes:dict,indices = None) -> None:
+    vertices = byteView(vertices)
+    if (
+        stride <= 0
+        or not vertices.nbytes
+        or (vertices.nbytes%stride) != 0
+        ):
+        raise RuntimeError
+    if indices is not None:
+        indices = compactIndices(indices)
+    with open(path,"wb") as file:
+        file.write(HEADER.pack(
+            MAGIC
+            ,VERSION
+            ,stride
+            ,vertices.nbytes//stride
+            ,0 if indices is None else indices.size
+            ,0 if indices is None else indices.itemsize
+            ,len(attributes)
+            ))
+        for (name,(size,type,offset,normalized)) in attributes.items():
+            file.write(ATTRIBUTE.pack(name.encode(),size,int(type),offset,int(normalized)))
+        _pad(file)
+        file.write(vertices)
+        if indices is not None:
+            _pad(file)
+            file.write(indices)
+
+
+def _align(offset:int) -> int:
+    return ((offset+ALIGNMENT-1)//ALIGNMENT)*ALIGNMENT
+
+
+def _fanPolygons(arities:numpy.ndarray) -> numpy.ndarray:
+    starts = numpy.cumsum(arities)-arities
+    counts = arities-2
+    polygons = numpy.repeat(numpy.arange(len(arities)),counts)
+    steps = numpy.arange(counts.sum())-numpy.repeat(numpy.cumsum(counts)-counts,counts)+1
+    firsts = starts[polygons]
+    return numpy.stack((firsts,firsts+steps,firsts+steps+1),1).ravel()
+
+
+def _load(reader,data,usage:glIntConstant,chunkSize:int,staging:StreamingBuffer) -> Mesh:
+    (vertices,stride,attributes,indices) = reader(data)
+    if (
+        staging is None
+        and max(vertices.nbytes,0 if indices is None else indices.nbytes) > chunkSize
+        ):
+        staging = StreamingBuffer(chunkSize)
+    vertexBuffer = upload(vertices,usage,chunkSize,staging)
+    if indices is None:
+        return Mesh(vertexBuffer,stride,vertices.nbytes//stride,attributes)
+    return Mesh(
+        vertexBuffer
+        ,stride
+        ,vertices.nbytes//stride
+        ,attributes
+        ,upload(indices,usage,chunkSize,staging)
+        ,indices.size
+        ,indexType(indices)
+        )
+
+
+def _objCounts(text:numpy.ndarray,positions:numpy.ndarray) -> numpy.ndarray:
+    return numpy.diff(numpy.searchsorted(positions,numpy.flatnonzero(text == 10)),prepend=0)
+
+
+def _objFaces(text:numpy.ndarray) -> tuple:
+    space = text <= 32
+    slash = text == 47
+    corners = ~space
+    corners[1:] &= space[:-1]
+    numbers = ~space&~slash
+    numbers[1:] &= space[:-1]|slash[:-1]
+    cornerPositions = numpy.flatnonzero(corners)
+    numberPositions = numpy.flatnonzero(numbers)
+    slashPositions = numpy.flatnonzero(slash)
+    owners = numpy.searchsorted(cornerPositions,numberPositions,"right")-1
+    slots = numpy.searchsorted(slashPositions,numberPositions)-numpy.searchsorted(slashPositions,cornerPositions)[owners]
+    values = numpy.fromstring(text.tobytes().replace(b"/",b" "),numpy.int64,sep=" ")
+    if (
+        slash[cornerPositions].any()
+        or values.size != len(numberPositions)
+        or (slots > 2).any()
+        ):
+        raise RuntimeError
+    ret = numpy.zeros((len(cornerPositions),3),numpy.int64)
+    ret[owners,slots] = values
+    return (ret,_objCounts(text,cornerPositions))
+
+
+def _objFloats(text:numpy.ndarray,size:int) -> numpy.ndarray:
+    space = text <= 32
+    tokens = ~space
+    tokens[1:] &= space[:-1]
+    counts = _objCounts(text,numpy.flatnonzero(tokens))
+    values = numpy.fromstring(text.tobytes(),numpy.float32,sep=" ")
+    if (
+        values.size != counts.sum()
+        or (counts < size).any()
+        ):
+        raise RuntimeError
+    return values[(numpy.cumsum(counts)-counts)[:,None]+numpy.arange(size)]
+
+
+def _objLines(chunk:numpy.ndarray) -> tuple:
+    text = numpy.full(len(chunk)+3,10,numpy.uint8)
+    text[:len(chunk)] = chunk
+    ends = numpy.flatnonzero(text[:len(chunk)+1] == 10)
+    starts = numpy.concatenate(([0],ends[:-1]+1))
+    (first,second,third) = (text[starts],text[starts+1],text[starts+2])
+    classes = numpy.full(len(starts),len(OBJ_KEYS),numpy.uint8)
+    classes[(first == 118)&_objSpace(second)] = 0
+    classes[(first == 118)&(second == 116)&_objSpace(third)] = 1
+    classes[(first == 118)&(second == 110)&_objSpace(third)] = 2
+    classes[(first == 102)&_objSpace(second)] = 3
+    text = text[:ends[-1]+1]
+    return (text,starts,classes,numpy.repeat(classes,ends-starts+1))
+
+
+def _objSpace(characters:numpy.ndarray) -> numpy.ndarray:
+    return (characters == 32)|(characters == 9)
+
+
+def _objText(text:numpy.ndarray,starts:numpy.ndarray,classes:numpy.ndarray,byteClasses:numpy.ndarray,key:int) -> numpy.ndarray:
+    mask = byteClasses == key
+    lines = starts[classes == key]
+    for i in range(len(OBJ_KEYS[key])):
+        mask[lines+i] = False
+    return text[mask]
+
+
+def _pad(file) -> None:
+    file.write(bytes(_align(file.tell())-file.tell()))
+
+
+def _plyLists(data,offset:int,count:int,countType:numpy.dtype,itemType:numpy.dtype) -> tuple:
+    if not count:
+        return ((numpy.zeros(0,numpy.int64),numpy.zeros(0,numpy.int64)),0)
+    first = int(numpy.frombuffer(data,countType,1,offset)[0])
+    dtype = numpy.dtype([("n",countType),("i",itemType,(max(first,0),))])
+    if offset+dtype.itemsize*count <= len(data):
+        view = numpy.frombuffer(data,dtype,count,offset)
+        if (view["n"] == first).all():
+            return ((view["n"].astype(numpy.int64),view["i"].astype(numpy.int64).ravel()),dtype.itemsize*count)
+    raw = numpy.frombuffer(data,numpy.uint8,len(data)-offset,offset)
+    counts = numpy.lib.stride_tricks.sliding_window_view(raw,countType.itemsize).copy().view(countType).ravel()
+    jumps = numpy.arange(len(counts)+1,dtype=numpy.int64)
+    jumps[:-1] += countType.itemsize+numpy.maximum(counts,0).astype(numpy.int64)*itemType.itemsize
+    jumps = numpy.minimum(jumps,len(counts)).astype(numpy.int32 if len(counts) < 1 << 31 else numpy.int64)
+    strides = jumps
+    for i in range(PLY_BLOCK_SIZE.bit_length()-1):
+        strides = strides[strides]
+    blocks = [0]
+    for i in range((count-1)//PLY_BLOCK_SIZE):
+        blocks.append(int(strides[blocks[-1]]))
+    starts = numpy.empty((len(blocks),PLY_BLOCK_SIZE),numpy.int64)
+    starts[:,0] = blocks
+    for i in range(1,PLY_BLOCK_SIZE):
+        starts[:,i] = jumps[starts[:,i-1]]
+    starts = starts.ravel()[:count]
+    if starts[-1] >= len(counts):
+        raise RuntimeError
+    arities = counts[starts].astype(numpy.int64)
+    if (arities < 0).any():
+        raise RuntimeError
+    size = int(starts[-1])+countType.itemsize+int(arities[-1])*itemType.itemsize
+    if size > len(raw):
+        raise RuntimeError
+    firsts = numpy.repeat(starts+countType.itemsize,arities)
+    steps = numpy.arange(arities.sum())-numpy.repeat(numpy.cumsum(arities)-arities,arities)
+    items = raw[(firsts+steps*itemType.itemsize)[:,None]+numpy.arange(itemType.itemsize)]
+    return ((arities,items.view(itemType).ravel().astype(numpy.int64)),size)
+
+
+def _readNative(data) -> tuple:
+    (magic,version,stride,vertexCount,indexCount,indexSize,attributeCount) = HEADER.unpack_from(data,0)
+    if (
+        magic != MAGIC
+        or version != VERSION
+        or indexSize not in (0,2,4)
+        ):
+        raise RuntimeError
+    attributes = {}
+    offset = HEADER.size
+    for i in range(attributeCount):
+        (name,size,type,attributeOffset,normalized) = ATTRIBUTE.unpack_from(data,offset)
+        attributes[name.rstrip(b"\0").decode()] = (size,type,attributeOffset,bool(normalized))
+        offset += ATTRIBUTE.size
+    offset = _align(offset)
+    vertices = numpy.frombuffer(data,numpy.uint8,stride*vertexCount,offset)
+    indices = None
+    if indexCount:
+        offset = _align(offset+stride*vertexCount)
+        indices = numpy.frombuffer(data,numpy.uint16 if indexSize == 2 else numpy.uint32,indexCount,offset)
+    return (vertices,stride,attributes,indices)
+
+
+def _readObj(data) -> tuple:
+    lineCounts = numpy.zeros(len(OBJ_KEYS),numpy.int64)
+    chunks = {k: [] for k in OBJ_KEYS}
+    arities = []
+    start = 0
+    while start < len(data):
+        end = len(data)
+        if start+OBJ_CHUNK_SIZE < len(data):
+            end = data.find(b"\n",start+OBJ_CHUNK_SIZE-1)+1
+            if not end:
+                end = len(data)
+        (text,starts,classes,byteClasses) = _objLines(numpy.frombuffer(data,numpy.uint8,end-start,start))
+        for (key,size) in ((0,3),(1,2),(2,3)):
+            if (classes == key).any():
+                chunks[OBJ_KEYS[key]].append(_objFloats(_objText(text,starts,classes,byteClasses,key),size))
+        if (classes == 3).any():
+            (faces,faceArities) = _objFaces(_objText(text,starts,classes,byteClasses,3))
+            faceLines = numpy.flatnonzero(classes == 3)
+            bases = numpy.stack([numpy.cumsum(classes == k)[faceLines] for k in range(3)],1)+lineCounts[:3]
+            bases = numpy.repeat(bases,faceArities,axis=0)
+            chunks[b"f"].append(numpy.where(faces < 0,faces+bases+1,faces))
+            arities.append(faceArities)
+        lineCounts += numpy.bincount(classes,minlength=len(OBJ_KEYS)+1)[:len(OBJ_KEYS)]
+        start = end
+    (positionCount,textureCount,normalCount,faceCount) = lineCounts.tolist()
+    if not positionCount or not faceCount:
+        raise RuntimeError
+    arities = numpy.concatenate(arities)
+    if (arities < 3).any():
+        raise RuntimeError
+    faces = numpy.concatenate(chunks[b"f"])
+    if (
+        (faces[:,0] <= 0).any()
+        or (faces[:,0] > positionCount).any()
+        ):
+        raise RuntimeError
+    counts = [positionCount,textureCount,normalCount]
+    for column in (1,2):
+        if (
+            (faces[:,column] <= 0).any()
+            or (faces[:,column] > counts[column]).any()
+            ):
+            faces[:,column] = 0
+            counts[column] = 0
+    (unique,inverse) = _uniqueCorners(faces,counts)
+    arrays = [numpy.concatenate(chunks[b"v"])[unique[:,0]-1]]
+    names = ["position"]
+    for (column,key,name) in ((1,b"vt","texturePoint"),(2,b"vn","normal")):
+        if counts[column]:
+            arrays.append(numpy.concatenate(chunks[key])[unique[:,column]-1])
+            names.append(name)
+    (vertices,offsets,stride) = interleave(*arrays)
+    attributes = {n: (a.shape[1],GL_FLOAT,o,False) for (n,a,o) in zip(names,arrays,offsets)}
+    indices = compactIndices(inverse.ravel()[_fanPolygons(arities)])
+    return (byteView(vertices),stride,attributes,indices)
+
+
+def _readPly(data) -> tuple:
+    end = data.find(b"end_header")
+    if end < 0:
+        raise RuntimeError
+    offset = data.find(b"\n",end)+1
+    lines = data[:end].decode("ascii").splitlines()
+    if lines[0].strip() != "ply":
+        raise RuntimeError
+    elements = []
+    endian = None
+    for line in lines[1:]:
+        words = line.split()
+        if not words:
+            continue
+        if words[0] == "format":
+            if words[1] == "binary_little_endian":
+                endian = "<"
+            elif words[1] == "binary_big_endian":
+                endian = ">"
+            else:
+                raise RuntimeError
+        elif words[0] == "element":
+            elements.append((words[1],int(words[2]),[]))
+        elif words[0] == "property":
+            elements[-1][2].append(words[1:])
+    if endian is None:
+        raise RuntimeError
+    vertices = None
+    faces = None
+    for (name,count,properties) in elements:
+        if all(p[0] != "list" for p in properties):
+            dtype = numpy.dtype([(p[1],endian+PLY_TYPES[p[0]]) for p in properties])
+            view = numpy.frombuffer(data,dtype,count,offset)
+            size = dtype.itemsize*count
+        elif len(properties) == 1:
+            countType = numpy.dtype(endian+PLY_TYPES[properties[0][1]])
+            itemType = numpy.dtype(endian+PLY_TYPES[properties[0][2]])
+            (view,size) = _plyLists(data,offset,count,countType,itemType)
+        else:
+            raise RuntimeError
+        offset += size
+        if name == "vertex":
+            vertices = view
+        elif name == "face":
+            faces = view
+    if vertices is None or not len(vertices):
+        raise RuntimeError
+    if endian != "<":
+        vertices = vertices.astype(vertices.dtype.newbyteorder("<"))
+    attributes = {}
+    for (name,fields) in PLY_ATTRIBUTES:
+        if (
+            name in attributes
+            or not all(f in vertices.dtype.names for f in fields)
+            ):
+            continue
+        types = [vertices.dtype.fields[f][0] for f in fields]
+        offsets = [vertices.dtype.fields[f][1] for f in fields]
+        if (
+            any(t != types[0] for t in types)
+            or types[0] not in ATTRIBUTE_TYPES
+            or offsets != [offsets[0]+i*types[0].itemsize for i in range(len(fields))]
+            ):
+            raise RuntimeError
+        attributes[name] = (len(fields),ATTRIBUTE_TYPES[types[0]],offsets[0],types[0].kind in "iu")
+    indices = None
+    if faces is not None and len(faces[0]):
+        (arities,items) = faces
+        if (arities < 3).any():
+            raise RuntimeError
+        indices = compactIndices(items[_fanPolygons(arities)])
+    return (byteView(vertices),vertices.dtype.itemsize,attributes,indices)
+
+
+def _uniqueCorners(faces:numpy.ndarray,counts:list) -> tuple:
+    if (counts[0]+1)*(counts[1]+1)*(counts[2]+1) >= 1 << 63:
+        return numpy.unique(faces,axis=0,return_inverse=True)
+    (keys,inverse) = numpy.unique((faces[:,0]*(counts[1]+1)+faces[:,1])*(counts[2]+1)+faces[:,2],return_inverse=True)
+    ret = numpy.empty((len(keys),3),numpy.int64)
+    (keys,ret[:,2]) = numpy.divmod(keys,counts[2]+1)
+    (ret[:,0],ret[:,1]) = numpy.divmod(keys,counts[1]+1)
+    return (ret,inverse)
@@ -0,0 +1,282 @@
+from opengl.mesh import compactIndices
+from pathlib import Path
+import hashlib
+import numpy
+import os
+
+CACHE_SIZE = 16
+CACHE_VERSION = 1
+BORDER_WEIGHT = 10
+
+
+def cacheStatistics(indices,vertexCount:int = 0,cacheSize:int = CACHE_SIZE) -> tuple:
+    indices = _triangles(indices)
+    if cacheSize <= 0:
+        raise RuntimeError
+    if vertexCount <= 0:
+        vertexCount = len(numpy.unique(indices))
+    stamps = [-cacheSize-1]*(int(indices.max())+1)
+    time = 0
+    misses = 0
+    for v in indices.tolist():
+        if time-stamps[v] > cacheSize:
+            stamps[v] = time
+            time += 1
+            misses += 1
+    return (misses/(indices.size//3),misses/vertexCount)
+
+
+def tipsify(indices,vertexCount:int = 0,cacheSize:int = CACHE_SIZE) -> tuple:
+    indices = _triangles(indices)
+    if cacheSize <= 0:
+        raise RuntimeError
+    vertexCount = max(vertexCount,int(indices.max())+1)
+    triangleCount = indices.size//3
+    corners = numpy.argsort(indices,kind="stable")
+    starts = numpy.zeros(vertexCount+1,numpy.int64)
+    numpy.cumsum(numpy.bincount(indices,minlength=vertexCount),out=starts[1:])
+    adjacency = (corners//3).tolist()
+    starts = starts.tolist()
+    live = numpy.diff(starts).tolist()
+    triangles = indices.tolist()
+    stamps = [0]*vertexCount
+    emitted = [False]*triangleCount
+    deadEnds = []
+    order = []
+    clusters = [0]
+    time = cacheSize+1
+    cursor = 0
+    fan = 0
+    while fan >= 0:
+        candidates = []
+        for t in adjacency[starts[fan]:starts[fan+1]]:
+            if emitted[t]:
+                continue
+            emitted[t] = True
+            order.append(t)
+            for v in triangles[3*t:3*t+3]:
+                deadEnds.append(v)
+                candidates.append(v)
+                live[v] -= 1
+                if time-stamps[v] > cacheSize:
+                    stamps[v] = time
+                    time += 1
+        fan = -1
+        best = -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if time-stamps[v]+2*live[v] <= cacheSize:
+                    priority = time-stamps[v]
+                if priority > best:
+                    best = priority
+                    fan = v
+        if fan == -1:
+            clusters.append(len(order))
+            while deadEnds:
+                v = deadEnds.pop()
+                if live[v] > 0:
+                    fan = v
+                    break
+            while fan == -1 and cursor < vertexCount:
+                if live[cursor] > 0:
+                    fan = cursor
+                cursor += 1
+    order = numpy.array(order,numpy.int64)
+    return (indices.reshape(-1,3)[order].ravel(),numpy.unique(clusters[:-1]))
+
+
+def sortClusters(vertices,vertexSize:int,indices,clusters) -> numpy.ndarray:
+    positions = _rows(vertices,vertexSize)[:,:3].astype(numpy.float64)
+    indices = _triangles(indices)
+    clusters = numpy.asarray(clusters,numpy.int64)
+    if (
+        not clusters.size
+        or clusters[0] != 0
+        or (numpy.diff(clusters) <= 0).any()
+        or clusters[-1] >= indices.size//3
+        ):
+        raise RuntimeError
+    corners = positions[indices.reshape(-1,3)]
+    normals = numpy.cross(corners[:,1]-corners[:,0],corners[:,2]-corners[:,0])
+    areas = numpy.linalg.norm(normals,axis=1)
+    centers = corners.mean(axis=1)
+    center = (centers*areas[:,None]).sum(axis=0)/max(areas.sum(),1e-30)
+    clusterNormals = numpy.add.reduceat(normals,clusters)
+    clusterAreas = numpy.add.reduceat(areas,clusters)
+    clusterCenters = numpy.add.reduceat(centers*areas[:,None],clusters)/numpy.maximum(clusterAreas,1e-30)[:,None]
+    lengths = numpy.maximum(numpy.linalg.norm(clusterNormals,axis=1),1e-30)
+    score = ((clusterCenters-center)*clusterNormals).sum(axis=1)/lengths
+    ends = numpy.append(clusters[1:],indices.size//3)
+    triangles = numpy.concatenate([
+        numpy.arange(clusters[i],ends[i]) for i in numpy.argsort(-score,kind="stable")
+        ])
+    return indices.reshape(-1,3)[triangles].ravel()
+
+
+def reorderVertices(vertices,vertexSize:int,indices) -> tuple:
+    rows = _rows(vertices,vertexSize)
+    indices = _triangles(indices)
+    if indices.max() >= len(rows):
+        raise RuntimeError
+    (used,first) = numpy.unique(indices,return_index=True)
+    order = used[numpy.argsort(first)]
+    remap = numpy.empty(len(rows),numpy.int64)
+    remap[order] = numpy.arange(len(order))
+    return (rows[order],compactIndices(remap[indices]))
+
+
+def optimizeMesh(
+    vertices
+    ,vertexSize:int
+    ,indices
+    ,cacheSize:int = CACHE_SIZE
+    ,cacheDirectory = None
+    ) -> tuple:
+    rows = _rows(vertices,vertexSize)
+    indices = _triangles(indices)
+    path = None
+    if cacheDirectory is not None:
+        key = hashlib.sha256()
+        key.update(f"{CACHE_VERSION}:{cacheSize}:{rows.dtype.str}:{rows.shape}:{indices.dtype.str}".encode())
+        key.update(rows.tobytes())
+        key.update(indices.tobytes())
+        path = Path(cacheDirectory)/(key.hexdigest()+".npz")
+        if path.exists():
+            with numpy.load(path) as cached:
+                return (cached["vertices"],cached["indices"])
+    (indices,clusters) = tipsify(indices,len(rows),cacheSize)
+    indices = sortClusters(rows,vertexSize,indices,clusters)
+    ret = reorderVertices(rows,vertexSize,indices)
+    if path is not None:
+        path.parent.mkdir(parents=True,exist_ok=True)
+        temporary = path.with_suffix(".tmp.npz")
+        numpy.savez(temporary,vertices=ret[0],indices=ret[1])
+        os.replace(temporary,path)
+    return ret
+
+
+def _collapses(positions:numpy.ndarray,faces:numpy.ndarray,sources,targets,costs) -> tuple:
+    ties = (sources.astype(numpy.uint64)*numpy.uint64(2654435761)+targets.astype(numpy.uint64))%numpy.uint64(4294967291)
+    ranks = numpy.empty(len(costs),numpy.int64)
+    ranks[numpy.lexsort((ties,costs))] = numpy.arange(len(costs))
+    best = numpy.full(len(positions),len(costs),numpy.int64)
+    numpy.minimum.at(best,sources,ranks)
+    numpy.minimum.at(best,targets,ranks)
+    chosen = (best[sources] == ranks)&(best[targets] == ranks)
+    (sources,targets,ranks) = (sources[chosen],targets[chosen],ranks[chosen])
+    owners = numpy.full(len(positions),-1,numpy.int64)
+    owners[sources] = numpy.arange(len(sources))
+    valid = numpy.ones(len(sources),bool)
+    faceOwners = owners[faces]
+    conflicts = faceOwners[(faceOwners >= 0).sum(axis=1) > 1]
+    if len(conflicts):
+        lowest = numpy.where(conflicts >= 0,ranks[conflicts],len(costs)).min(axis=1)
+        valid[conflicts[(conflicts >= 0)&(ranks[conflicts] != lowest[:,None])]] = False
+    owners[sources[~valid]] = -1
+    faceOwners = owners[faces]
+    touched = (faceOwners >= 0).any(axis=1)
+    corners = faces[touched]
+    owner = faceOwners[touched].max(axis=1)
+    moved = numpy.where(corners == sources[owner][:,None],targets[owner][:,None],corners)
+    alive = (moved[:,0] != moved[:,1])&(moved[:,1] != moved[:,2])&(moved[:,2] != moved[:,0])
+    before = _normals(positions,corners[alive])
+    after = _normals(positions,moved[alive])
+    valid[owner[alive][(before*after).sum(axis=1) <= 0]] = False
+    return (numpy.flatnonzero(chosen),valid)
+
+
+def _normals(positions:numpy.ndarray,faces:numpy.ndarray) -> numpy.ndarray:
+    corners = positions[faces]
+    return numpy.cross(corners[:,1]-corners[:,0],corners[:,2]-corners[:,0])
+
+
+def _quadrics(positions:numpy.ndarray,faces:numpy.ndarray) -> numpy.ndarray:
+    normals = _normals(positions,faces)
+    normals /= numpy.maximum(numpy.linalg.norm(normals,axis=1),1e-30)[:,None]
+    planes = numpy.hstack((normals,-(normals*positions[faces[:,0]]).sum(axis=1)[:,None]))
+    ret = numpy.zeros((len(positions),4,4))
+    faceQuadrics = planes[:,:,None]*planes[:,None,:]
+    for corner in range(3):
+        numpy.add.at(ret,faces[:,corner],faceQuadrics)
+    edges = numpy.concatenate((faces[:,[0,1]],faces[:,[1,2]],faces[:,[2,0]]))
+    (keys,inverse,counts) = numpy.unique(numpy.sort(edges,axis=1),axis=0,return_inverse=True,return_counts=True)
+    border = counts[inverse.ravel()] == 1
+    directions = positions[edges[border,1]]-positions[edges[border,0]]
+    normals = numpy.cross(directions,numpy.tile(normals,(3,1))[border])
+    normals /= numpy.maximum(numpy.linalg.norm(normals,axis=1),1e-30)[:,None]
+    planes = numpy.hstack((normals,-(normals*positions[edges[border,0]]).sum(axis=1)[:,None]))
+    borderQuadrics = BORDER_WEIGHT*planes[:,:,None]*planes[:,None,:]
+    for corner in range(2):
+        numpy.add.at(ret,edges[border,corner],borderQuadrics)
+    return ret
+
+
+def _rows(vertices,vertexSize:int) -> numpy.ndarray:
+    vertices = numpy.ascontiguousarray(vertices)
+    if (
+        vertexSize <= 0
+        or not vertices.size
+        or (vertices.size%vertexSize) != 0
+        ):
+        raise RuntimeError
+    return vertices.reshape(-1,vertexSize)
+
+
+def _triangles(indices) -> numpy.ndarray:
+    indices = numpy.ascontiguousarray(indices).ravel().astype(numpy.int64)
+    if (
+        not indices.size
+        or (indices.size%3) != 0
+        or indices.min() < 0
+        ):
+        raise RuntimeError
+    return indices
+
+
+def simplify(vertices,vertexSize:int,indices,targetCount:int,maxError:float = numpy.inf) -> tuple:
+    positions = _rows(vertices,vertexSize)[:,:3].astype(numpy.float64)
+    faces = _triangles(indices).reshape(-1,3)
+    if (
+        targetCount < 0
+        or faces.max() >= len(positions)
+        ):
+        raise RuntimeError
+    quadrics = _quadrics(positions,faces)
+    (_,first,inverse) = numpy.unique(positions,axis=0,return_index=True,return_inverse=True)
+    locked = numpy.bincount(inverse.ravel(),minlength=len(first))[inverse.ravel()] > 1
+    homogeneous = numpy.hstack((positions,numpy.ones((len(positions),1))))
+    error = 0.0
+    while len(faces) > targetCount:
+        edges = numpy.concatenate((faces[:,[0,1]],faces[:,[1,2]],faces[:,[2,0]]))
+        edges = numpy.unique(numpy.concatenate((edges,edges[:,::-1])),axis=0)
+        edges = edges[~locked[edges[:,0]]]
+        if not len(edges):
+            break
+        (sources,targets) = (edges[:,0],edges[:,1])
+        points = homogeneous[targets]
+        costs = numpy.maximum(numpy.einsum("ni,nij,nj->n",points,quadrics[sources]+quadrics[targets],points),0)
+        keep = costs <= maxError*maxError
+        (sources,targets,costs) = (sources[keep],targets[keep],costs[keep])
+        if not len(costs):
+            break
+        available = numpy.ones(len(costs),bool)
+        order = numpy.zeros(0,numpy.int64)
+        while (
+            not len(order)
+            and available.any()
+            ):
+            candidates = numpy.flatnonzero(available)
+            (chosen,valid) = _collapses(positions,faces,sources[candidates],targets[candidates],costs[candidates])
+            available[candidates[chosen]] = False
+            order = candidates[chosen[valid]]
+        if not len(order):
+            break
+        order = order[numpy.argsort(costs[order],kind="stable")][:max((len(faces)-targetCount+1)//2,1)]
+        remap = numpy.arange(len(positions))
+        remap[sources[order]] = targets[order]
+        quadrics[targets[order]] += quadrics[sources[order]]
+        faces = remap[faces]
+        faces = faces[(faces[:,0] != faces[:,1])&(faces[:,1] != faces[:,2])&(faces[:,2] != faces[:,0])]
+        error = max(error,float(numpy.sqrt(costs[order].max())))
+    return (compactIndices(faces),error)
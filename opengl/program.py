@@ -1,32 +1,63 @@
+from OpenGL.GL import GL_ACTIVE_RESOURCES
+from OpenGL.GL import GL_ARRAY_SIZE
+from OpenGL.GL import GL_BLOCK_INDEX
 from OpenGL.GL import GL_COMPILE_STATUS
 from OpenGL.GL import GL_FALSE
+from OpenGL.GL import GL_FLOAT_MAT4
+from OpenGL.GL import GL_FLOAT_VEC3
 from OpenGL.GL import GL_INVALID_INDEX
 from OpenGL.GL import GL_LINK_STATUS
+from OpenGL.GL import GL_LOCATION
+from OpenGL.GL import GL_NAME_LENGTH
+from OpenGL.GL import GL_PROGRAM_BINARY_RETRIEVABLE_HINT
+from OpenGL.GL import GL_PROGRAM_INPUT
+from OpenGL.GL import GL_SHADER_BINARY_FORMAT_SPIR_V
 from OpenGL.GL import GL_SHADER_STORAGE_BLOCK
+from OpenGL.GL import GL_TRUE
+from OpenGL.GL import GL_TYPE
+from OpenGL.GL import GL_UNIFORM
+from OpenGL.GL import GL_UNIFORM_BLOCK
 from OpenGL.GL import glAttachShader
 from OpenGL.GL import glCompileShader
 from OpenGL.GL import glCreateProgram
 from OpenGL.GL import glCreateShader
 from OpenGL.GL import glDeleteProgram
 from OpenGL.GL import glDeleteShader
-from OpenGL.GL import glGetAttribLocation
 from OpenGL.GL import glGetProgramInfoLog
-from OpenGL.GL import glGetProgramResourceIndex
+from OpenGL.GL import glGetProgramInterfaceiv
+from OpenGL.GL import glGetProgramResourceName
+from OpenGL.GL import glGetProgramResourceiv
 from OpenGL.GL import glGetProgramiv
 from OpenGL.GL import glGetShaderInfoLog
 from OpenGL.GL import glGetShaderiv
-from OpenGL.GL import glGetUniformBlockIndex
-from OpenGL.GL import glGetUniformLocation
 from OpenGL.GL import glLinkProgram
+from OpenGL.GL import glProgramParameteri
+from OpenGL.GL import glShaderBinary
 from OpenGL.GL import glShaderSource
 from OpenGL.GL import glShaderStorageBlockBinding
+from OpenGL.GL import glSpecializeShader
 from OpenGL.GL import glUniform1i
 from OpenGL.GL import glUniform3f
 from OpenGL.GL import glUniformBlockBinding
 from OpenGL.GL import glUniformMatrix4fv
 from OpenGL.GL import glUseProgram
+from OpenGL.GL.ARB.parallel_shader_compile import glMaxShaderCompilerThreadsARB
+from OpenGL.GL.KHR.parallel_shader_compile import GL_COMPLETION_STATUS_KHR
+from OpenGL.GL.KHR.parallel_shader_compile import glMaxShaderCompilerThreadsKHR
 from OpenGL.constant import IntConstant as glIntConstant
 from PySide6.QtGui import QMatrix4x4
+from concurrent.futures import Future
+from ctypes import create_string_buffer
+from opengl.layout import BlockLayout
+from opengl.layout import TYPES
+from opengl.ProgramCache import programCache
+import hashlib
+import numpy
+
+COMPILER_THREADS = 0xFFFFFFFF
+
+_parallelCompile = None
+
 
 class SSBlock:
 
@@ -36,48 +67,57 @@ class SSBlock:
         self.__program = program
         self.__index = index
 
-    def setBlockBinding(self,binding:int) -> None:
-        glShaderStorageBlockBinding(self.__program,self.__index,binding)
-
-
-class SSBlockHandler:
+    def index(self) -> int:
+        return self.__index
 
-    def __init__(self,program):
-        self.__program = program
+    def layout(self) -> BlockLayout:
+        return BlockLayout.fromProgram(self.__program,GL_SHADER_STORAGE_BLOCK,self.__index)
 
-    def __getattr__(self,name:str):
-        return SSBlock(
-            self.__program
-            ,glGetProgramResourceIndex(self.__program,GL_SHADER_STORAGE_BLOCK,name)
-            )
+    def setBlockBinding(self,binding:int) -> None:
+        glShaderStorageBlockBinding(self.__program,self.__index,binding)
 
 
 class Uniform:
 
-    def __init__(self,location:int):
+    def __init__(self,location:int,name:str = "",type:glIntConstant = None,size:int = 1):
         if location == -1:
             raise RuntimeError
         self.__location = location
+        self.__name = name
+        self.__type = type
+        self.__size = size
+
+    def location(self) -> int:
+        return self.__location
+
+    def name(self) -> str:
+        return self.__name
+
+    def size(self) -> int:
+        return self.__size
+
+    def type(self) -> glIntConstant:
+        return self.__type
 
     def set1i(self,v0) -> None:
+        if (
+            self.__type in TYPES
+            and TYPES[self.__type][0] in ("<f4","<f8")
+            ):
+            raise RuntimeError
         glUniform1i(self.__location,v0)
 
     def set3f(self,v0,v1,v2) -> None:
+        if self.__type not in (None,GL_FLOAT_VEC3):
+            raise RuntimeError
         glUniform3f(self.__location,v0,v1,v2)
 
     def setMatrix4f(self,value:QMatrix4x4) -> None:
+        if self.__type not in (None,GL_FLOAT_MAT4):
+            raise RuntimeError
         glUniformMatrix4fv(self.__location,1,GL_FALSE,value.data())
 
 
-class UniformHandler:
-
-    def __init__(self,program):
-        self.__program = program
-
-    def __getattr__(self,name:str):
-        return Uniform(glGetUniformLocation(self.__program,name))
-
-
 class UniformBlock:
 
     def __init__(self,program,index:int):
@@ -86,42 +126,67 @@ class UniformBlock:
         self.__program = program
         self.__index = index
 
+    def index(self) -> int:
+        return self.__index
+
+    def layout(self) -> BlockLayout:
+        return BlockLayout.fromProgram(self.__program,GL_UNIFORM_BLOCK,self.__index)
+
     def setBlockBinding(self,binding:int) -> None:
         glUniformBlockBinding(self.__program,self.__index,binding)
 
 
-class UniformBlockHandler:
+class ResourceHandler:
 
-    def __init__(self,program):
-        self.__program = program
+    def __init__(self,resources:dict):
+        self.__resources = resources
+
+    def __contains__(self,name:str):
+        return name in self.__resources
 
     def __getattr__(self,name:str):
-        return UniformBlock(self.__program,glGetUniformBlockIndex(self.__program,name))
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def __getitem__(self,name:str):
+        ret = self.__resources.get(name)
+        if ret is None:
+            raise RuntimeError
+        return ret
+
+    def __iter__(self):
+        return iter(self.__resources)
+
+    def __len__(self):
+        return len(self.__resources)
 
 
 class Program:
 
-    def __init__(self,*shaders):
-        self.__id = glCreateProgram()
+    def __init__(self,*shaders,wait:bool = True):
         for s in shaders:
             if not isinstance(s,Shader):
                 raise RuntimeError
-            glAttachShader(self.__id,s.id())
-        glLinkProgram(self.__id)
-        linked = glGetProgramiv(self.__id,GL_LINK_STATUS)
-        if not linked:
-            info = glGetProgramInfoLog(self.__id).decode()
-            print(f"Error linking program:\n{info}")
-            glDeleteProgram(self.__id)
-            raise RuntimeError
-        self.uniform = UniformHandler(self.__id)
-        self.ubo = UniformBlockHandler(self.__id)
-        self.ssbo = SSBlockHandler(self.__id)
+        self.__id = glCreateProgram()
+        self.__attributes = {}
+        self.__future = Future()
+        self.__shaders = None
+        cache = programCache()
+        self.__key = None if cache is None else cache.key([(s.type(),s.digest()) for s in shaders])
+        if (
+            self.__key is None
+            or not cache.load(self.__id,self.__key)
+            ):
+            self.__link(shaders,self.__key is not None)
+        if wait:
+            self.wait()
 
     def __del__(self):
         glDeleteProgram(self.__id)
 
     def __enter__(self):
+        self.wait()
         glUseProgram(self.__id)
         return self
 
@@ -130,15 +195,94 @@ class Program:
         return False
 
     def __getattr__(self,name:str):
-        ret = glGetAttribLocation(self.__id,name)
-        if ret == -1:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not self.__future.done():
+            self.wait()
+            return getattr(self,name)
+        ret = self.__attributes.get(name)
+        if ret is None:
             raise RuntimeError
-        return ret
+        return ret[0]
+
+    def attributes(self) -> dict:
+        self.wait()
+        return self.__attributes
+
+    def future(self) -> Future:
+        return self.__future
+
+    def id(self):
+        return self.__id
+
+    def isReady(self) -> bool:
+        if (
+            not self.__future.done()
+            and self.__shaders is not None
+            and parallelCompile()
+            ):
+            status = numpy.zeros(1,numpy.int32)
+            glGetProgramiv(self.__id,GL_COMPLETION_STATUS_KHR,status)
+            if not status[0]:
+                return False
+        self.wait()
+        return True
 
     def setSamplerBinding(self,name:str,binding:int) -> None:
         if binding < 0:
             raise RuntimeError
-        glUniform1i(glGetUniformLocation(self.__id,name),binding)
+        self.uniform[name].set1i(binding)
+
+    def wait(self) -> None:
+        if not self.__future.done():
+            try:
+                self.__finish()
+                self.__future.set_result(self)
+            except RuntimeError as error:
+                self.__future.set_exception(error)
+        self.__future.result()
+
+    def __finish(self) -> None:
+        if self.__shaders is not None:
+            shaders = self.__shaders
+            self.__shaders = None
+            if not glGetProgramiv(self.__id,GL_LINK_STATUS):
+                for s in shaders:
+                    s.id()
+                info = glGetProgramInfoLog(self.__id).decode()
+                print(f"Error linking program:\n{info}")
+                raise RuntimeError
+            if self.__key is not None:
+                programCache().store(self.__id,self.__key)
+        for (name,(type,size,location)) in _resources(self.__id,GL_PROGRAM_INPUT,(GL_TYPE,GL_ARRAY_SIZE,GL_LOCATION)):
+            if location != -1:
+                self.__attributes[_baseName(name)] = (location,type,size)
+        uniforms = {}
+        properties = (GL_TYPE,GL_ARRAY_SIZE,GL_LOCATION,GL_BLOCK_INDEX)
+        for (name,(type,size,location,block)) in _resources(self.__id,GL_UNIFORM,properties):
+            if (
+                block == -1
+                and location != -1
+                ):
+                uniforms[name] = Uniform(location,name,type,size)
+                uniforms.setdefault(_baseName(name),uniforms[name])
+        self.uniform = ResourceHandler(uniforms)
+        self.ubo = ResourceHandler({
+            _baseName(name): UniformBlock(self.__id,i)
+            for (i,(name,_)) in enumerate(_resources(self.__id,GL_UNIFORM_BLOCK,()))
+            })
+        self.ssbo = ResourceHandler({
+            _baseName(name): SSBlock(self.__id,i)
+            for (i,(name,_)) in enumerate(_resources(self.__id,GL_SHADER_STORAGE_BLOCK,()))
+            })
+
+    def __link(self,shaders:tuple,retrievable:bool) -> None:
+        for s in shaders:
+            glAttachShader(self.__id,s.submit())
+        if retrievable:
+            glProgramParameteri(self.__id,GL_PROGRAM_BINARY_RETRIEVABLE_HINT,GL_TRUE)
+        glLinkProgram(self.__id)
+        self.__shaders = shaders
 
 
 class Shader:
@@ -146,21 +290,168 @@ class Shader:
     @staticmethod
     def fromFile(path:str,type:glIntConstant):
         with open(path,"r") as file:
-            return Shader(file.readall(),type)
+            return Shader(file.read(),type)
+
+    @staticmethod
+    def fromSpirv(binary,type:glIntConstant,entryPoint:str = "main",constants:dict = None):
+        ret = Shader(None,type)
+        ret.__binary = bytes(binary)
+        ret.__entryPoint = entryPoint
+        ret.__constants = dict(constants or {})
+        ret.__specialization = _specializationConstants(ret.__constants)
+        if (
+            not ret.__binary
+            or (len(ret.__binary)%4) != 0
+            ):
+            raise RuntimeError
+        return ret
+
+    @staticmethod
+    def fromSpirvFile(path:str,type:glIntConstant,entryPoint:str = "main",constants:dict = None):
+        with open(path,"rb") as file:
+            return Shader.fromSpirv(file.read(),type,entryPoint,constants)
 
     def __init__(self,source:str,type:glIntConstant):
-        self.__id = glCreateShader(type)
-        glShaderSource(self.__id,source)
-        glCompileShader(self.__id)
+        self.__source = source
+        self.__type = type
+        self.__binary = None
+        self.__entryPoint = None
+        self.__constants = {}
+        self.__specialization = None
+        self.__digest = None
+        self.__id = None
+        self.__checked = False
+
+    def __del__(self):
+        if self.__id is not None:
+            glDeleteShader(self.__id)
+
+    def binary(self) -> bytes:
+        return self.__binary
+
+    def constants(self) -> dict:
+        return dict(self.__constants)
+
+    def digest(self) -> str:
+        if self.__digest is None:
+            if self.__binary is None:
+                ret = hashlib.sha256(self.__source.encode())
+            else:
+                ret = hashlib.sha256(self.__binary)
+                ret.update(self.__entryPoint.encode()+b"\0")
+                ret.update(self.__specialization[0].tobytes()+self.__specialization[1].tobytes())
+            self.__digest = ret.hexdigest()
+        return self.__digest
+
+    def entryPoint(self) -> str:
+        return self.__entryPoint
+
+    def id(self):
+        self.submit()
+        if not self.__checked:
+            self.__check()
+        return self.__id
+
+    def isReady(self) -> bool:
+        self.submit()
+        if (
+            not self.__checked
+            and parallelCompile()
+            ):
+            status = numpy.zeros(1,numpy.int32)
+            glGetShaderiv(self.__id,GL_COMPLETION_STATUS_KHR,status)
+            if not status[0]:
+                return False
+        self.id()
+        return True
+
+    def source(self) -> str:
+        return self.__source
+
+    def submit(self):
+        if self.__id is None:
+            if (
+                self.__binary is not None
+                and not bool(glSpecializeShader)
+                ):
+                raise RuntimeError
+            self.__id = glCreateShader(self.__type)
+            if self.__binary is None:
+                glShaderSource(self.__id,self.__source)
+                glCompileShader(self.__id)
+            else:
+                glShaderBinary(
+                    1
+                    ,numpy.array([self.__id],numpy.uint32)
+                    ,GL_SHADER_BINARY_FORMAT_SPIR_V
+                    ,self.__binary
+                    ,len(self.__binary)
+                    )
+                (indices,values) = self.__specialization
+                glSpecializeShader(self.__id,self.__entryPoint.encode(),len(indices),indices,values)
+            self.__checked = False
+        return self.__id
+
+    def type(self) -> glIntConstant:
+        return self.__type
+
+    def __check(self) -> None:
         success = glGetShaderiv(self.__id,GL_COMPILE_STATUS)
         if not success:
             info = glGetShaderInfoLog(self.__id).decode()
             print(f"Shader compilation failed:\n{info}")
             glDeleteShader(self.__id)
+            self.__id = None
             raise RuntimeError
-
-    def __del__(self):
-        glDeleteShader(self.__id)
-
-    def id(self):
-        return self.__id
+        self.__checked = True
+
+
+def parallelCompile() -> bool:
+    global _parallelCompile
+    if _parallelCompile is None:
+        _parallelCompile = False
+        for function in (glMaxShaderCompilerThreadsKHR,glMaxShaderCompilerThreadsARB):
+            if bool(function):
+                function(COMPILER_THREADS)
+                _parallelCompile = True
+                break
+    return _parallelCompile
+
+
+def _specializationConstants(constants:dict) -> tuple:
+    indices = numpy.array(sorted(constants),numpy.uint32)
+    values = numpy.zeros(len(indices),numpy.uint32)
+    for (i,index) in enumerate(indices.tolist()):
+        value = constants[index]
+        if isinstance(value,float):
+            values[i] = numpy.array(value,numpy.float32).view(numpy.uint32)
+        else:
+            values[i] = numpy.array(int(value),numpy.int64).astype(numpy.uint32)
+    return (indices,values)
+
+
+def _baseName(name:str) -> str:
+    return name[:-3] if name.endswith("[0]") else name
+
+
+def _resources(program:int,interface:glIntConstant,properties:tuple) -> list:
+    count = numpy.zeros(1,numpy.int32)
+    glGetProgramInterfaceiv(program,interface,GL_ACTIVE_RESOURCES,count)
+    properties = (GL_NAME_LENGTH,)+tuple(properties)
+    ret = []
+    for i in range(int(count[0])):
+        params = numpy.zeros(len(properties),numpy.int32)
+        glGetProgramResourceiv(
+            program
+            ,interface
+            ,i
+            ,len(properties)
+            ,numpy.array(properties,numpy.uint32)
+            ,len(properties)
+            ,None
+            ,params
+            )
+        name = create_string_buffer(int(params[0]))
+        glGetProgramResourceName(program,interface,i,int(params[0]),None,name)
+        ret.append((name.value.decode(),[int(v) for v in params[1:]]))
+    return ret
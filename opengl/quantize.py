@@ -0,0 +1,72 @@
+import numpy
+
+
+def toHalf(values) -> numpy.ndarray:
+    return numpy.asarray(values,numpy.float32).astype(numpy.float16)
+
+
+def toNormalizedByte(values) -> numpy.ndarray:
+    return _normalize(values,numpy.int8)
+
+
+def toNormalizedShort(values) -> numpy.ndarray:
+    return _normalize(values,numpy.int16)
+
+
+def toNormalizedUnsignedByte(values) -> numpy.ndarray:
+    return _normalize(values,numpy.uint8)
+
+
+def toNormalizedUnsignedShort(values) -> numpy.ndarray:
+    return _normalize(values,numpy.uint16)
+
+
+def packInt2101010(values,w = 0) -> numpy.ndarray:
+    values = numpy.asarray(values,numpy.float32)
+    if values.shape[-1:] != (3,):
+        raise RuntimeError
+    xyz = numpy.rint(numpy.clip(values,-1,1)*511).astype(numpy.int32)&0x3FF
+    w = numpy.asarray(w,numpy.int32)&0x3
+    return (
+        xyz[...,0].astype(numpy.uint32)
+        |(xyz[...,1].astype(numpy.uint32) << 10)
+        |(xyz[...,2].astype(numpy.uint32) << 20)
+        |(w.astype(numpy.uint32) << 30)
+        )
+
+
+def unpackInt2101010(values) -> numpy.ndarray:
+    values = numpy.asarray(values,numpy.uint32)
+    xyz = numpy.stack([(values >> s)&0x3FF for s in (0,10,20)],-1).astype(numpy.int32)
+    xyz = numpy.where(xyz >= 512,xyz-1024,xyz)
+    return numpy.maximum(xyz/511.0,-1.0).astype(numpy.float32)
+
+
+def interleave(*attributes) -> tuple:
+    if not attributes:
+        raise RuntimeError
+    attributes = [numpy.asarray(a) for a in attributes]
+    count = len(attributes[0])
+    (names,formats,offsets) = ([],[],[])
+    offset = 0
+    for (i,a) in enumerate(attributes):
+        if len(a) != count:
+            raise RuntimeError
+        names.append(f"a{i}")
+        formats.append((a.dtype,a.shape[1:]))
+        offsets.append(offset)
+        offset += _align(numpy.dtype((a.dtype,a.shape[1:])).itemsize)
+    ret = numpy.zeros(count,{"names":names,"formats":formats,"offsets":offsets,"itemsize":offset})
+    for (name,a) in zip(names,attributes):
+        ret[name] = a
+    return (ret,tuple(offsets),offset)
+
+
+def _align(size:int) -> int:
+    return (size+3)&~3
+
+
+def _normalize(values,dtype) -> numpy.ndarray:
+    info = numpy.iinfo(dtype)
+    values = numpy.clip(numpy.asarray(values,numpy.float32),-1 if info.min < 0 else 0,1)
+    return numpy.rint(values*info.max).astype(dtype)
@@ -0,0 +1,85 @@
+from OpenGL.GL import GL_BYTE
+from OpenGL.GL import GL_DEPTH_COMPONENT
+from OpenGL.GL import GL_FLOAT
+from OpenGL.GL import GL_HALF_FLOAT
+from OpenGL.GL import GL_INT
+from OpenGL.GL import GL_PACK_ALIGNMENT
+from OpenGL.GL import GL_PIXEL_PACK_BUFFER
+from OpenGL.GL import GL_RED
+from OpenGL.GL import GL_RED_INTEGER
+from OpenGL.GL import GL_RG
+from OpenGL.GL import GL_RGB
+from OpenGL.GL import GL_RGBA
+from OpenGL.GL import GL_RGBA_INTEGER
+from OpenGL.GL import GL_RG_INTEGER
+from OpenGL.GL import GL_RGB_INTEGER
+from OpenGL.GL import GL_SHORT
+from OpenGL.GL import GL_STREAM_READ
+from OpenGL.GL import GL_UNSIGNED_BYTE
+from OpenGL.GL import GL_UNSIGNED_INT
+from OpenGL.GL import GL_UNSIGNED_SHORT
+from OpenGL.GL import glBindBuffer
+from OpenGL.GL import glGetIntegerv
+from OpenGL.GL import glPixelStorei
+from OpenGL.GL import glReadPixels
+from OpenGL.constant import IntConstant as glIntConstant
+from opengl import Buffer
+from opengl.Buffer import PendingRead
+import numpy
+
+PIXEL_COMPONENTS = {
+    GL_RED: 1
+    ,GL_RG: 2
+    ,GL_RGB: 3
+    ,GL_RGBA: 4
+    ,GL_RED_INTEGER: 1
+    ,GL_RG_INTEGER: 2
+    ,GL_RGB_INTEGER: 3
+    ,GL_RGBA_INTEGER: 4
+    ,GL_DEPTH_COMPONENT: 1
+}
+
+PIXEL_TYPES = {
+    GL_BYTE: numpy.int8
+    ,GL_UNSIGNED_BYTE: numpy.uint8
+    ,GL_SHORT: numpy.int16
+    ,GL_UNSIGNED_SHORT: numpy.uint16
+    ,GL_INT: numpy.int32
+    ,GL_UNSIGNED_INT: numpy.uint32
+    ,GL_HALF_FLOAT: numpy.float16
+    ,GL_FLOAT: numpy.float32
+}
+
+
+def pixelLayout(format:glIntConstant,type:glIntConstant) -> tuple:
+    if (
+        format not in PIXEL_COMPONENTS
+        or type not in PIXEL_TYPES
+        ):
+        raise RuntimeError
+    return (PIXEL_COMPONENTS[format],numpy.dtype(PIXEL_TYPES[type]))
+
+
+def readPixelsAsync(
+    x:int
+    ,y:int
+    ,width:int
+    ,height:int
+    ,format:glIntConstant = GL_RGBA
+    ,type:glIntConstant = GL_UNSIGNED_BYTE
+    ) -> PendingRead:
+    if (
+        width <= 0
+        or height <= 0
+        ):
+        raise RuntimeError
+    (components,dtype) = pixelLayout(format,type)
+    shape = (height,width,components)
+    staging = Buffer(width*height*components*dtype.itemsize,GL_STREAM_READ)
+    staging.bind(GL_PIXEL_PACK_BUFFER)
+    alignment = int(glGetIntegerv(GL_PACK_ALIGNMENT))
+    glPixelStorei(GL_PACK_ALIGNMENT,1)
+    glReadPixels(x,y,width,height,format,type,0)
+    glPixelStorei(GL_PACK_ALIGNMENT,alignment)
+    glBindBuffer(GL_PIXEL_PACK_BUFFER,0)
+    return PendingRead(staging,dtype,shape)
@@ -1,20 +1,31 @@
+from OpenGL.GL import GL_PACK_ALIGNMENT
+from OpenGL.GL import GL_PIXEL_PACK_BUFFER
 from OpenGL.GL import GL_RGBA
 from OpenGL.GL import GL_RGBA8
+from OpenGL.GL import GL_STREAM_READ
 from OpenGL.GL import GL_TEXTURE0
 from OpenGL.GL import GL_TEXTURE_1D
 from OpenGL.GL import GL_TEXTURE_2D
 from OpenGL.GL import GL_TEXTURE_2D_ARRAY
+from OpenGL.GL import GL_TEXTURE_DEPTH
+from OpenGL.GL import GL_TEXTURE_HEIGHT
 from OpenGL.GL import GL_TEXTURE_MAG_FILTER
 from OpenGL.GL import GL_TEXTURE_MIN_FILTER
+from OpenGL.GL import GL_TEXTURE_WIDTH
 from OpenGL.GL import GL_TEXTURE_WRAP_R
 from OpenGL.GL import GL_TEXTURE_WRAP_S
 from OpenGL.GL import GL_TEXTURE_WRAP_T
 from OpenGL.GL import GL_UNSIGNED_BYTE
 from OpenGL.GL import glActiveTexture
+from OpenGL.GL import glBindBuffer
 from OpenGL.GL import glBindTexture
 from OpenGL.GL import glCreateTextures
 from OpenGL.GL import glDeleteTextures
 from OpenGL.GL import glGenerateTextureMipmap
+from OpenGL.GL import glGetIntegerv
+from OpenGL.GL import glGetTextureImage
+from OpenGL.GL import glGetTextureLevelParameteriv
+from OpenGL.GL import glPixelStorei
 from OpenGL.GL import glTextureParameteri
 from OpenGL.GL import glTextureStorage1D
 from OpenGL.GL import glTextureStorage2D
@@ -24,8 +35,13 @@ from OpenGL.GL import glTextureSubImage2D
 from OpenGL.GL import glTextureSubImage3D
 from OpenGL.constant import IntConstant as glIntConstant
 from PySide6.QtGui import QImage
+from ctypes import c_int
 from ctypes import c_ubyte
 from ctypes import c_uint
+from ctypes import c_void_p
+from opengl import Buffer
+from opengl.Buffer import PendingRead
+from opengl.readback import pixelLayout
 
 
 class Texture:
@@ -35,6 +51,7 @@ class Texture:
         glCreateTextures(type,1,id)
         self.__id = id.value
         self.__type = type
+        self.__staging = {}
 
     def __del__(self):
         glDeleteTextures(1,(self.__id,))
@@ -48,6 +65,37 @@ class Texture:
     def id(self):
         return self.__id
 
+    def readAsync(
+        self
+        ,level:int = 0
+        ,format:glIntConstant = GL_RGBA
+        ,type:glIntConstant = GL_UNSIGNED_BYTE
+        ) -> PendingRead:
+        if level < 0:
+            raise RuntimeError
+        (components,dtype) = pixelLayout(format,type)
+        (width,height,depth) = (
+            self.__levelParameter(level,GL_TEXTURE_WIDTH)
+            ,self.__levelParameter(level,GL_TEXTURE_HEIGHT)
+            ,self.__levelParameter(level,GL_TEXTURE_DEPTH)
+            )
+        if self.__type == GL_TEXTURE_1D:
+            shape = (width,components)
+        elif self.__type == GL_TEXTURE_2D:
+            shape = (height,width,components)
+        else:
+            shape = (depth,height,width,components)
+        size = width*height*depth*components*dtype.itemsize
+        pool = self.__staging.setdefault(size,[])
+        staging = pool.pop() if pool else Buffer(size,GL_STREAM_READ)
+        staging.bind(GL_PIXEL_PACK_BUFFER)
+        alignment = int(glGetIntegerv(GL_PACK_ALIGNMENT))
+        glPixelStorei(GL_PACK_ALIGNMENT,1)
+        glGetTextureImage(self.__id,level,format,type,size,c_void_p(0))
+        glPixelStorei(GL_PACK_ALIGNMENT,alignment)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER,0)
+        return PendingRead(staging,dtype,shape,pool)
+
     def setMagnifyFilter(self,value:glIntConstant) -> None:
         glTextureParameteri(self.__id,GL_TEXTURE_MAG_FILTER,value)
 
@@ -63,6 +111,11 @@ class Texture:
     def setWrapR(self,value:glIntConstant) -> None:
         glTextureParameteri(self.__id,GL_TEXTURE_WRAP_R,value)
 
+    def __levelParameter(self,level:int,name:glIntConstant) -> int:
+        ret = c_int()
+        glGetTextureLevelParameteriv(self.__id,level,name,ret)
+        return ret.value
+
 
 class Texture1D(Texture):
 
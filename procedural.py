@@ -1,10 +1,10 @@
 from OpenGL.GL import GL_CLAMP_TO_EDGE
 from OpenGL.GL import GL_DEPTH_BUFFER_BIT
+from OpenGL.GL import GL_DYNAMIC_DRAW
 from OpenGL.GL import GL_FLOAT
 from OpenGL.GL import GL_FRAGMENT_SHADER
 from OpenGL.GL import GL_LINEAR
 from OpenGL.GL import GL_NEAREST
-from OpenGL.GL import GL_STATIC_DRAW
 from OpenGL.GL import GL_TRIANGLE_STRIP
 from OpenGL.GL import GL_VERTEX_SHADER
 from OpenGL.GL import glClear
@@ -17,9 +17,8 @@ from ctypes import Structure as cStructure
 from ctypes import c_char
 from ctypes import c_float
 from ctypes import c_uint
-from opengl import Buffer
-from opengl import Program
-from opengl import Shader
+from opengl import MirroredStruct
+from opengl import programRegistry
 from opengl import Texture1D
 from opengl import VertexArray
 from random import uniform as randUniform
@@ -82,20 +81,20 @@ class Renderer(base.Renderer):
         self.__initSines()
 
     def _destroy(self):
-        del self.__sinesSSBO
+        del self.__sines
         del self.__texture
         del self.__vao
         del self.__program
 
     def _paint(self):
         if self.__updateSines:
-            for sine in self.__sines.sines:
+            for sine in self.__sines.value().sines:
                 sine.amplitude = randUniform(0,5)
                 sine.dropoff = randUniform(1,10)
                 sine.position = (randUniform(-2,2),randUniform(-2,2))
                 sine.frequency = randUniform(0.1,1)
                 sine.phase = randUniform(0,6.28)
-            self.__sinesSSBO.write(0,self.__sines)
+            self.__sines.flush()
             self.__updateSines = False
         glViewport(0,0,self.viewportSize().width(),self.viewportSize().height())
         with self.__program:
@@ -105,7 +104,7 @@ class Renderer(base.Renderer):
                 self.__projection.ortho(-a,a,-1,1,-1,1)
                 self.__projectionUniform.setMatrix4f(self.__projection)
             with self.__vao as vao:
-                self.__sinesSSBO.bindToShaderStorage(0)
+                self.__sines.buffer().bindToShaderStorage(0)
                 self.__texture.bind(0)
                 vao.draw()
         glClear(GL_DEPTH_BUFFER_BIT)
@@ -114,17 +113,17 @@ class Renderer(base.Renderer):
         self.__projection = None
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = programRegistry().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
         with self.__program as program:
             self.__projectionUniform = program.uniform.projection
 
     def __initSines(self):
-        self.__sines = Sines()
-        self.__sines.size = SINE_SIZE
-        self.__sinesSSBO = Buffer.fromData(self.__sines,GL_STATIC_DRAW)
+        sines = Sines()
+        sines.size = SINE_SIZE
+        self.__sines = MirroredStruct(sines,GL_DYNAMIC_DRAW)
         with self.__program as program:
             program.ssbo.SineBuffer.setBlockBinding(0)
 
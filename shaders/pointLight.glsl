@@ -0,0 +1,19 @@
+struct Light
+{
+    vec3 position;
+    vec3 color;
+    float power;
+};
+
+vec3 calcPointLight(Light light,vec3 cameraPos,vec3 fPos,vec3 fNorm,vec3 textureColor)
+{
+    vec3 ret = vec3(0.0);
+    vec3 ftl = light.position-fPos;
+    float d = length(ftl);
+    ftl = normalize(ftl);
+    vec3 ftc = normalize(cameraPos-fPos);
+    vec3 hw = normalize(ftl+ftc);
+    ret += textureColor*light.color*light.power*max(0.0,dot(fNorm,ftl))/pow(d,2);
+    ret += light.color*light.power*pow(max(0.0,dot(fNorm,hw)),32)/pow(d,2);
+    return ret;
+}
@@ -5,7 +5,6 @@ from OpenGL.GL import GL_FRAGMENT_SHADER
 from OpenGL.GL import GL_LINEAR
 from OpenGL.GL import GL_NEAREST
 from OpenGL.GL import GL_REPEAT
-from OpenGL.GL import GL_STATIC_DRAW
 from OpenGL.GL import GL_TRIANGLES
 from OpenGL.GL import GL_VERTEX_SHADER
 from OpenGL.GL import glClear
@@ -17,16 +16,12 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QMatrix4x4
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtGui import QVector4D
-from ctypes import Structure as cStructure
-from ctypes import c_char
-from ctypes import c_float
-from ctypes import c_uint
-from opengl import Buffer
-from opengl import Program
-from opengl import Shader
+from opengl import GpuVector
+from opengl import meshRegistry
+from opengl import shaderLibrary
 from opengl import Texture2D
-from opengl import VertexArray
 import base
+import numpy
 
 
 class Item(base.Item):
@@ -79,25 +74,6 @@ class Item(base.Item):
         renderer.setPhi(self.__phi)
 
 
-class PointLight(cStructure):
-    _fields_ = [
-        ("position",c_float*3)
-        ,("p0",c_char*4)
-        ,("color",c_float*3)
-        ,("power",c_float)
-    ]
-    _pack_ = 1
-
-
-class PointLights(cStructure):
-    _fields_ = [
-        ("size",c_uint)
-        ,("p0",c_char*12)
-        ,("lights",PointLight*5)
-    ]
-    _pack_ = 1
-
-
 class Renderer(base.Renderer):
 
     def __init__(self):
@@ -108,17 +84,6 @@ class Renderer(base.Renderer):
         self.__angle = 0.0
         self.__theta = 0.0
         self.__phi = 0.0
-        self.__lights = PointLights()
-        self.__lights.size = 3
-        self.__lights.lights[0].position = (2,2,5)
-        self.__lights.lights[0].color = (1,0,0)
-        self.__lights.lights[0].power = 5
-        self.__lights.lights[1].position = (-4,-4,0)
-        self.__lights.lights[1].color = (0,0,1)
-        self.__lights.lights[1].power = 7
-        self.__lights.lights[2].position = (2,2,-5)
-        self.__lights.lights[2].color = (0,1,0)
-        self.__lights.lights[2].power = 6
 
     def setAngle(self,value:float) -> None:
         self.__angle = value
@@ -136,7 +101,7 @@ class Renderer(base.Renderer):
         del self.__texture
         del self.__vao
         del self.__program
-        del self.__lightsSSBO
+        del self.__lights
 
     def _init(self):
         self.__initProgram()
@@ -174,20 +139,25 @@ class Renderer(base.Renderer):
                     self.__model.rotate(self.__angle,0,0,1)
                     self.__modelUniform.setMatrix4f(self.__model)
                 self.__texture.bind(0)
-                self.__lightsSSBO.bindToShaderStorage(0)
+                self.__lights.bindToShaderStorage(0)
                 vao.draw()
         glClear(GL_DEPTH_BUFFER_BIT)
 
     def __initLight(self):
-        self.__lightsSSBO = Buffer.fromData(self.__lights,GL_STATIC_DRAW)
         with self.__program as program:
             self.__cameraPositionUniform = program.uniform.cameraPosition
             program.ssbo.lightBuffer.setBlockBinding(0)
+            self.__lights = GpuVector(program.ssbo.lightBuffer.layout())
+        lights = numpy.zeros(3,self.__lights.layout().elementDtype())
+        lights["position"] = ((2,2,5),(-4,-4,0),(2,2,-5))
+        lights["color"] = ((1,0,0),(0,0,1),(0,1,0))
+        lights["power"] = (5,7,6)
+        self.__lights.assign(lights)
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = shaderLibrary().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
 
     def __initTexture(self):
@@ -206,47 +176,9 @@ class Renderer(base.Renderer):
             self.__projectionUniform = program.uniform.projection
 
     def __initVertices(self):
-        vertices = (
-            -0.5,-0.5,-0.5,0,0,0,0,-1
-            ,0.5,-0.5,-0.5,1,0,0,0,-1
-            ,0.5,0.5,-0.5,1,1,0,0,-1
-            ,0.5,0.5,-0.5,1,1,0,0,-1
-            ,-0.5,0.5,-0.5,0,1,0,0,-1
-            ,-0.5,-0.5,-0.5,0,0,0,0,-1
-            ,-0.5,-0.5,0.5,0,0,0,0,1
-            ,0.5,-0.5,0.5,1,0,0,0,1
-            ,0.5,0.5,0.5,1,1,0,0,1
-            ,0.5,0.5,0.5,1,1,0,0,1
-            ,-0.5,0.5,0.5,0,1,0,0,1
-            ,-0.5,-0.5,0.5,0,0,0,0,1
-            ,-0.5,0.5,0.5,1,0,-1,0,0
-            ,-0.5,0.5,-0.5,1,1,-1,0,0
-            ,-0.5,-0.5,-0.5,0,1,-1,0,0
-            ,-0.5,-0.5,-0.5,0,1,-1,0,0
-            ,-0.5,-0.5,0.5,0,0,-1,0,0
-            ,-0.5,0.5,0.5,1,0,-1,0,0
-            ,0.5,0.5,0.5,1,0,1,0,0
-            ,0.5,0.5,-0.5,1,1,1,0,0
-            ,0.5,-0.5,-0.5,0,1,1,0,0
-            ,0.5,-0.5,-0.5,0,1,1,0,0
-            ,0.5,-0.5,0.5,0,0,1,0,0
-            ,0.5,0.5,0.5,1,0,1,0,0
-            ,-0.5,-0.5,-0.5,0,1,0,-1,0
-            ,0.5,-0.5,-0.5,1,1,0,-1,0
-            ,0.5,-0.5,0.5,1,0,0,-1,0
-            ,0.5,-0.5,0.5,1,0,0,-1,0
-            ,-0.5,-0.5,0.5,0,0,0,-1,0
-            ,-0.5,-0.5,-0.5,0,1,0,-1,0
-            ,-0.5,0.5,-0.5,0,1,0,1,0
-            ,0.5,0.5,-0.5,1,1,0,1,0
-            ,0.5,0.5,0.5,1,0,0,1,0
-            ,0.5,0.5,0.5,1,0,0,1,0
-            ,-0.5,0.5,0.5,0,0,0,1,0
-            ,-0.5,0.5,-0.5,0,1,0,1,0
-        )
         with self.__program as program:
-            self.__vao = VertexArray.fromFloats(
-                vertices
+            self.__vao = meshRegistry().acquire(
+                base.CUBE_VERTICES
                 ,GL_TRIANGLES
                 ,(
                     (program.position,3,GL_FLOAT,32,0)
@@ -281,12 +213,7 @@ void main()
 
 _fragmentShaderSrc = """#version 430 core
 
-struct Light
-{
-    vec3 position;
-    vec3 color;
-    float power;
-};
+#include "pointLight.glsl"
 
 in vec2 fTexturePoint;
 in vec3 fPosition;
@@ -302,26 +229,13 @@ layout (std430) buffer lightBuffer
 
 out vec4 color;
 
-vec3 calcPointLight(Light light,vec3 fPos,vec3 fNorm,vec3 textureColor)
-{
-    vec3 ret = vec3(0.0);
-    vec3 ftl = light.position-fPos;
-    float d = length(ftl);
-    ftl = normalize(ftl);
-    vec3 ftc = normalize(cameraPosition-fPos);
-    vec3 hw = normalize(ftl+ftc);
-    ret += textureColor*light.color*light.power*max(0.0,dot(fNorm,ftl))/pow(d,2);
-    ret += light.color*light.power*pow(max(0.0,dot(fNorm,hw)),32)/pow(d,2);
-    return ret;
-}
-
 void main()
 {
     vec3 tc = texture(imageTexture,fTexturePoint).xyz;
     vec3 ret = 0.2*tc.xyz;
     for (uint i = 0;i < lightSize;i++)
     {
-        ret += calcPointLight(lights[i],fPosition,fNormal,tc);
+        ret += calcPointLight(lights[i],cameraPosition,fPosition,fNormal,tc);
     }
     color = vec4(ret,1.0);
 }
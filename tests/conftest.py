@@ -0,0 +1,19 @@
+from benchmark import Context
+import os
+import pytest
+
+if not (
+    os.environ.get("DISPLAY")
+    or os.environ.get("WAYLAND_DISPLAY")
+    ):
+    os.environ.setdefault("QT_QPA_PLATFORM","offscreen")
+
+
+@pytest.fixture
+def context():
+    try:
+        context = Context()
+    except RuntimeError:
+        pytest.skip("no OpenGL 4.5 context available")
+    with context:
+        yield context
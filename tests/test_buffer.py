@@ -0,0 +1,17 @@
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from opengl import Buffer
+import numpy
+
+
+def test_read_async_reuses_staging_buffers(context):
+    buffer = Buffer(64,GL_DYNAMIC_DRAW)
+    ids = set()
+    for i in range(8):
+        data = numpy.arange(16,dtype=numpy.uint32)+i
+        buffer.write(0,data)
+        pending = buffer.readAsync(0,64,numpy.uint32)
+        ids.add(pending._PendingRead__staging.id())
+        numpy.testing.assert_array_equal(pending.result(),data)
+    assert len(ids) == 1
+    (first,second) = (buffer.readAsync(0,16),buffer.readAsync(0,16))
+    assert first._PendingRead__staging is not second._PendingRead__staging
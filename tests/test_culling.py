@@ -0,0 +1,54 @@
+from PySide6.QtGui import QMatrix4x4
+from opengl.culling import Bvh
+from opengl.culling import cullBoxes
+from opengl.culling import frustumPlanes
+from opengl.culling import spheresToBoxes
+import numpy
+import pytest
+
+
+def _planes() -> numpy.ndarray:
+    matrix = QMatrix4x4()
+    matrix.perspective(45,16/9,0.1,100)
+    matrix.translate(0,0,-3)
+    matrix.rotate(30,-1,0,0)
+    return frustumPlanes(matrix)
+
+
+def _boxes(random,count:int,extent:float) -> tuple:
+    spheres = numpy.empty((count,4),numpy.float32)
+    spheres[:,:3] = random.uniform(-extent,extent,(count,3))
+    spheres[:,3] = random.uniform(0.01,0.5,count)
+    return spheresToBoxes(spheres)
+
+
+def _assertMatches(bvh:Bvh,planes:numpy.ndarray,minimum,maximum) -> None:
+    visible = bvh.cull(planes)
+    assert len(visible) == len(numpy.unique(visible))
+    numpy.testing.assert_array_equal(numpy.sort(visible),cullBoxes(planes,minimum,maximum))
+
+
+@pytest.mark.parametrize("count,leafSize,extent",(
+    (1,16,5)
+    ,(1000,16,5)
+    ,(1000,1,5)
+    ,(4099,7,20)
+    ,(20000,16,60)
+    ))
+def test_bvh_cull_matches_brute_force(count,leafSize,extent):
+    random = numpy.random.default_rng(count)
+    planes = _planes()
+    (minimum,maximum) = _boxes(random,count,extent)
+    bvh = Bvh(minimum,maximum,leafSize)
+    _assertMatches(bvh,planes,minimum,maximum)
+    for i in range(3):
+        moving = random.choice(count,max(count//10,1),replace=False)
+        (minimum[moving],maximum[moving]) = _boxes(random,len(moving),extent)
+        bvh.refit(minimum[moving],maximum[moving],moving)
+        _assertMatches(bvh,planes,minimum,maximum)
+    (minimum,maximum) = _boxes(random,count,extent)
+    bvh.refit(minimum,maximum)
+    _assertMatches(bvh,planes,minimum,maximum)
+    (minimum,maximum) = _boxes(random,count,extent)
+    bvh.rebuild(minimum,maximum)
+    _assertMatches(bvh,planes,minimum,maximum)
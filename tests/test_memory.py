@@ -0,0 +1,20 @@
+from array import array
+from opengl.memory import floatArray
+import ctypes
+import numpy
+
+
+def test_float_array_shares_float32_buffers():
+    data = array("f",[1.0,2.0,3.0])
+    result = floatArray(data)
+    numpy.testing.assert_array_equal(result,[1,2,3])
+    data[0] = 4.0
+    assert result[0] == 4
+
+
+def test_float_array_converts_other_element_types():
+    numpy.testing.assert_array_equal(floatArray(array("d",[1.0,2.0])),[1,2])
+    numpy.testing.assert_array_equal(floatArray((ctypes.c_double*2)(1.0,2.0)),[1,2])
+    numpy.testing.assert_array_equal(floatArray(memoryview(array("i",[1,-2]))),[1,-2])
+    numpy.testing.assert_array_equal(floatArray([1,2.5]),[1,2.5])
+    assert floatArray(array("d",[1.0])).dtype == numpy.float32
@@ -0,0 +1,91 @@
+from opengl.meshfile import _readObj
+from opengl.meshfile import _readPly
+import numpy
+import opengl.meshfile
+import pytest
+import struct
+
+
+def _ply(endian:str,faces:list) -> bytes:
+    ret = (
+        "ply\nformat binary_{}_endian 1.0\n"
+        "element vertex 5\nproperty float x\nproperty float y\nproperty float z\n"
+        "element face {}\nproperty list uchar int vertex_indices\nend_header\n"
+        ).format("little" if endian == "<" else "big",len(faces)).encode()
+    for i in range(5):
+        ret += struct.pack(endian+"3f",i,i*i,0)
+    for face in faces:
+        ret += struct.pack(f"{endian}B{len(face)}i",len(face),*face)
+    return ret
+
+
+def _triangles(data:bytes,reader = _readObj) -> tuple:
+    (vertices,stride,attributes,indices) = reader(data)
+    rows = numpy.frombuffer(vertices,numpy.float32).reshape(-1,stride//4)
+    return (rows[indices].reshape(-1,3,stride//4),attributes)
+
+
+def test_obj_mixed_polygons_are_fanned():
+    (triangles,attributes) = _triangles(
+        b"v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nv 2 0 0\nv 2 1 0\nv 3 0.5 0\n"
+        b"f 1 2 3 4\nf 2 5 3\nf 2 5 7 6 3\n"
+        )
+    assert list(attributes) == ["position"]
+    assert len(triangles) == 2+1+3
+    assert triangles[:,:,:3].tolist()[:3] == [
+        [[0,0,0],[1,0,0],[1,1,0]]
+        ,[[0,0,0],[1,1,0],[0,1,0]]
+        ,[[1,0,0],[2,0,0],[1,1,0]]
+        ]
+
+
+def test_obj_negative_indices_resolve_against_running_counts():
+    (triangles,attributes) = _triangles(
+        b"v 0 0 0\nv 1 0 0\nv 1 1 0\nvt 0 0\nvt 1 0\nvt 1 1\n"
+        b"f -3/-3 -2/-2 -1/-1\n"
+        b"v 2 0 0\nvt 0.5 0.5\n"
+        b"f -3/-1 -1/-1 -2/-2\n"
+        )
+    assert list(attributes) == ["position","texturePoint"]
+    assert triangles[:,:,:5].tolist() == [
+        [[0,0,0,0,0],[1,0,0,1,0],[1,1,0,1,1]]
+        ,[[1,0,0,0.5,0.5],[2,0,0,0.5,0.5],[1,1,0,1,1]]
+        ]
+
+
+def test_obj_corner_layout_is_detected_per_corner():
+    data = (
+        b"v 0 0 0\nv 1 0 0\nv 1 1 0\nvt 0 0\nvt 1 0\nvt 1 1\nvn 0 0 1\n"
+        b"f 1/1 2/2/1 3/3\n"
+        )
+    (triangles,attributes) = _triangles(data)
+    assert list(attributes) == ["position","texturePoint"]
+    assert triangles[:,:,:5].tolist() == [[[0,0,0,0,0],[1,0,0,1,0],[1,1,0,1,1]]]
+    (triangles,attributes) = _triangles(data+b"f 1 2//1 3/3/1\n")
+    assert list(attributes) == ["position"]
+    assert triangles.tolist() == [[[0,0,0],[1,0,0],[1,1,0]]]*2
+
+
+def test_obj_chunks_split_on_line_boundaries(monkeypatch):
+    data = b"".join(
+        b"v %d 0 0\r\nv %d 1 0\r\nv %d 0 1\r\nvt 0.5 %d\r\nf -3/1 -2/-1 -1/-1\r\n" % (i,i,i,i)
+        for i in range(50)
+        )
+    expected = _triangles(data)
+    monkeypatch.setattr(opengl.meshfile,"OBJ_CHUNK_SIZE",7)
+    (triangles,attributes) = _triangles(data)
+    assert attributes == expected[1]
+    numpy.testing.assert_array_equal(triangles,expected[0])
+    assert len(triangles) == 50
+    assert triangles[-1,:,:3].tolist() == [[49,0,0],[49,1,0],[49,0,1]]
+
+
+@pytest.mark.parametrize("endian",("<",">"))
+def test_ply_mixed_polygons_are_fanned(endian):
+    (triangles,attributes) = _triangles(_ply(endian,[(0,1,2,3),(1,4,2),(0,1,4,2,3)]),_readPly)
+    assert len(triangles) == 2+1+3
+    assert triangles[:,:,0].astype(int).tolist() == [
+        [0,1,2],[0,2,3],[1,4,2],[0,1,4],[0,4,2],[0,2,3]
+        ]
+    (triangles,attributes) = _triangles(_ply(endian,[(0,1,2),(2,3,4)]),_readPly)
+    assert triangles[:,:,0].astype(int).tolist() == [[0,1,2],[2,3,4]]
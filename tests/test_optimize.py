@@ -0,0 +1,93 @@
+from OpenGL.GL import GL_FLOAT
+from OpenGL.GL import GL_TRIANGLES
+from PySide6.QtGui import QMatrix4x4
+from opengl import LodChain
+from opengl.optimize import cacheStatistics
+from opengl.optimize import simplify
+from opengl.optimize import tipsify
+import numpy
+import pytest
+
+
+def _grid(size:int = 60) -> tuple:
+    (x,y) = numpy.meshgrid(numpy.linspace(0,1,size),numpy.linspace(0,1,size))
+    z = 0.1*numpy.sin(6*x)*numpy.cos(5*y)
+    vertices = numpy.stack((x,y,z),-1).reshape(-1,3).astype(numpy.float32)
+    i = numpy.arange(size*size).reshape(size,size)
+    (a,b,c,d) = (i[:-1,:-1],i[:-1,1:],i[1:,:-1],i[1:,1:])
+    faces = numpy.concatenate((
+        numpy.stack((a,b,d),-1).reshape(-1,3)
+        ,numpy.stack((a,d,c),-1).reshape(-1,3)
+        ))
+    return (vertices,faces.ravel().astype(numpy.uint32))
+
+
+@pytest.mark.parametrize(
+    "indices,cacheSize,expected"
+    ,[
+        ([0,0,0],1,(1.0,1.0))
+        ,([0,1,2,3,4,5,0,1,2],3,(3.0,1.5))
+        ,([0,1,2,3,4,5,0,1,2],6,(2.0,1.0))
+        ,([0,1,2,0,2,3,0,3,4,0,4,5],3,(7/4,7/6))
+        ]
+    )
+def test_cache_statistics_known_answers(indices,cacheSize,expected):
+    assert cacheStatistics(indices,cacheSize=cacheSize) == pytest.approx(expected)
+
+
+def test_tipsify_fan_known_answer():
+    fan = numpy.array([[0,i,i+1] for i in range(1,9)]).ravel()
+    (result,clusters) = tipsify(fan[::-1].copy())
+    assert cacheStatistics(result) == pytest.approx((10/8,1.0))
+    assert clusters.tolist() == [0]
+
+
+def test_tipsify_improves_shuffled_grid():
+    (vertices,indices) = _grid()
+    triangles = indices.reshape(-1,3)
+    shuffled = triangles[numpy.random.default_rng(1).permutation(len(triangles))].ravel()
+    (result,clusters) = tipsify(shuffled,len(vertices))
+    assert sorted(map(tuple,result.reshape(-1,3))) == sorted(map(tuple,triangles))
+    assert cacheStatistics(result)[0] < 0.7 < cacheStatistics(shuffled)[0]
+    assert clusters[0] == 0
+    assert (numpy.diff(clusters) > 0).all()
+
+
+@pytest.mark.parametrize("targetCount",[4000,1000,200,20])
+def test_simplify_reaches_target_on_curved_grid(targetCount):
+    (vertices,indices) = _grid()
+    (result,error) = simplify(vertices,3,indices,targetCount)
+    assert len(result)//3 <= targetCount
+    assert error >= 0
+    assert result.max() < len(vertices)
+
+
+def test_simplify_flat_grid_is_lossless():
+    (vertices,indices) = _grid()
+    vertices[:,2] = 0
+    (result,error) = simplify(vertices,3,indices,100)
+    assert len(result)//3 <= 100
+    assert error == pytest.approx(0,abs=1e-6)
+
+
+def test_simplify_respects_max_error():
+    (vertices,indices) = _grid()
+    (result,error) = simplify(vertices,3,indices,20,0.01)
+    assert error <= 0.01
+    assert len(result)//3 > 20
+
+
+def test_lod_chain_levels_halve_and_select_by_distance(context):
+    (vertices,indices) = _grid()
+    chain = LodChain.build(vertices,indices,GL_TRIANGLES,((0,3,GL_FLOAT,12,0),))
+    counts = chain.triangleCounts()
+    errors = chain.errors()
+    assert len(chain) == 4
+    assert counts[0] == len(indices)//3
+    assert (counts[1:] <= counts[:-1]//2).all()
+    assert (errors[1:] >= errors[:-1]).all()
+    projection = QMatrix4x4()
+    projection.perspective(45,1,0.1,1000)
+    levels = chain.select(((0,0,-0.5),(0,0,-1e6)),QMatrix4x4(),projection,1080)
+    assert levels[0] == 0
+    assert levels[1] == len(chain)-1
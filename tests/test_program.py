@@ -0,0 +1,69 @@
+from OpenGL.GL import GL_FRAGMENT_SHADER
+from OpenGL.GL import GL_VERTEX_SHADER
+from OpenGL.GL.KHR.parallel_shader_compile import GL_COMPLETION_STATUS_KHR
+from opengl import Program
+from opengl import Shader
+import opengl.program
+
+
+_vertexShaderSrc = """#version 450 core
+
+in vec3 position;
+
+void main()
+{
+    gl_Position = vec4(position,1.0);
+}
+"""
+
+_fragmentShaderSrc = """#version 450 core
+
+out vec4 color;
+
+void main()
+{
+    color = vec4(1.0);
+}
+"""
+
+
+def test_deferred_program_becomes_ready(context):
+    program = Program(
+        Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
+        ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        ,wait=False
+        )
+    while not program.isReady():
+        pass
+    assert program.future().result() is program
+    assert program.position >= 0
+
+
+def test_deferred_shader_becomes_ready(context):
+    shader = Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+    while not shader.isReady():
+        pass
+    assert shader.id()
+
+
+def test_shader_is_ready_polls_completion_status(monkeypatch):
+    statuses = iter((0,1))
+
+    def getShaderiv(id,name,params = None):
+        if name != GL_COMPLETION_STATUS_KHR:
+            return 1
+        if params is None:
+            raise KeyError(name)
+        params[0] = next(statuses)
+
+    monkeypatch.setattr(opengl.program,"_parallelCompile",True)
+    monkeypatch.setattr(opengl.program,"glCreateShader",lambda type: 1)
+    monkeypatch.setattr(opengl.program,"glShaderSource",lambda id,source: None)
+    monkeypatch.setattr(opengl.program,"glCompileShader",lambda id: None)
+    monkeypatch.setattr(opengl.program,"glDeleteShader",lambda id: None)
+    monkeypatch.setattr(opengl.program,"glGetShaderiv",getShaderiv)
+    shader = Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+    assert not shader.isReady()
+    assert shader.isReady()
+    assert shader.id() == 1
+    del shader
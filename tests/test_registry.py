@@ -0,0 +1,79 @@
+from OpenGL.GL import GL_FLOAT
+from OpenGL.GL import GL_FRAGMENT_SHADER
+from OpenGL.GL import GL_TRIANGLES
+from PySide6.QtGui import QOpenGLContext
+from concurrent.futures import Future
+from opengl import meshRegistry
+from opengl import ProgramRegistry
+from opengl import programRegistry
+from opengl.MeshRegistry import _releaseRegistry as _releaseMeshRegistry
+from opengl.ProgramRegistry import _releaseRegistry as _releaseProgramRegistry
+import pytest
+import sys
+
+_triangle = (
+    -0.5,-0.5,0
+    ,0.5,-0.5,0
+    ,0,0.5,0
+)
+
+_fragmentShaderSrc = """#version 450 core
+
+out vec4 color;
+
+void main()
+{
+    color = vec4(1.0);
+}
+"""
+
+
+def test_mesh_registry_is_scoped_to_context(context):
+    registry = meshRegistry()
+    assert meshRegistry() is registry
+    handle = registry.acquire(_triangle,GL_TRIANGLES,((0,3,GL_FLOAT,12,0),))
+    _releaseMeshRegistry(QOpenGLContext.currentContext())
+    assert len(registry) == 0
+    assert registry.residentBytes() == 0
+    with pytest.raises(RuntimeError):
+        handle.key()
+    assert meshRegistry() is not registry
+
+
+def test_program_registry_is_scoped_to_context(context):
+    registry = programRegistry()
+    assert programRegistry() is registry
+    handle = registry.acquire((_fragmentShaderSrc,GL_FRAGMENT_SHADER))
+    _releaseProgramRegistry(QOpenGLContext.currentContext())
+    assert len(registry) == 0
+    assert registry.shaderCount() == 0
+    with pytest.raises(RuntimeError):
+        handle.program()
+    assert programRegistry() is not registry
+
+
+class _DeferredProgram:
+
+    def __init__(self,*shaders,wait:bool = True):
+        self.__future = Future()
+
+    def future(self) -> Future:
+        return self.__future
+
+
+def test_program_registry_evicts_failed_deferred_links(monkeypatch):
+    monkeypatch.setattr(sys.modules["opengl.ProgramRegistry"],"Program",_DeferredProgram)
+    registry = ProgramRegistry()
+    failed = registry.acquire((_fragmentShaderSrc,GL_FRAGMENT_SHADER),wait=False)
+    failed.future().set_exception(RuntimeError())
+    assert len(registry) == 0
+    assert registry.shaderCount() == 0
+    handle = registry.acquire((_fragmentShaderSrc,GL_FRAGMENT_SHADER),wait=False)
+    assert handle.program() is not failed.program()
+    assert registry.missCount() == 2
+    failed.release()
+    assert len(registry) == 1
+    assert registry.unusedCount() == 0
+    handle.future().set_result(handle.program())
+    handle.release()
+    assert registry.unusedCount() == 1
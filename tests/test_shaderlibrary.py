@@ -0,0 +1,13 @@
+from opengl.ShaderLibrary import DEFAULT_DIRECTORY
+from opengl.ShaderLibrary import setShaderLibrary
+from opengl.ShaderLibrary import shaderLibrary
+
+
+def test_default_library_resolves_repo_shaders():
+    setShaderLibrary(None)
+    library = shaderLibrary()
+    assert library.directories() == [DEFAULT_DIRECTORY]
+    (path,text) = library.file("pointLight.glsl")
+    assert path == (DEFAULT_DIRECTORY/"pointLight.glsl").resolve()
+    source = library.preprocess('#version 450\n#include "pointLight.glsl"\n')
+    assert text.splitlines()[0] in source
@@ -8,8 +8,7 @@ from OpenGL.GL import GL_TRIANGLES
 from OpenGL.GL import GL_VERTEX_SHADER
 from OpenGL.GL import glClear
 from OpenGL.GL import glViewport
-from opengl import Program
-from opengl import Shader
+from opengl import programRegistry
 from opengl import Texture2DArray
 from opengl import VertexArray
 import base
@@ -42,9 +41,9 @@ class Renderer(base.Renderer):
         del self.__program
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = programRegistry().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
 
     def __initTexture(self):
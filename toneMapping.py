@@ -21,10 +21,9 @@ from ctypes import Structure as cStructure
 from ctypes import c_char
 from ctypes import c_float
 from opengl import Buffer
-from opengl import Program
-from opengl import Shader
+from opengl import meshRegistry
+from opengl import shaderLibrary
 from opengl import Texture2D
-from opengl import VertexArray
 import base
 
 
@@ -174,9 +173,10 @@ class Renderer(base.Renderer):
             program.ubo.lightBlock.setBlockBinding(0)
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = shaderLibrary().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+            ,defines={"LIGHT_SIZE":len(self.__lights)}
             )
 
     def __initTexture(self):
@@ -195,47 +195,9 @@ class Renderer(base.Renderer):
             self.__projectionUniform = program.uniform.projection
 
     def __initVertices(self):
-        vertices = (
-            -0.5,-0.5,-0.5,0,0,0,0,-1
-            ,0.5,-0.5,-0.5,1,0,0,0,-1
-            ,0.5,0.5,-0.5,1,1,0,0,-1
-            ,0.5,0.5,-0.5,1,1,0,0,-1
-            ,-0.5,0.5,-0.5,0,1,0,0,-1
-            ,-0.5,-0.5,-0.5,0,0,0,0,-1
-            ,-0.5,-0.5,0.5,0,0,0,0,1
-            ,0.5,-0.5,0.5,1,0,0,0,1
-            ,0.5,0.5,0.5,1,1,0,0,1
-            ,0.5,0.5,0.5,1,1,0,0,1
-            ,-0.5,0.5,0.5,0,1,0,0,1
-            ,-0.5,-0.5,0.5,0,0,0,0,1
-            ,-0.5,0.5,0.5,1,0,-1,0,0
-            ,-0.5,0.5,-0.5,1,1,-1,0,0
-            ,-0.5,-0.5,-0.5,0,1,-1,0,0
-            ,-0.5,-0.5,-0.5,0,1,-1,0,0
-            ,-0.5,-0.5,0.5,0,0,-1,0,0
-            ,-0.5,0.5,0.5,1,0,-1,0,0
-            ,0.5,0.5,0.5,1,0,1,0,0
-            ,0.5,0.5,-0.5,1,1,1,0,0
-            ,0.5,-0.5,-0.5,0,1,1,0,0
-            ,0.5,-0.5,-0.5,0,1,1,0,0
-            ,0.5,-0.5,0.5,0,0,1,0,0
-            ,0.5,0.5,0.5,1,0,1,0,0
-            ,-0.5,-0.5,-0.5,0,1,0,-1,0
-            ,0.5,-0.5,-0.5,1,1,0,-1,0
-            ,0.5,-0.5,0.5,1,0,0,-1,0
-            ,0.5,-0.5,0.5,1,0,0,-1,0
-            ,-0.5,-0.5,0.5,0,0,0,-1,0
-            ,-0.5,-0.5,-0.5,0,1,0,-1,0
-            ,-0.5,0.5,-0.5,0,1,0,1,0
-            ,0.5,0.5,-0.5,1,1,0,1,0
-            ,0.5,0.5,0.5,1,0,0,1,0
-            ,0.5,0.5,0.5,1,0,0,1,0
-            ,-0.5,0.5,0.5,0,0,0,1,0
-            ,-0.5,0.5,-0.5,0,1,0,1,0
-        )
         with self.__program as program:
-            self.__vao = VertexArray.fromFloats(
-                vertices
+            self.__vao = meshRegistry().acquire(
+                base.CUBE_VERTICES
                 ,GL_TRIANGLES
                 ,(
                     (program.position,3,GL_FLOAT,32,0)
@@ -269,14 +231,8 @@ void main()
 """
 
 _fragmentShaderSrc = """#version 430 core
-#define LIGHT_SIZE 3
 
-struct Light
-{
-    vec3 position;
-    vec3 color;
-    float power;
-};
+#include "pointLight.glsl"
 
 in vec2 fTexturePoint;
 in vec3 fPosition;
@@ -291,19 +247,6 @@ layout (std140) uniform lightBlock
 
 out vec4 color;
 
-vec3 calcPointLight(Light light,vec3 fPos,vec3 fNorm,vec3 textureColor)
-{
-    vec3 ret = vec3(0.0);
-    vec3 ftl = light.position-fPos;
-    float d = length(ftl);
-    ftl = normalize(ftl);
-    vec3 ftc = normalize(cameraPosition-fPos);
-    vec3 hw = normalize(ftl+ftc);
-    ret += textureColor*light.color*light.power*max(0.0,dot(fNorm,ftl))/pow(d,2);
-    ret += light.color*light.power*pow(max(0.0,dot(fNorm,hw)),32)/pow(d,2);
-    return ret;
-}
-
 void main()
 {
     const float gamma = 2.2;
@@ -311,7 +254,7 @@ void main()
     vec3 hdr = 0.2*tColor;
     for (int i = 0;i < LIGHT_SIZE;i++)
     {
-        hdr += calcPointLight(lights[i],fPosition,fNormal,tColor);
+        hdr += calcPointLight(lights[i],cameraPosition,fPosition,fNormal,tColor);
     }
     vec3 mapped = hdr/(hdr+vec3(1));
     mapped = pow(mapped,vec3(1/gamma));
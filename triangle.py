@@ -5,9 +5,8 @@ from OpenGL.GL import GL_TRIANGLES
 from OpenGL.GL import GL_VERTEX_SHADER
 from OpenGL.GL import glClear
 from OpenGL.GL import glViewport
+from opengl import programRegistry
 from opengl import VertexArray
-from opengl import Program
-from opengl import Shader
 import base
 
 
@@ -35,9 +34,9 @@ class Renderer(base.Renderer):
         glClear(GL_DEPTH_BUFFER_BIT)
 
     def __initProgram(self):
-        self.__program = Program(
-            Shader(_vertexShaderSrc,GL_VERTEX_SHADER)
-            ,Shader(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
+        self.__program = programRegistry().acquire(
+            (_vertexShaderSrc,GL_VERTEX_SHADER)
+            ,(_fragmentShaderSrc,GL_FRAGMENT_SHADER)
             )
 
     def __initVertices(self):